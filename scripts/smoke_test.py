@@ -1,9 +1,9 @@
 """
 scripts/smoke_test.py
 ======================
-Run a handful of example queries through the full agent workflow and print
-the results.  No TruLens required — useful for quick sanity checks after
-prompt or tool changes.
+Run a handful of example queries concurrently through the full agent
+workflow and print the results in input order.  No TruLens required —
+useful for quick sanity checks after prompt or tool changes.
 
 Usage::
 
@@ -12,6 +12,7 @@ Usage::
 
 from __future__ import annotations
 
+import asyncio
 import sys
 import uuid
 from pathlib import Path
@@ -29,16 +30,19 @@ EXAMPLES = [
 ]
 
 
-def main() -> None:
+async def main() -> None:
     print("Initialising agent...\n")
     agent = build_agent()
 
-    for i, query in enumerate(EXAMPLES, start=1):
-        thread_id = str(uuid.uuid4())
+    # The examples are independent, so run them concurrently (one thread each)
+    results = await asyncio.gather(
+        *(agent.ainvoke(query, thread_id=str(uuid.uuid4())) for query in EXAMPLES)
+    )
+
+    for i, (query, result) in enumerate(zip(EXAMPLES, results), start=1):
         print(f"{'=' * 60}")
         print(f"[{i}/{len(EXAMPLES)}] {query}")
         print("-" * 60)
-        result = agent.invoke(query, thread_id=thread_id)
         answer = result.get("final_answer") or "(no answer)"
         revisions = result.get("revision_count", 0)
         blocked = result.get("blocked", False)
@@ -48,4 +52,4 @@ def main() -> None:
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -0,0 +1,46 @@
+"""
+agents/context.py
+=================
+Per-graph context shared by every node.
+
+Everything here is fixed for the lifetime of a compiled graph: the dataset,
+its tools, the LLM service, and values derived from them.  ``build_graph``
+creates a single ``GraphContext`` and binds it to each node with
+``functools.partial``, so none of it is copied into — or checkpointed
+with — the graph state.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from src.services.llm.service import LLMService
+
+
+@dataclass(frozen=True, kw_only=True)
+class GraphContext:
+    llm: LLMService
+    """The shared ``LLMService`` for all LLM calls."""
+
+    df: pd.DataFrame | None = None
+    """The normalised portfolio DataFrame."""
+
+    tools_by_name: dict[str, Any] = field(default_factory=dict)
+    """Tool name → BaseTool mapping."""
+
+    tools_list: list[Any] = field(default_factory=list)
+    """The same tools as ``tools_by_name``, in creation order."""
+
+    model_with_tools: Any = None
+    """Chat model with every tool bound; bound on demand when ``None``."""
+
+    known_properties: list[str] | None = None
+    """Sorted property names (overhead excluded); derived from ``df`` when ``None``."""
+
+    known_properties_re: re.Pattern[str] | None = None
+    """Compiled regex matching any known property name."""
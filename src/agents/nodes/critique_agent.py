@@ -9,27 +9,31 @@ clarity, format) for a weighted total out of 100. Approves drafts that reach
 CRITIQUE_SCORE_THRESHOLD; rejects others and loops back to the research agent.
 
 At the revision cap, the draft with the highest weighted_total across all
-revision cycles is accepted.
+revision cycles is accepted.  A revision that reproduces an already-rejected
+draft verbatim reuses that draft's verdict instead of re-scoring it.
 """
 
 from __future__ import annotations
 
+from itertools import chain
+from operator import itemgetter
 from typing import Any
 
 from loguru import logger
 
+from src.agents.context import GraphContext
 from src.agents.state import AgentState
-from src.services.llm.service import LLMService
 from src.core.config import settings
+from src.services.llm.service import CritiqueResult
 
 
-def critique_agent_node(state: AgentState) -> dict[str, Any]:
+async def critique_agent_node(state: AgentState, *, ctx: GraphContext) -> dict[str, Any]:
     """
     Node 3 — Critique Agent.
 
     Reads ``draft_answer`` and ``tool_log`` from state and returns either:
     - ``{"critique": None}`` (draft approved — propagates to output guard), or
-    - ``{"critique": "<feedback>", "revision_count": n, "draft_history": [...]}``
+    - ``{"critique": "<feedback>", "revision_count": n, "draft_history": [entry]}``
       for a research retry, or
     - ``{"draft_answer": "<best>", "critique": None}`` when the revision cap
       is reached (best draft selected by weighted_total).
@@ -38,9 +42,8 @@ def critique_agent_node(state: AgentState) -> dict[str, Any]:
     draft_answer: str = state.get("draft_answer", "")
     tool_log: list[dict] = state.get("tool_log", [])
     revision_count: int = state.get("revision_count", 0)
-    draft_history: list[dict[str, Any]] = list(state.get("draft_history", []))
-    llm: LLMService = state["_llm"]
-    steps: list[dict[str, Any]] = list(state.get("steps", []))
+    draft_history: list[dict[str, Any]] = state.get("draft_history", [])
+    steps: list[dict[str, Any]] = []  # new entries only — the reducer appends them
 
     if not draft_answer:
         logger.warning("Critique agent: no draft answer to review — passing through")
@@ -51,7 +54,18 @@ def critique_agent_node(state: AgentState) -> dict[str, Any]:
         })
         return {"critique": None, "steps": steps}
 
-    result = llm.critique_response(query, tool_log, draft_answer)
+    # An unchanged draft would be scored the same again — reuse its verdict
+    previous = next((e for e in draft_history if e["draft"] == draft_answer), None)
+    if previous is not None:
+        logger.info("CritiqueAgent: Draft unchanged since last rejection — reusing its verdict")
+        result = CritiqueResult(
+            scores=previous["scores"],
+            weighted_total=previous["weighted_total"],
+            issues=previous.get("issues", []),
+            revised_answer=None,
+        )
+    else:
+        result = await ctx.llm.acritique_response(query, tool_log, draft_answer)
 
     if result.approved:
         logger.info(
@@ -95,16 +109,18 @@ def critique_agent_node(state: AgentState) -> dict[str, Any]:
         settings.MAX_REVISIONS,
     )
 
-    # Append current draft to history before deciding what to do
-    draft_history.append({
+    # Record the current draft before deciding what to do; only the new entry
+    # is returned — the state reducer appends it to the stored history.
+    history_entry = {
         "draft": draft_answer,
         "weighted_total": result.weighted_total,
         "scores": result.scores,
-    })
+        "issues": result.issues,
+    }
 
     if new_revision_count >= settings.MAX_REVISIONS:
         # Select the draft with the highest weighted_total from all revisions
-        best = max(draft_history, key=lambda entry: entry["weighted_total"])
+        best = max(chain(draft_history, (history_entry,)), key=itemgetter("weighted_total"))
         logger.warning(
             "CritiqueAgent: Revision cap ({}) reached — selecting best draft "
             "(weighted_total={})",
@@ -124,7 +140,7 @@ def critique_agent_node(state: AgentState) -> dict[str, Any]:
             "draft_answer": best["draft"],
             "critique": None,
             "revision_count": new_revision_count,
-            "draft_history": draft_history,
+            "draft_history": [history_entry],
             "steps": steps,
         }
 
@@ -136,14 +152,16 @@ def critique_agent_node(state: AgentState) -> dict[str, Any]:
         f"format: {result.scores.get('format', 0)}/10 "
         f"(weighted total: {result.weighted_total}/100)"
     )
-    critique_text = (
-        f"The previous answer scored {result.weighted_total}/100 and was rejected.\n"
-        f"{score_summary}\n\n"
-        "Issues:\n"
-        + "\n".join(f"- {issue}" for issue in result.issues)
-    )
+    parts = [
+        f"The previous answer scored {result.weighted_total}/100 and was rejected.",
+        score_summary,
+        "",
+        "Issues:",
+    ]
+    parts.extend(f"- {issue}" for issue in result.issues)
     if result.revised_answer:
-        critique_text += f"\n\nSuggested correction: {result.revised_answer}"
+        parts.extend(["", f"Suggested correction: {result.revised_answer}"])
+    critique_text = "\n".join(parts)
 
     steps.append({
         "node": "CritiqueAgent",
@@ -159,6 +177,6 @@ def critique_agent_node(state: AgentState) -> dict[str, Any]:
     return {
         "critique": critique_text,
         "revision_count": new_revision_count,
-        "draft_history": draft_history,
+        "draft_history": [history_entry],
         "steps": steps,
     }
@@ -0,0 +1,74 @@
+"""
+agents/nodes/critique_prefetch.py
+==================================
+Node 3 (speculative) — Critique Agent + Output Guard prefetch.
+
+Wraps :func:`critique_agent_node` and, while its LLM review is in flight,
+speculatively runs the output guard's LLM check on the same draft.  Both
+only read the draft, so when the critique approves it unchanged (the common
+case) the two round-trips overlap into one; when the critique rejects or
+replaces the draft, the prefetched verdict is cancelled or discarded.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from loguru import logger
+
+from src.agents.context import GraphContext
+from src.agents.nodes.critique_agent import critique_agent_node
+from src.agents.nodes.output_guard import fast_path, known_properties_for
+from src.agents.state import AgentState
+
+
+async def critique_plus_output_check_node(state: AgentState, *, ctx: GraphContext) -> dict[str, Any]:
+    """
+    Node 3 — Critique Agent with a speculative output-guard check.
+
+    Returns the critique agent's update unchanged, plus
+    ``_prefetched_output_check`` holding ``{"draft", "valid",
+    "corrected_answer"}`` when the draft was approved as-is and the check
+    succeeded (``None`` otherwise).  Plain values only — the state is
+    checkpointed.
+    """
+    query: str = state.get("query", "")
+    draft: str = state.get("draft_answer", "")
+
+    # Nothing worth prefetching — the output guard needs no LLM call here
+    if not draft or fast_path(draft, ctx):
+        update = await critique_agent_node(state, ctx=ctx)
+        return {**update, "_prefetched_output_check": None}
+
+    critique_task = asyncio.create_task(critique_agent_node(state, ctx=ctx))
+    check_task = asyncio.create_task(
+        ctx.llm.acheck_output(query, known_properties_for(ctx), draft)
+    )
+
+    try:
+        update = await critique_task
+    except BaseException:
+        check_task.cancel()
+        raise
+
+    if update.get("critique") is not None or update.get("draft_answer", draft) != draft:
+        check_task.cancel()
+        logger.debug("CritiquePrefetch: Draft not shipped as-is — discarding speculative output check")
+        return {**update, "_prefetched_output_check": None}
+
+    try:
+        result = await check_task
+    except Exception as exc:
+        # The output guard simply makes the call itself
+        logger.warning("CritiquePrefetch: Speculative output check failed — {}", exc)
+        return {**update, "_prefetched_output_check": None}
+
+    return {
+        **update,
+        "_prefetched_output_check": {
+            "draft": draft,
+            "valid": result.valid,
+            "corrected_answer": result.corrected_answer,
+        },
+    }
@@ -0,0 +1,65 @@
+"""
+agents/nodes/guard_prefetch.py
+================================
+Node 1 (speculative) — Input Guard + Research prefetch.
+
+Wraps :func:`input_guard_node` and, while its LLM check is in flight,
+speculatively sends the research agent's first request to the tool-bound
+model.  For valid queries (the common case) the guard round-trip and the
+first research round-trip overlap into a single wall-clock RTT; when the
+guard blocks the query, the prefetch is cancelled and discarded.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from loguru import logger
+
+from src.agents.context import GraphContext
+from src.agents.nodes.input_guard import fast_fail, input_guard_node
+from src.agents.nodes.research_agent import build_turn_messages, get_research_model
+from src.agents.state import AgentState
+
+
+async def guard_plus_prefetch_node(state: AgentState, *, ctx: GraphContext) -> dict[str, Any]:
+    """
+    Node 1 — Input Guard with a speculative research prefetch.
+
+    Returns the input guard's update unchanged, plus ``_prefetched_response``
+    holding the model's first research response when the query was allowed
+    and the prefetch succeeded (``None`` otherwise).
+    """
+    query: str = state.get("query", "").strip()
+
+    # Nothing worth prefetching — the guard fast-fails without an LLM call
+    blocked = fast_fail(query)
+    if blocked is not None:
+        return {**blocked, "_prefetched_response": None}
+
+    model_with_tools = get_research_model(ctx)
+    messages, _ = build_turn_messages(state)
+
+    guard_task = asyncio.create_task(input_guard_node(state, ctx=ctx))
+    prefetch_task = asyncio.create_task(model_with_tools.ainvoke(messages))
+
+    try:
+        guard_update = await guard_task
+    except BaseException:
+        prefetch_task.cancel()
+        raise
+
+    if guard_update.get("blocked"):
+        prefetch_task.cancel()
+        logger.debug("GuardPrefetch: Query blocked — discarding speculative research call")
+        return {**guard_update, "_prefetched_response": None}
+
+    try:
+        prefetched = await prefetch_task
+    except Exception as exc:
+        # The research agent simply makes the call itself
+        logger.warning("GuardPrefetch: Speculative research call failed — {}", exc)
+        prefetched = None
+
+    return {**guard_update, "_prefetched_response": prefetched}
@@ -5,21 +5,88 @@ Node 1 — Input Guard.
 
 An LLM-powered gatekeeper that validates every incoming query before it
 reaches the research agent.  Performs a cheap fast-fail for mechanical
-errors (empty / overlong queries) and then delegates topic-relevance and
-injection-detection to the LLM.
+errors (empty / overlong queries) and blatant injection markers, then
+delegates topic-relevance and subtler injection-detection to the LLM.
 """
 
 from __future__ import annotations
 
+import re
 from typing import Any
 
 from loguru import logger
 
+from src.agents.context import GraphContext
 from src.agents.state import AgentState
-from src.services.llm.service import LLMService
 
+_MAX_QUERY_LENGTH = 2000  # characters; longer inputs are rejected outright
 
-def input_guard_node(state: AgentState) -> dict[str, Any]:
+# Markers that cannot occur in a genuine portfolio question.  Phrasing that
+# can ("ignore the previous quarter", "HVAC system:") is left to the LLM
+_INJECTION_RE = re.compile(
+    r"\bignore\s+(?:all\s+)?(?:the\s+|your\s+|any\s+)?(?:previous|prior|above)\s+"
+    r"(?:instructions|prompts?)\b"
+    r"|\bdisregard\s+(?:all\s+)?(?:the\s+|your\s+)?(?:previous\s+|prior\s+)?instructions\b"
+    r"|<\|im_(?:start|end)\|>"
+    r"|javascript:",
+    re.IGNORECASE,
+)
+
+_OFF_TOPIC_ANSWER = (
+    "I can only help with real-estate asset management questions. "
+    "Please ask something related to your portfolio, properties, "
+    "financials, or asset performance."
+)
+
+
+def _blocked(reason: str, message: str, final_answer: str, data: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "blocked": True,
+        "block_reason": reason,
+        "final_answer": final_answer,
+        "steps": [{"node": "InputGuard", "type": "warning", "message": message, "data": data}],
+    }
+
+
+def fast_fail(query: str) -> dict[str, Any] | None:
+    """
+    Run the mechanical checks that need no LLM call.
+
+    Returns the blocking state update for empty, overlong, or obviously
+    injected queries, or ``None`` when the query should go to the LLM check.
+    """
+    if not query:
+        logger.warning("InputGuard: Rejecting empty query before LLM check")
+        return _blocked(
+            "empty_query",
+            "Rejecting empty query",
+            "Your message appears to be empty. "
+            "Please enter a question about your real-estate portfolio.",
+            {"reason": "empty_query"},
+        )
+
+    if len(query) > _MAX_QUERY_LENGTH:
+        logger.warning("InputGuard: Rejecting overlong query ({} chars) before LLM check", len(query))
+        return _blocked(
+            "query_too_long",
+            "Rejecting overlong query",
+            f"Your message is too long. Please keep questions under {_MAX_QUERY_LENGTH} characters.",
+            {"reason": "query_too_long", "length": len(query)},
+        )
+
+    if _INJECTION_RE.search(query):
+        logger.warning("InputGuard: Injection pattern matched | query={!r}", query[:100])
+        return _blocked(
+            "injection_suspected",
+            "Query blocked by injection filter",
+            _OFF_TOPIC_ANSWER,
+            {"reason": "injection_suspected", "query_snippet": query[:100]},
+        )
+
+    return None
+
+
+async def input_guard_node(state: AgentState, *, ctx: GraphContext) -> dict[str, Any]:
     """
     Node 1 — Input Guard.
 
@@ -28,34 +95,19 @@ def input_guard_node(state: AgentState) -> dict[str, Any]:
     returns ``blocked=False`` and the graph continues to the research agent.
     """
     query: str = state.get("query", "").strip()
-    llm: LLMService = state["_llm"]
-    steps: list[dict[str, Any]] = list(state.get("steps", []))
+    steps: list[dict[str, Any]] = []  # new entries only — the reducer appends them
 
     # ------------------------------------------------------------------
     # Fast-fail: mechanical checks (no LLM call)
     # ------------------------------------------------------------------
-    if not query:
-        logger.warning("InputGuard: Rejecting empty query before LLM check")
-        steps.append({
-            "node": "InputGuard",
-            "type": "warning",
-            "message": "Rejecting empty query",
-            "data": {"reason": "empty_query"}
-        })
-        return {
-            "blocked": True,
-            "block_reason": "empty_query",
-            "final_answer": (
-                "Your message appears to be empty. "
-                "Please enter a question about your real-estate portfolio."
-            ),
-            "steps": steps,
-        }
+    blocked = fast_fail(query)
+    if blocked is not None:
+        return blocked
 
     # ------------------------------------------------------------------
     # LLM check: topic relevance + injection detection
     # ------------------------------------------------------------------
-    result = llm.check_input(query)
+    result = await ctx.llm.acheck_input(query)
 
     if not result.allowed:
         logger.warning(
@@ -63,22 +115,12 @@ def input_guard_node(state: AgentState) -> dict[str, Any]:
             result.reason,
             query[:100] + ("..." if len(query) > 100 else "")
         )
-        steps.append({
-            "node": "InputGuard",
-            "type": "warning",
-            "message": "Query blocked by LLM",
-            "data": {"reason": result.reason, "query_snippet": query[:100]}
-        })
-        return {
-            "blocked": True,
-            "block_reason": result.reason,
-            "final_answer": (
-                "I can only help with real-estate asset management questions. "
-                "Please ask something related to your portfolio, properties, "
-                "financials, or asset performance."
-            ),
-            "steps": steps,
-        }
+        return _blocked(
+            result.reason,
+            "Query blocked by LLM",
+            _OFF_TOPIC_ANSWER,
+            {"reason": result.reason, "query_snippet": query[:100]},
+        )
 
     logger.debug("InputGuard: Query passed safety checks")
     steps.append({
@@ -6,17 +6,26 @@ Node 4 — Output Guard.
 An LLM-powered final validator that checks the approved draft answer for
 hallucinated property names, format violations, and completeness before it
 is committed to ``final_answer`` and returned to the user.
+
+Short drafts that mention no known property name cannot contain a
+hallucinated property, so (when ``OUTPUT_GUARD_FAST_PATH`` is on) they are
+promoted without the LLM round-trip.
 """
 
 from __future__ import annotations
 
+import re
 from typing import Any
 
 from loguru import logger
 
+from src.agents.context import GraphContext
 from src.agents.state import AgentState
 from src.agents.tools.pandas_tools import list_properties
-from src.services.llm.service import LLMService
+from src.core.config import settings
+from src.services.llm.service import OutputGuardResult
+
+_FAST_PATH_MAX_CHARS = 400  # longer drafts always get the full LLM review
 
 _FALLBACK = (
     "I was unable to generate a reliable answer for your question. "
@@ -24,35 +33,79 @@ _FALLBACK = (
 )
 
 
-def output_guard_node(state: AgentState) -> dict[str, Any]:
+def compile_property_pattern(known_properties: list[str]) -> re.Pattern[str] | None:
+    """
+    Compile a case-insensitive alternation matching any known property name.
+
+    Longest names come first so overlapping names match in full.  Returns
+    ``None`` when there are no properties (the fast path is then disabled).
+    """
+    if not known_properties:
+        return None
+    return re.compile(
+        "|".join(re.escape(p) for p in sorted(known_properties, key=len, reverse=True)),
+        re.IGNORECASE,
+    )
+
+
+def known_properties_for(ctx: GraphContext) -> list[str]:
+    """
+    Known property names for the hallucination check — precomputed once per
+    graph by build_graph; only scan the DataFrame when run standalone.
+    """
+    if ctx.known_properties is not None:
+        return ctx.known_properties
+    try:
+        return list_properties(ctx.df)["properties"]
+    except Exception as exc:
+        logger.warning(f"OutputGuard: Failed to load property list for validation: {exc}")
+        return []
+
+
+def fast_path(draft: str, ctx: GraphContext) -> bool:
+    """Return ``True`` when *draft* can be promoted without the LLM check."""
+    property_re: re.Pattern[str] | None = ctx.known_properties_re
+    return (
+        settings.OUTPUT_GUARD_FAST_PATH
+        and property_re is not None
+        and len(draft) < _FAST_PATH_MAX_CHARS
+        and not property_re.search(draft)
+    )
+
+
+async def output_guard_node(state: AgentState, *, ctx: GraphContext) -> dict[str, Any]:
     """
     Node 4 — Output Guard.
 
     Validates the draft answer, applies the LLM's corrections if needed,
-    and promotes the result to ``final_answer``.
+    and promotes the result to ``final_answer``.  A check already made for
+    this exact draft alongside the critique (``_prefetched_output_check``)
+    is used instead of a new LLM call.
     """
     query: str = state.get("query", "")
     draft: str = state.get("draft_answer", "")
-    llm: LLMService = state["_llm"]
-    df = state["_df"]
+    prefetched: dict[str, Any] | None = state.get("_prefetched_output_check")
 
     if not draft:
         logger.warning("OutputGuard: No draft answer provided to guard — returning fallback")
-        return {"final_answer": _FALLBACK}
+        return {"final_answer": _FALLBACK, "_prefetched_output_check": None}
 
-    # Get known property names for hallucination check
-    try:
-        known_properties: list[str] = list_properties(df)["properties"]
-    except Exception as exc:
-        logger.warning(f"OutputGuard: Failed to load property list for validation: {exc}")
-        known_properties = []
+    if fast_path(draft, ctx):
+        logger.info("OutputGuard: No property mentioned in short draft — skipping LLM validation")
+        return {"final_answer": draft, "_prefetched_output_check": None}
 
-    result = llm.check_output(query, known_properties, draft)
+    if prefetched is not None and prefetched["draft"] == draft:
+        logger.debug("OutputGuard: Using the check made alongside the critique")
+        result = OutputGuardResult(
+            valid=prefetched["valid"], corrected_answer=prefetched["corrected_answer"]
+        )
+    else:
+        result = await ctx.llm.acheck_output(query, known_properties_for(ctx), draft)
 
     if result.valid:
         logger.info("OutputGuard: Draft answer validated — no corrections needed")
-        return {"final_answer": draft}
+        return {"final_answer": draft, "_prefetched_output_check": None}
 
     corrected = result.corrected_answer or draft
     logger.warning("OutputGuard: Draft answer failed validation | applying LLM correction")
-    return {"final_answer": corrected}
+    return {"final_answer": corrected, "_prefetched_output_check": None}
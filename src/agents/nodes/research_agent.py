@@ -19,49 +19,58 @@ the ``tool_log`` structure.
 
 from __future__ import annotations
 
+import asyncio
+from functools import partial
 from typing import Any
 
+import orjson
 from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, ToolMessage
 from loguru import logger
 
+from src.agents.context import GraphContext
 from src.agents.prompts.loader import load_prompt
 from src.agents.state import AgentState
+from src.agents.tools import TOOL_EXECUTOR
 from src.services.llm.service import LLMService
 
 _MAX_TOOL_ITERATIONS = 10  # hard cap to prevent infinite loops
 
 
-def research_agent_node(state: AgentState) -> dict[str, Any]:
+def bind_research_model(llm: LLMService, tools_list: list[Any]) -> Any:
+    """Return the chat model bound to every portfolio tool, with retries."""
+    return llm.chat_model.bind_tools(tools_list).with_retry(
+        stop_after_attempt=4,
+        wait_exponential_jitter=True,
+    )
+
+
+def get_research_model(ctx: GraphContext) -> Any:
     """
-    Node 2 — Research Agent.
+    Return the tool-bound model for this graph.
 
-    Runs a ReAct loop:
-    1. Send system prompt + query (+ prior critique if this is a revision) to
-       the LLM model with all tools bound.
-    2. If the model calls tools, execute them and loop.
-    3. When the model stops calling tools, extract the text as ``draft_answer``.
+    ``build_graph`` binds the tools once and stores the result on the
+    context; binding here is only a fallback for callers that run the node
+    outside the compiled graph.
+    """
+    model_with_tools = ctx.model_with_tools
+    if model_with_tools is None:
+        tools_list = ctx.tools_list or list(ctx.tools_by_name.values())
+        model_with_tools = bind_research_model(ctx.llm, tools_list)
+    return model_with_tools
+
+
+def build_turn_messages(state: AgentState) -> tuple[list[Any], list[Any]]:
+    """
+    Build the message list sent to the model on the first ReAct iteration.
+
+    The system prompt is prepended at call time and never stored in state.
+    Returns ``(messages, new_messages)``: the full list to send to the model,
+    and the messages added this turn (starting with the user message) that
+    the node hands to the ``add_messages`` reducer.
     """
     query: str = state.get("query", "")
     critique: str | None = state.get("critique")
-    tools_by_name: dict[str, Any] = state["_tools"]
-    llm: LLMService = state["_llm"]
 
-    tools_list = list(tools_by_name.values())
-    model_with_tools = llm.chat_model.bind_tools(tools_list).with_retry(
-        stop_after_attempt=4,
-        wait_exponential_jitter=True,
-    )
-
-    system_prompt = load_prompt("research_agent")
-    
-    # Initialize from history
-    initial_messages: list[Any] = list(state.get("messages", []))
-    messages: list[Any] = list(initial_messages)
-    
-    # Ensure system message is at the start
-    if not messages or not isinstance(messages[0], SystemMessage):
-        messages.insert(0, SystemMessage(content=system_prompt))
-    
     # Add user query if it's the start of the turn (revision_count == 0)
     user_content = query
     if critique:
@@ -69,67 +78,156 @@ def research_agent_node(state: AgentState) -> dict[str, Any]:
             f"{query}\n\n"
             f"[Previous answer was rejected. Critique feedback:]\n{critique}"
         )
+    human = HumanMessage(content=user_content)
+
+    messages: list[Any] = [
+        SystemMessage(content=load_prompt("research_agent")),
+        *state.get("messages", []),
+        human,
+    ]
+    return messages, [human]
+
+
+def _tool_cache_key(tool_name: str, tool_args: dict[str, Any]) -> tuple[str, bytes] | None:
+    """Return a hashable key for a tool call, or ``None`` if its args can't be serialised."""
+    try:
+        return tool_name, orjson.dumps(tool_args, option=orjson.OPT_SORT_KEYS)
+    except TypeError:
+        return None
+
+
+def _seed_tool_cache(tool_log: list[dict[str, Any]]) -> dict[tuple[str, bytes], Any]:
+    """
+    Build the tool-result memo from a previous ``tool_log``.
+
+    The tools are pure functions of their arguments (the DataFrame never
+    changes), so results logged by an earlier revision can be reused when
+    the model repeats a call.  Failed calls are not reused.
+    """
+    memo: dict[tuple[str, bytes], Any] = {}
+    for entry in tool_log:
+        result = entry.get("result")
+        if isinstance(result, dict) and "error" in result:
+            continue
+        key = _tool_cache_key(entry["tool_name"], entry["args"])
+        if key is not None:
+            memo[key] = result
+    return memo
+
+
+async def _run_one_tool(
+    tool_call: dict[str, Any],
+    tools_by_name: dict[str, Any],
+    memo: dict[tuple[str, bytes], Any],
+) -> tuple[dict[str, Any], Any]:
+    """
+    Execute a single tool call and return ``(tool_call, result)``.
+
+    The pandas tools are CPU-bound and synchronous, so they run on the
+    bounded ``TOOL_EXECUTOR`` pool to keep the event loop free.  Failures are returned as an
+    ``{"error": ...}`` payload so the model can react to them.  Successful
+    results are stored in *memo* and repeated calls are answered from it.
+    """
+    tool_name: str = tool_call["name"]
+    tool_args: dict = tool_call["args"]
+
+    logger.info("ResearchAgent: LLM requested tool '{}' with args={}", tool_name, tool_args)
+
+    tool = tools_by_name.get(tool_name)
+    if tool is None:
+        logger.warning("ResearchAgent: Unknown tool '{}' requested", tool_name)
+        return tool_call, {"error": f"Unknown tool '{tool_name}'"}
+
+    key = _tool_cache_key(tool_name, tool_args)
+    if key is not None and key in memo:
+        logger.debug("ResearchAgent: Reusing cached result for tool '{}'", tool_name)
+        return tool_call, memo[key]
+
+    try:
+        loop = asyncio.get_running_loop()
+        tool_result = await loop.run_in_executor(TOOL_EXECUTOR, partial(tool.invoke, tool_args))
+        logger.debug("ResearchAgent: Tool '{}' completed successfully", tool_name)
+        if key is not None:
+            memo[key] = tool_result
+    except Exception as exc:
+        tool_result = {"error": str(exc)}
+        logger.error(
+            "ResearchAgent: tool '{}' raised an exception — {}", tool_name, exc
+        )
+    return tool_call, tool_result
+
+
+async def research_agent_node(state: AgentState, *, ctx: GraphContext) -> dict[str, Any]:
+    """
+    Node 2 — Research Agent.
+
+    Runs a ReAct loop:
+    1. Send system prompt + query (+ prior critique if this is a revision) to
+       the LLM model with all tools bound.
+    2. If the model calls tools, execute them and loop.
+    3. When the model stops calling tools, extract the text as ``draft_answer``.
+
+    When the guard node already fetched the first model response for this
+    turn (``_prefetched_response``), that response replaces the first call.
+    """
+    tools_by_name: dict[str, Any] = ctx.tools_by_name
+    prefetched: AIMessage | None = state.get("_prefetched_response")
+
+    model_with_tools = get_research_model(ctx)
+    messages, new_messages = build_turn_messages(state)
 
-    messages.append(HumanMessage(content=user_content))
     tool_log: list[dict[str, Any]] = []
-    steps: list[dict[str, Any]] = list(state.get("steps", []))
+    tool_memo = _seed_tool_cache(state.get("tool_log", []))
+    steps: list[dict[str, Any]] = []  # new entries only — the reducer appends them
 
     for iteration in range(_MAX_TOOL_ITERATIONS):
         logger.debug("Research agent iteration {}", iteration + 1)
 
-        response: AIMessage = model_with_tools.invoke(messages)
+        if prefetched is not None:
+            response: AIMessage = prefetched
+            prefetched = None
+        else:
+            response = await model_with_tools.ainvoke(messages)
         messages.append(response)
+        new_messages.append(response)
 
         # No tool calls → the model has produced its final answer
         if not response.tool_calls:
             draft = response.content
             if isinstance(draft, list):
-                # Some providers return content as a list of blocks
-                draft = " ".join(
-                    block.get("text", "") if isinstance(block, dict) else str(block)
-                    for block in draft
-                ).strip()
+                # Some providers return content as a list of blocks —
+                # almost always plain dicts, so check that once up front
+                if all(type(block) is dict for block in draft):
+                    draft = " ".join(block.get("text", "") for block in draft).strip()
+                else:
+                    draft = " ".join(
+                        block.get("text", "") if type(block) is dict else str(block)
+                        for block in draft
+                    ).strip()
+            draft_str = draft if isinstance(draft, str) else str(draft)
             logger.info(
                 "Research agent finished after {} iteration(s) | draft_length={}",
                 iteration + 1,
-                len(str(draft)),
+                len(draft_str),
             )
-            
-            # Return new messages for the add_messages reducer
-            # We skip the messages that were already in the state
-            # but we include EVERYTHING added during this node call.
-            # However, if we added a SystemMessage at the start, we should be careful.
-            # LangGraph state management usually handles this.
-            new_messages = messages[len(initial_messages):]
-            
+
+            # Only this turn's messages go to the add_messages reducer
             return {
-                "draft_answer": str(draft),
+                "draft_answer": draft_str,
                 "tool_log": tool_log,
                 "messages": new_messages,
                 "steps": steps,
+                "_prefetched_response": None,
             }
 
-        # Execute each tool call
-        for tool_call in response.tool_calls:
+        # Execute all tool calls of this step concurrently; results are
+        # recorded in the order the model requested them.
+        results = await asyncio.gather(
+            *(_run_one_tool(tool_call, tools_by_name, tool_memo) for tool_call in response.tool_calls)
+        )
+        for tool_call, tool_result in results:
             tool_name: str = tool_call["name"]
             tool_args: dict = tool_call["args"]
-            tool_id: str = tool_call["id"]
-
-            logger.info("ResearchAgent: LLM requested tool '{}' with args={}", tool_name, tool_args)
-
-            tool = tools_by_name.get(tool_name)
-            if tool is None:
-                tool_result = {"error": f"Unknown tool '{tool_name}'"}
-                logger.warning("ResearchAgent: Unknown tool '{}' requested", tool_name)
-            else:
-                try:
-                    tool_result = tool.invoke(tool_args)
-                    logger.debug("ResearchAgent: Tool '{}' completed successfully", tool_name)
-                except Exception as exc:
-                    tool_result = {"error": str(exc)}
-                    logger.error(
-                        "ResearchAgent: tool '{}' raised an exception — {}", tool_name, exc
-                    )
 
             tool_log.append({
                 "tool_name": tool_name,
@@ -144,12 +242,12 @@ def research_agent_node(state: AgentState) -> dict[str, Any]:
                 "data": {"args": tool_args, "result": tool_result},
             })
 
-            messages.append(
-                ToolMessage(
-                    content=str(tool_result),
-                    tool_call_id=tool_id,
-                )
+            tool_message = ToolMessage(
+                content=str(tool_result),
+                tool_call_id=tool_call["id"],
             )
+            messages.append(tool_message)
+            new_messages.append(tool_message)
 
     # Iteration cap reached — extract best available content from last response
     logger.warning(
@@ -166,10 +264,10 @@ def research_agent_node(state: AgentState) -> dict[str, Any]:
             "Here is the raw result: " + str(tool_log[-1].get("result", ""))
         )
 
-    new_messages = messages[len(initial_messages):]
     return {
         "draft_answer": draft,
         "tool_log": tool_log,
         "messages": new_messages,
         "steps": steps,
+        "_prefetched_response": None,
     }
@@ -17,10 +17,16 @@ Usage::
 
     system_prompt = load_prompt("input_guard")                        # input_guard.md
     agent_prompt = load_prompt("research_agent", property_list=...)   # with template vars
+
+Prompts are static for the lifetime of the process, so file contents are
+read once per ``name`` and rendered results are memoised per
+``(name, kwargs)``.  Call ``load_prompt.cache_clear()`` after
+editing a prompt file in a running dev server.
 """
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 
 _PROMPTS_DIR = Path(__file__).parent
@@ -52,16 +58,36 @@ def load_prompt(name: str, **kwargs: str) -> str:
     KeyError
         If the template contains a ``{placeholder}`` that was not supplied.
     """
+    return _cached_load(name, tuple(sorted(kwargs.items())))
+
+
+@lru_cache(maxsize=32)
+def _read_prompt(name: str) -> str:
+    """Read a prompt file once per process; shared by every set of kwargs."""
     path = _PROMPTS_DIR / f"{name}.md"
-    if not path.exists():
+    try:
+        return path.read_text(encoding="utf-8")
+    except FileNotFoundError:
         raise FileNotFoundError(
             f"Prompt file '{path}' not found.  "
             f"Available prompts: {[p.stem for p in _PROMPTS_DIR.glob('*.md')]}"
-        )
+        ) from None
+
 
-    text = path.read_text(encoding="utf-8")
+@lru_cache(maxsize=64)
+def _cached_load(name: str, items: tuple[tuple[str, str], ...]) -> str:
+    """Render a prompt once per distinct ``(name, kwargs)`` pair."""
+    text = _read_prompt(name)
 
-    if kwargs:
-        text = text.format(**kwargs)
+    if items:
+        text = text.format(**dict(items))
 
     return text
+
+
+def _cache_clear() -> None:
+    _read_prompt.cache_clear()
+    _cached_load.cache_clear()
+
+
+load_prompt.cache_clear = _cache_clear  # type: ignore[attr-defined]
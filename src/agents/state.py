@@ -6,10 +6,16 @@ Defines the shared state schema for the LangGraph multi-agent graph.
 Every node receives the *full* state and returns a partial dict of fields
 it wants to update.  LangGraph merges the returned dict into the previous
 state to produce the next state — nodes never mutate the object in-place.
+
+Growing lists (``messages``, ``steps``, ``draft_history``) carry append
+reducers, so nodes return only the items they add instead of copying the
+whole history on every node entry.  To reset one of them (e.g. at the start
+of a new turn) write ``langgraph.types.Overwrite([])``.
 """
 
 from __future__ import annotations
 
+import operator
 from typing import Any, Annotated
 from typing_extensions import TypedDict
 from langchain_core.messages import BaseMessage
@@ -65,9 +71,9 @@ class AgentState(TypedDict, total=False):
     revision_count: int
     """Number of research→critique revision cycles completed (max = MAX_REVISIONS)."""
 
-    draft_history: list[dict[str, Any]]
+    draft_history: Annotated[list[dict[str, Any]], operator.add]
     """
-    History of every scored draft produced during revision cycles.
+    History of every scored draft produced during revision cycles (append-only).
     Each entry: {"draft": str, "weighted_total": int, "scores": dict[str, int]}
     Used by the critique agent to select the best answer when the revision cap is reached.
     """
@@ -79,18 +85,24 @@ class AgentState(TypedDict, total=False):
     This is the only field the API / UI layer reads.
     """
 
-    steps: list[dict[str, Any]]
+    steps: Annotated[list[dict[str, Any]], operator.add]
     """
-    Ordered list of process steps for observability.
+    Ordered list of process steps for observability (append-only).
     Each step: {"node": str, "type": str, "message": str, "data": dict | None}
     """
 
-    # ---- Internal context (injected by _inject_context, not persisted) ----
-    _df: Any
-    """The normalised portfolio DataFrame — injected at runtime, never stored."""
-
-    _tools: dict[str, Any]
-    """Tool name → BaseTool mapping — injected at runtime, never stored."""
+    # ---- Internal ----
+    _prefetched_response: Any
+    """
+    First research-model response fetched speculatively alongside the input
+    guard check.  Consumed (and cleared) by the research agent.
+    """
 
-    _llm: Any
-    """LLMService instance — injected at runtime, never stored."""
+    _prefetched_output_check: Any
+    """
+    Output-guard verdict fetched speculatively alongside the critique, as
+    ``{"draft": str, "valid": bool, "corrected_answer": str | None}`` — plain
+    values, so checkpointers serialise it without custom types.  Consumed
+    (and cleared) by the output guard when the draft it checked is still the
+    one to ship.
+    """
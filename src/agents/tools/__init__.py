@@ -0,0 +1,21 @@
+"""
+agents/tools
+============
+Portfolio tools exposed to the research agent.
+
+``TOOL_EXECUTOR`` is the bounded thread pool the async research agent uses
+to run the synchronous, CPU-bound pandas tools off the event loop.  Sizing
+it via ``TOOL_PARALLELISM`` caps how many tool calls run at once across all
+concurrent queries, instead of letting each query grab the default pool.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+
+from src.core.config import settings
+
+TOOL_EXECUTOR = ThreadPoolExecutor(
+    max_workers=settings.TOOL_PARALLELISM,
+    thread_name_prefix="cortexre-tool",
+)
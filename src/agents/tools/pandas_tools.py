@@ -21,13 +21,16 @@ Usage::
 
 from __future__ import annotations
 
+from collections.abc import Callable
+from dataclasses import dataclass
 from typing import Any
 
+import numpy as np
 import pandas as pd
 from langchain_core.tools import tool
 
 from src.services.portfolio.asset_manager import AssetManagerAssistant
-from src.services.portfolio.normalization import OVERHEAD_PROPERTY
+from src.services.portfolio.normalization import CATEGORICAL_COLUMNS, OVERHEAD_PROPERTY
 
 
 # ---------------------------------------------------------------------------
@@ -48,37 +51,99 @@ class ToolError(Exception):
 # Internal helpers (not exposed as LangChain tools)
 # ---------------------------------------------------------------------------
 
-def _validate_property(df: pd.DataFrame, property_name: str) -> None:
-    """Raise ToolError when *property_name* is not in the dataset."""
-    known = set(df["property_name"].dropna().unique())
-    if property_name not in known:
-        close = [p for p in known if property_name.lower() in p.lower()]
-        hint = f"  Did you mean: {', '.join(close[:3])}?" if close else ""
-        raise ToolError(
-            f"No property named '{property_name}' was found in the dataset.{hint}"
-        )
+_MAX_QUERY_ROWS = 50  # query_portfolio results beyond this are truncated
 
 
-def _validate_year(df: pd.DataFrame, year: int) -> None:
-    """Raise ToolError when *year* has no matching rows."""
-    if "year" not in df.columns:
-        return
-    available = set(df["year"].dropna().astype(int).unique())
-    if year not in available:
-        raise ToolError(
-            f"No financial data is available for the year {year}. "
-            f"Available years: {sorted(available)}."
+@dataclass(frozen=True, slots=True)
+class _ValidationCache:
+    """
+    Lookup sets used to validate tool arguments, built once per DataFrame.
+
+    The DataFrame is fixed for the lifetime of the tools, so scanning its
+    columns on every tool call would be pure waste.
+    """
+
+    known_props: frozenset[str]
+    lowered_props: tuple[tuple[str, str], ...]  # (lowercased, original), sorted by name
+    known_years: frozenset[int] | None  # None when the dataset has no year column
+    sorted_years: list[int]  # for error messages
+    known_tenants: frozenset[str]
+    known_categories: frozenset[str]
+
+    @classmethod
+    def from_df(cls, df: pd.DataFrame) -> _ValidationCache:
+        known_props = frozenset(_distinct(df["property_name"]))
+        # np.unique returns the distinct years already sorted, with no
+        # intermediate full-column astype copy
+        years = (
+            np.unique(df["year"].dropna().to_numpy(dtype=np.int64)).tolist()
+            if "year" in df.columns else None
+        )
+        return cls(
+            known_props=known_props,
+            lowered_props=tuple((p.lower(), p) for p in sorted(known_props)),
+            known_years=frozenset(years) if years is not None else None,
+            sorted_years=years or [],
+            known_tenants=(
+                frozenset(_distinct(df["tenant_name"]))
+                if "tenant_name" in df.columns else frozenset()
+            ),
+            known_categories=(
+                frozenset(_distinct(df["ledger_category"]))
+                if "ledger_category" in df.columns else frozenset()
+            ),
         )
 
 
-def _am(df: pd.DataFrame) -> AssetManagerAssistant:
-    return AssetManagerAssistant(df)
+def _distinct(series: pd.Series) -> Any:
+    """Return the distinct non-null values of *series* (its categories, for categoricals)."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series.cat.categories
+    return series.dropna().unique()
+
+
+def _unknown_property_message(cache: _ValidationCache, property_name: str) -> str:
+    needle = property_name.lower()
+    close = [p for lowered, p in cache.lowered_props if needle in lowered]
+    hint = f"  Did you mean: {', '.join(close[:3])}?" if close else ""
+    return f"No property named '{property_name}' was found in the dataset.{hint}"
+
+
+def _unknown_year_message(cache: _ValidationCache, year: Any) -> str:
+    return (
+        f"No financial data is available for the year {year}. "
+        f"Available years: {cache.sorted_years}."
+    )
+
+
+def _validate_property(cache: _ValidationCache, property_name: str) -> None:
+    """Raise ToolError when *property_name* is not in the dataset."""
+    if property_name not in cache.known_props:
+        raise ToolError(_unknown_property_message(cache, property_name))
+
+
+def _validate_year(cache: _ValidationCache, year: int) -> None:
+    """Raise ToolError when *year* has no matching rows."""
+    if cache.known_years is None:
+        return
+    if year not in cache.known_years:
+        raise ToolError(_unknown_year_message(cache, year))
 
 
 def _fmt(value: float) -> str:
     """Format a float as a signed number with commas, e.g. -1,234,567.89."""
-    sign = "-" if value < 0 else ""
-    return f"{sign}{abs(value):,.2f}"
+    return f"{value:,.2f}"
+
+
+def _ranked_records(series: pd.Series, label: str, value: str) -> list[dict[str, Any]]:
+    """Convert a ranked *series* into ``{label, value, value_fmt}`` row dicts.
+
+    Formatting and dict construction both happen inside pandas rather than
+    in a per-row Python loop.
+    """
+    frame = series.rename_axis(label).reset_index(name=value)
+    frame[f"{value}_fmt"] = frame[value].map("{:,.2f}".format)
+    return frame.to_dict("records")
 
 
 # ---------------------------------------------------------------------------
@@ -96,11 +161,10 @@ def list_properties(df: pd.DataFrame) -> dict[str, Any]:
     Returns:
         A dict with keys ``properties`` (list of names) and ``count``.
     """
-    props = sorted(
-        p for p in df["property_name"].dropna().unique()
-        if p != OVERHEAD_PROPERTY
-    )
-    return {"label": "Known properties", "properties": props, "count": len(props)}
+    # Filter and sort the unique-name array in NumPy rather than in Python
+    props = _distinct(df["property_name"])
+    props = np.sort(props[props != OVERHEAD_PROPERTY])
+    return {"label": "Known properties", "properties": props.tolist(), "count": int(props.size)}
 
 
 # ---------------------------------------------------------------------------
@@ -122,6 +186,40 @@ def create_tools(df: pd.DataFrame) -> list[Any]:
         A list of ``BaseTool`` instances ready to be registered with a
         LangGraph ``ToolNode`` or passed to a ``create_react_agent``.
     """
+    # ``normalize_data`` already stores these as categoricals; frames built
+    # elsewhere get the same treatment, so the distinct values are simply
+    # the categories.
+    df = df.assign(**{
+        col: df[col].astype("category")
+        for col in CATEGORICAL_COLUMNS
+        if col in df.columns and df[col].dtype == object
+    })
+    validation = _ValidationCache.from_df(df)
+    am = AssetManagerAssistant(df)
+    known_properties = list_properties(df)  # df is immutable for the tools' lifetime
+
+    # Filterable columns → (valid values, error message for an unknown value)
+    filter_domains: dict[str, frozenset[Any]] = {
+        "property_name": validation.known_props,
+        "tenant_name": validation.known_tenants,
+        "ledger_category": validation.known_categories,
+    }
+    if validation.known_years is not None:
+        filter_domains["year"] = validation.known_years
+    filter_errors: dict[str, Callable[[Any], str]] = {
+        "property_name": lambda val: _unknown_property_message(validation, str(val)),
+        "tenant_name": lambda val: (
+            f"No tenant named '{val}' in the dataset. "
+            f"Available tenants: {', '.join(sorted(t for t in validation.known_tenants if t != 'N/A'))}. "
+            f"Call get_schema_info to see tenants per property."
+        ),
+        "ledger_category": lambda val: (
+            f"No ledger category '{val}' in the dataset. "
+            f"Available categories: {', '.join(sorted(validation.known_categories))}. "
+            f"Call get_schema_info for the full list."
+        ),
+        "year": lambda val: _unknown_year_message(validation, val),
+    }
 
     # ------------------------------------------------------------------
     # Tool 1 — List Properties
@@ -138,7 +236,7 @@ def create_tools(df: pd.DataFrame) -> list[Any]:
         Returns:
             A dict with keys ``properties`` (list of names) and ``count``.
         """
-        return list_properties(df)
+        return known_properties
 
     # ------------------------------------------------------------------
     # Tool 2 — P&L for a single property
@@ -165,22 +263,25 @@ def create_tools(df: pd.DataFrame) -> list[Any]:
             ToolError: If the property name does not exist in the dataset.
             ToolError: If no financial data is available for the requested year.
         """
-        _validate_property(df, property_name)
+        _validate_property(validation, property_name)
         if year is not None:
-            _validate_year(df, year)
+            _validate_year(validation, year)
 
-        result = _am(df).get_property_pl(property_name, year)
-        year_label = str(year) if year else "all years"
+        result = am.get_property_pl(property_name, year)
+        # Native floats once, so neither _fmt nor serialisation sees numpy scalars
+        revenue = float(result.get("revenue", 0))
+        expenses = float(result.get("expenses", 0))
+        noi = float(result.get("noi", 0))
         return {
-            "label": f"P&L for '{property_name}' ({year_label})",
+            "label": f"P&L for '{property_name}' ({year or 'all years'})",
             "property_name": property_name,
             "year": year,
-            "revenue": result.get("revenue", 0),
-            "expenses": result.get("expenses", 0),
-            "noi": result.get("noi", 0),
-            "revenue_fmt": _fmt(result.get("revenue", 0)),
-            "expenses_fmt": _fmt(result.get("expenses", 0)),
-            "noi_fmt": _fmt(result.get("noi", 0)),
+            "revenue": revenue,
+            "expenses": expenses,
+            "noi": noi,
+            "revenue_fmt": _fmt(revenue),
+            "expenses_fmt": _fmt(expenses),
+            "noi_fmt": _fmt(noi),
         }
 
     # ------------------------------------------------------------------
@@ -203,19 +304,22 @@ def create_tools(df: pd.DataFrame) -> list[Any]:
             string versions of each value.
         """
         if year is not None:
-            _validate_year(df, year)
+            _validate_year(validation, year)
 
-        result = _am(df).get_portfolio_summary(year)
-        year_label = str(year) if year else "all years"
+        result = am.get_portfolio_summary(year)
+        # Native floats once, so neither _fmt nor serialisation sees numpy scalars
+        revenue = float(result.get("revenue", 0))
+        expenses = float(result.get("expenses", 0))
+        noi = float(result.get("noi", 0))
         return {
-            "label": f"Portfolio summary ({year_label})",
+            "label": f"Portfolio summary ({year or 'all years'})",
             "year": year,
-            "revenue": result.get("revenue", 0),
-            "expenses": result.get("expenses", 0),
-            "noi": result.get("noi", 0),
-            "revenue_fmt": _fmt(result.get("revenue", 0)),
-            "expenses_fmt": _fmt(result.get("expenses", 0)),
-            "noi_fmt": _fmt(result.get("noi", 0)),
+            "revenue": revenue,
+            "expenses": expenses,
+            "noi": noi,
+            "revenue_fmt": _fmt(revenue),
+            "expenses_fmt": _fmt(expenses),
+            "noi_fmt": _fmt(noi),
         }
 
     # ------------------------------------------------------------------
@@ -242,10 +346,10 @@ def create_tools(df: pd.DataFrame) -> list[Any]:
             ToolError: If the property name does not exist in the dataset.
             ToolError: If no financial data is available for the requested year.
         """
-        _validate_property(df, property_name)
-        _validate_year(df, year)
+        _validate_property(validation, property_name)
+        _validate_year(validation, year)
 
-        oer = _am(df).calculate_oer(property_name, year)
+        oer = am.calculate_oer(property_name, year)
         return {
             "label": f"OER for '{property_name}' ({year})",
             "property_name": property_name,
@@ -283,25 +387,26 @@ def create_tools(df: pd.DataFrame) -> list[Any]:
                 f"Unknown metric '{metric}'. Valid options: {', '.join(valid)}."
             )
 
-        results = _am(df).get_growth_metrics(metric)
-        rows = []
-        for prop, years_dict in results.items():
-            if not years_dict:
-                continue
-            
-            # The tool documentation focuses on 2024 -> 2025, but we'll take the latest available
-            # year pair to be robust across different datasets.
-            latest_label = sorted(years_dict.keys())[-1]
-            val = years_dict[latest_label]
-            
-            rows.append({
+        results = am.get_growth_metrics(metric)
+        # The tool documentation focuses on 2024 -> 2025, but we'll take the latest available
+        # year pair to be robust across different datasets.
+        latest = [
+            (prop, years_dict[max(years_dict)])
+            for prop, years_dict in results.items()
+            if years_dict
+        ]
+
+        # Sort from best to worst performer (descending growth); a stable
+        # argsort keeps ties in dataset order, exactly like list.sort did
+        order = np.argsort([-val for _, val in latest], kind="stable")
+        rows = [
+            {
                 "property_name": prop,
                 "growth": val,
                 "growth_pct": f"{val * 100:+.1f}%",
-            })
-
-        # Sort from best to worst performer (descending growth)
-        rows.sort(key=lambda x: x["growth"], reverse=True)
+            }
+            for prop, val in (latest[i] for i in order)
+        ]
 
         return {
             "label": f"YoY growth by {metric} (2024 \u2192 2025)",
@@ -338,17 +443,10 @@ def create_tools(df: pd.DataFrame) -> list[Any]:
             "which property has the highest <field>?" questions.
         """
         if year:
-            _validate_year(df, year)
+            _validate_year(validation, year)
 
-        series = _am(df).compare_properties(field, year)
-        rows = [
-            {
-                "property_name": prop,
-                "value": val,
-                "value_fmt": _fmt(val),
-            }
-            for prop, val in series.items()
-        ]
+        series = am.compare_properties(field, year)
+        rows = _ranked_records(series, "property_name", "value")
         # For expenses (negative numbers), "highest" means the most negative value
         # which is the last row in a descending sort.  For revenue/noi the first
         # row already holds the highest value.
@@ -389,13 +487,10 @@ def create_tools(df: pd.DataFrame) -> list[Any]:
                        the dataset.
         """
         if property_name:
-            _validate_property(df, property_name)
+            _validate_property(validation, property_name)
 
-        series = _am(df).top_expense_drivers(property_name, year)
-        rows = [
-            {"category": cat, "total": val, "total_fmt": _fmt(val)}
-            for cat, val in series.items()
-        ]
+        series = am.top_expense_drivers(property_name, year)
+        rows = _ranked_records(series, "category", "total")
         scope = f"'{property_name}'" if property_name else "portfolio"
         return {
             "label": f"Top expense drivers ({scope})",
@@ -429,42 +524,38 @@ def create_tools(df: pd.DataFrame) -> list[Any]:
         Args:
             dimensions (list[str]): A list of column names to group the data by.
             metrics (list[str]): A list of numerical columns to sum (defaults to ["profit"]).
-            filters (list[dict[str, Any]] | None): Optional list of dictionaries with "column" and "value" keys. E.g. [{"column": "year", "value": 2025}]
+            filters (list[dict[str, Any]] | None): Optional list of dictionaries with "column" and "value" keys, and an optional "operator" of "==" (default) or "in" to match any value in a list. E.g. [{"column": "year", "value": 2025}], [{"column": "year", "operator": "in", "value": [2024, 2025]}]
 
         Returns:
             A dict with a `rows` key containing a list of aggregated results.
         """
         # Validate filters against known schema values
-        if filters:
-            valid_tenants = set(df["tenant_name"].dropna().unique()) if "tenant_name" in df.columns else set()
-            valid_categories = set(df["ledger_category"].dropna().unique()) if "ledger_category" in df.columns else set()
-            for f in filters:
-                col = f.get("column")
-                val = f.get("value")
-                if col == "property_name":
-                    _validate_property(df, str(val) if val is not None else "")
-                elif col == "tenant_name" and val not in valid_tenants:
-                    available = sorted(t for t in valid_tenants if t != "N/A")
-                    raise ToolError(
-                        f"No tenant named '{val}' in the dataset. "
-                        f"Available tenants: {', '.join(available)}. "
-                        f"Call get_schema_info to see tenants per property."
-                    )
-                elif col == "ledger_category" and val not in valid_categories:
-                    raise ToolError(
-                        f"No ledger category '{val}' in the dataset. "
-                        f"Available categories: {', '.join(sorted(valid_categories))}. "
-                        f"Call get_schema_info for the full list."
-                    )
-
-        rows = _am(df).query_portfolio(dimensions, metrics, filters)
-        
-        # Keep results manageable for the LLM context window by truncating huge responses
-        if len(rows) > 50:
+        for f in filters or ():
+            col = f.get("column")
+            val = f.get("value")
+            domain = filter_domains.get(col)
+            if domain is None:
+                continue
+            values = val if f.get("operator") == "in" and isinstance(val, list) else [val]
+            for v in values:
+                try:
+                    known = v in domain
+                except TypeError:  # unhashable value, e.g. a list
+                    known = False
+                if not known:
+                    raise ToolError(filter_errors[col](v))
+
+        # Keep results manageable for the LLM context window by truncating huge
+        # responses — one extra row is fetched only to detect the truncation
+        rows = am.query_portfolio(dimensions, metrics, filters, limit=_MAX_QUERY_ROWS + 1)
+        if len(rows) > _MAX_QUERY_ROWS:
             return {
                 "label": "Custom Query Result (Truncated)",
-                "rows": rows[:50],
-                "note": f"Result truncated. {len(rows)} total rows found, showing top 50.",
+                "rows": rows[:_MAX_QUERY_ROWS],
+                "note": (
+                    f"Result truncated. More than {_MAX_QUERY_ROWS} rows found, "
+                    f"showing top {_MAX_QUERY_ROWS}."
+                ),
             }
 
         return {
@@ -492,7 +583,7 @@ def create_tools(df: pd.DataFrame) -> list[Any]:
             ``all_tenants``, ``ledger_groups``, ``ledger_categories``,
             ``years``, ``quarters``, and ``months``.
         """
-        return _am(df).get_schema_info()
+        return am.get_schema_info()
 
     # ------------------------------------------------------------------
     # Tool 10 — Tenant Revenue Summary
@@ -530,20 +621,15 @@ def create_tools(df: pd.DataFrame) -> list[Any]:
             ToolError: If ``property_name`` is provided but does not exist in the dataset.
         """
         if property_name:
-            _validate_property(df, property_name)
+            _validate_property(validation, property_name)
         if year:
-            _validate_year(df, year)
+            _validate_year(validation, year)
 
-        rows_raw = _am(df).get_tenant_summary(property_name, tenant_name, year)
-        rows = [
-            {
-                "property_name": r["property_name"],
-                "tenant_name": r["tenant_name"],
-                "revenue": r["revenue"],
-                "revenue_fmt": _fmt(r["revenue"]),
-            }
-            for r in rows_raw
-        ]
+        # The records are freshly built by to_dict — add the formatted
+        # figure in place instead of copying every row into a new dict
+        rows = am.get_tenant_summary(property_name, tenant_name, year)
+        for row in rows:
+            row["revenue_fmt"] = _fmt(row["revenue"])
         scope = (f" — {property_name}" if property_name else "") + (f" — {tenant_name}" if tenant_name else "")
         return {
             "label": f"Tenant revenue summary{scope}",
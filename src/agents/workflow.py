@@ -11,14 +11,16 @@ Graph topology
     │
     ▼
   Input Guard  ──── LLM: topic relevance + injection check
-    │                    │
+    │                    │  (runs concurrently with the research agent's
+    │                    │   first model call — see guard_prefetch.py)
     │ (valid)       (blocked)
     ▼                    ▼
   Research Agent        END
     │
     ▼ (tool loop: list_properties, get_property_pl, …)
   Critique Agent ──── LLM: accuracy + hallucination check
-    │                    │
+    │                    │  (runs concurrently with the output guard's
+    │                    │   check on the same draft — see critique_prefetch.py)
     │ (approved)    (rejected, revision_count < MAX)
     ▼                    │
   Output Guard ◄─────────┘  (after MAX revisions, accepts best answer)
@@ -28,23 +30,28 @@ Graph topology
 
 All LLM interactions are delegated to ``LLMService`` — this module contains
 no direct OpenAI / LangChain calls.
+
+Every node is a coroutine, so the compiled graph must be driven with
+``ainvoke`` / ``astream``; LLM round-trips then yield the event loop and
+concurrent queries overlap instead of queueing behind one another.
 """
 
 from __future__ import annotations
 
+from functools import partial
 from typing import Any
 
 import pandas as pd
 from langgraph.graph import END, StateGraph
 
+from src.agents.context import GraphContext
 from src.agents.state import AgentState
-from src.agents.tools.pandas_tools import create_tools
+from src.agents.tools.pandas_tools import create_tools, list_properties
 from src.services.llm.service import LLMService
-from src.agents.nodes.input_guard import input_guard_node
-from src.agents.nodes.research_agent import research_agent_node
-from src.agents.nodes.critique_agent import critique_agent_node
-from src.agents.nodes.output_guard import output_guard_node
-from src.core.config import settings
+from src.agents.nodes.guard_prefetch import guard_plus_prefetch_node
+from src.agents.nodes.research_agent import bind_research_model, research_agent_node
+from src.agents.nodes.critique_prefetch import critique_plus_output_check_node
+from src.agents.nodes.output_guard import compile_property_pattern, output_guard_node
 
 
 # ===========================================================================
@@ -53,22 +60,19 @@ from src.core.config import settings
 
 def route_after_input_guard(state: AgentState) -> str:
     """Route to END (blocked) or research_agent (valid)."""
-    if state.get("blocked"):
-        return END
-    return "research_agent"
+    # The input guard sets ``blocked`` on every path
+    return END if state["blocked"] else "research_agent"
 
 
 def route_after_critique(state: AgentState) -> str:
     """
     Route back to research_agent for a revision, or forward to output_guard
     when the draft is approved or the revision cap is reached.
-    """
-    critique = state.get("critique")
-    revision_count = state.get("revision_count", 0)
 
-    if critique and revision_count < settings.MAX_REVISIONS:
-        return "research_agent"
-    return "output_guard"
+    The critique agent owns the cap: it only leaves ``critique`` set when
+    another revision is allowed, so the feedback alone decides the route.
+    """
+    return "research_agent" if state.get("critique") else "output_guard"
 
 
 # ===========================================================================
@@ -93,20 +97,27 @@ def build_graph(
     """
     tools_list = create_tools(df)
     tools_by_name: dict[str, Any] = {t.name: t for t in tools_list}
-
-    def _inject_context(node_fn):
-        """Inject ``_df``, ``_tools``, and ``_llm`` into the state before each node runs."""
-        def wrapped(state: AgentState) -> dict[str, Any]:
-            return node_fn({**state, "_df": df, "_tools": tools_by_name, "_llm": llm_service})
-        wrapped.__name__ = node_fn.__name__
-        return wrapped
+    # Binding serialises every tool schema — do it once, not per node call
+    model_with_tools = bind_research_model(llm_service, tools_list)
+    # df is immutable for the graph's lifetime, so the property list is too
+    known_properties: list[str] = list_properties(df)["properties"]
+    ctx = GraphContext(
+        llm=llm_service,
+        df=df,
+        tools_by_name=tools_by_name,
+        tools_list=tools_list,
+        model_with_tools=model_with_tools,
+        known_properties=known_properties,
+        known_properties_re=compile_property_pattern(known_properties),
+    )
 
     graph = StateGraph(AgentState)
 
-    graph.add_node("input_guard",    _inject_context(input_guard_node))
-    graph.add_node("research_agent", _inject_context(research_agent_node))
-    graph.add_node("critique_agent", _inject_context(critique_agent_node))
-    graph.add_node("output_guard",   _inject_context(output_guard_node))
+    # The per-graph context is bound as an argument, not carried in state
+    graph.add_node("input_guard",    partial(guard_plus_prefetch_node, ctx=ctx))
+    graph.add_node("research_agent", partial(research_agent_node, ctx=ctx))
+    graph.add_node("critique_agent", partial(critique_plus_output_check_node, ctx=ctx))
+    graph.add_node("output_guard",   partial(output_guard_node, ctx=ctx))
 
     graph.set_entry_point("input_guard")
     graph.add_conditional_edges(
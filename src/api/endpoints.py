@@ -1,14 +1,25 @@
+import asyncio
 import time
+import orjson
 from fastapi import APIRouter, Depends
+from fastapi.responses import Response, StreamingResponse
 from loguru import logger
 
 from src.api.deps import get_agent_service, get_portfolio_service
+from src.api.responses import OrjsonResponse
 from src.api.schemas import QueryRequest, QueryResponse, ErrorResponse
+from src.services.agent.exceptions import AgentError, GraphNotInitializedError
 from src.services.agent.service import AgentService
 from src.services.portfolio.service import PortfolioService
 
 router = APIRouter()
 
+
+def _strip_step_data(step: dict) -> dict:
+    """Drop a step's ``data`` payload (tool results, scores), keeping its label."""
+    return {k: v for k, v in step.items() if k != "data"}
+
+
 @router.post(
     "/query",
     response_model=QueryResponse,
@@ -27,41 +38,86 @@ async def query_agent(
     Submit a real-estate question and get a business-friendly answer from the agent.
     """
     query = request.query
-    logger.info(f"API: Received user query: {query!r}")
-    start_time = time.time()
+    # Use dynamic thread ID from request if provided
+    thread_id = request.thread_id or "default_session"
+    start_ns = time.perf_counter_ns()
 
     try:
         # Invoke the agent service (handles graph traversal and checkpointer persistence)
-        logger.debug("API: Dispatching query to AgentService")
-        # Use dynamic thread ID from request if provided
-        thread_id = request.thread_id or "default_session"
-        result = agent_service.invoke(query, thread_id=thread_id)
-        
+        result = await agent_service.ainvoke(query, thread_id=thread_id)
+
         answer = result.get("final_answer") or "No answer could be generated."
+        steps = result.get("steps", [])
         blocked = result.get("blocked", False)
         block_reason = result.get("block_reason")
 
-        elapsed_ms = (time.time() - start_time) * 1000
-        logger.info(
-            f"API: Completed query in {elapsed_ms:.0f}ms | blocked={blocked} "
-            f"| answer_length={len(answer)}"
+        elapsed_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+        # One structured record per request, written once the outcome is known
+        logger.bind(
+            query=query, thread_id=thread_id, elapsed_ms=elapsed_ms,
+            blocked=blocked, answer_length=len(answer),
+        ).info(
+            "API: Completed query {!r} in {}ms | blocked={} | answer_length={}",
+            query, elapsed_ms, blocked, len(answer),
         )
 
         return QueryResponse(
             answer=answer,
             blocked=blocked,
             block_reason=block_reason,
-            intermediate_steps=result.get("steps", []),
+            intermediate_steps=(
+                steps if request.include_step_data else [_strip_step_data(s) for s in steps]
+            ),
         )
     except Exception as exc:
-        elapsed_ms = (time.time() - start_time) * 1000
-        logger.error(f"API: Query failed after {elapsed_ms:.0f}ms | error={exc}")
+        elapsed_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+        logger.bind(query=query, thread_id=thread_id, elapsed_ms=elapsed_ms).error(
+            "API: Query {!r} failed after {}ms | error={}", query, elapsed_ms, exc,
+        )
         raise
 
 
+@router.post(
+    "/query/stream",
+    summary="Natural language query (streamed)",
+    response_class=StreamingResponse,
+    responses={
+        200: {"content": {"text/event-stream": {}}, "description": "Server-sent agent events"},
+        503: {"model": ErrorResponse, "description": "Agent not initialized"},
+    },
+)
+async def query_agent_stream(
+    request: QueryRequest,
+    agent_service: AgentService = Depends(get_agent_service),
+):
+    """
+    Same as ``/query``, but streams server-sent events: one ``step`` event per
+    process step as each node finishes, then a final ``result`` event.
+    """
+    logger.info("API: Received streamed user query: {!r}", request.query)
+    # Fail with 503 up front rather than mid-stream
+    if not agent_service.is_initialized:
+        raise GraphNotInitializedError()
+    thread_id = request.thread_id or "default_session"
+
+    async def event_stream():
+        try:
+            async for event in agent_service.astream(request.query, thread_id=thread_id):
+                if event["event"] == "step" and not request.include_step_data:
+                    event = {**event, "step": _strip_step_data(event["step"])}
+                yield b"data: " + orjson.dumps(event, default=str) + b"\n\n"
+        except AgentError as exc:
+            # Headers are already sent — report the failure as a terminal event
+            error = {"event": "error", "detail": exc.message, "error_type": exc.__class__.__name__}
+            yield b"data: " + orjson.dumps(error) + b"\n\n"
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
 @router.get(
     "/properties",
     summary="List portfolio properties",
+    response_class=OrjsonResponse,
     responses={
         200: {"description": "List of property names"},
         404: {"model": ErrorResponse, "description": "Dataset not found"},
@@ -73,13 +129,15 @@ async def list_properties(
     """
     Returns a distinct list of property names found in the dataset.
     """
-    unique_props = portfolio_service.property_list
-    return {"properties": unique_props}
+    # pandas work — keep it off the event loop
+    unique_props = await asyncio.to_thread(lambda: portfolio_service.property_list)
+    return OrjsonResponse({"properties": unique_props})
 
 
 @router.get(
     "/eda/stats",
     summary="Portfolio statistics for EDA",
+    response_class=OrjsonResponse,
     responses={
         200: {"description": "Aggregated stats for charts"},
         404: {"model": ErrorResponse, "description": "Dataset not found"},
@@ -91,11 +149,37 @@ async def get_eda_stats(
     """
     Returns aggregated revenue, expense, and NOI data for frontend visualization.
     """
-    stats = portfolio_service.get_eda_stats()
-    return stats
+    # Serialized once by the service; every later request sends the same bytes
+    payload = await asyncio.to_thread(portfolio_service.get_eda_stats_json)
+    return Response(content=payload, media_type="application/json")
+
+
+@router.get(
+    "/eda/monthly/{property_name}",
+    summary="Monthly performance of one property",
+    response_class=OrjsonResponse,
+    responses={
+        200: {"description": "Monthly revenue, expenses, and NOI"},
+        404: {"model": ErrorResponse, "description": "Dataset or property not found"},
+    },
+)
+async def get_property_monthly(
+    property_name: str,
+    portfolio_service: PortfolioService = Depends(get_portfolio_service)
+):
+    """
+    Returns the monthly revenue, expense, and NOI series of a single property.
+    """
+    def monthly_records() -> list[dict]:
+        monthly = portfolio_service.get_monthly(property_name).reset_index()
+        monthly["date"] = monthly["date"].dt.strftime("%Y-%m-%d")
+        return monthly.to_dict(orient="records")
+
+    records = await asyncio.to_thread(monthly_records)
+    return OrjsonResponse({"property": property_name, "monthly": records})
 
 
-@router.get("/health", summary="Health check")
+@router.get("/health", summary="Health check", response_class=OrjsonResponse)
 async def health_check():
     """Liveness probe to verify the service is running and ready."""
-    return {"status": "ok", "agent": "ready"}
+    return OrjsonResponse({"status": "ok", "agent": "ready"})
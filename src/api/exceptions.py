@@ -9,13 +9,21 @@ handler can reflect the right HTTP status without branching.
 
 from __future__ import annotations
 
+import orjson
 from fastapi import Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 from loguru import logger
 
+from src.api.responses import OrjsonResponse
 from src.services.portfolio.exceptions import PortfolioError
 from src.services.agent.exceptions import AgentError
 
+# The catch-all 500 body never varies — serialised once at import
+_INTERNAL_ERROR_BODY = orjson.dumps({
+    "detail": "An unexpected internal error occurred. Please try again later.",
+    "error_type": "InternalServerError",
+})
+
 
 def register_exception_handlers(app) -> None:
     """Register global exception handlers on the FastAPI *app* instance."""
@@ -24,7 +32,7 @@ def register_exception_handlers(app) -> None:
     @app.exception_handler(AgentError)
     async def service_error_handler(request: Request, exc: PortfolioError | AgentError):
         logger.error("{}: {} (status: {})", exc.__class__.__name__, exc.message, exc.status_code)
-        return JSONResponse(
+        return OrjsonResponse(
             status_code=exc.status_code,
             content={"detail": exc.message, "error_type": exc.__class__.__name__},
         )
@@ -32,10 +40,8 @@ def register_exception_handlers(app) -> None:
     @app.exception_handler(Exception)
     async def generic_error_handler(request: Request, exc: Exception):
         logger.exception("Unhandled exception: {}", exc)
-        return JSONResponse(
+        return Response(
+            content=_INTERNAL_ERROR_BODY,
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            content={
-                "detail": "An unexpected internal error occurred. Please try again later.",
-                "error_type": "InternalServerError",
-            },
+            media_type="application/json",
         )
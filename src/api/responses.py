@@ -0,0 +1,27 @@
+"""
+api/responses.py
+================
+Response classes shared by the API routers and exception handlers.
+
+Routes with a ``response_model`` are already serialised straight to bytes by
+Pydantic.  ``OrjsonResponse`` covers the rest — untyped dict payloads such as
+the EDA stats — which would otherwise go through ``jsonable_encoder`` and the
+stdlib ``json`` module.
+
+It is deliberately not the app-wide ``default_response_class``: FastAPI only
+takes its Pydantic fast path for routes left on the default response class.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class OrjsonResponse(JSONResponse):
+    """``JSONResponse`` rendered with orjson (numpy scalars and non-str keys allowed)."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
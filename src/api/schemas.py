@@ -5,6 +5,9 @@ from pydantic import BaseModel
 class QueryRequest(BaseModel):
     query: str
     thread_id: str | None = None
+    # Steps carry raw tool results under "data"; thin clients can skip them.
+    # History is never sent — the thread_id is enough for the checkpointer.
+    include_step_data: bool = True
 
     model_config = {
         "json_schema_extra": {
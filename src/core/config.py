@@ -15,9 +15,10 @@ Usage::
 
 from __future__ import annotations
 
-import glob
-from functools import lru_cache
+import os
+from functools import cached_property, lru_cache
 from pathlib import Path
+from typing import Literal
 
 from pydantic import Field, computed_field, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -62,6 +63,22 @@ class Settings(BaseSettings):
         ),
     )
 
+    LLM_RPM: int = Field(
+        default=0,
+        ge=0,
+        description=(
+            "Guard/critique LLM requests admitted per rolling minute, per model. "
+            "Set just under the provider limit so bursts queue in-process "
+            "instead of coming back as 429s. 0 = unlimited."
+        ),
+    )
+
+    LLM_TPM: int = Field(
+        default=0,
+        ge=0,
+        description="Estimated prompt tokens admitted per rolling minute, per model. 0 = unlimited.",
+    )
+
     # ------------------------------------------------------------------
     # API keys (LiteLLM reads these automatically from the environment)
     # ------------------------------------------------------------------
@@ -97,6 +114,91 @@ class Settings(BaseSettings):
         description="Minimum weighted score (0–100) for the critique agent to approve a draft.",
     )
 
+    CRITIQUE_STREAM_EARLY_EXIT: bool = Field(
+        default=True,
+        description=(
+            "Stream the critique response and approve as soon as the streamed "
+            "scores clear CRITIQUE_SCORE_THRESHOLD, without waiting for the "
+            "issues / revised answer."
+        ),
+    )
+
+    CRITIQUE_CACHE_TTL_SECONDS: int = Field(
+        default=86_400,
+        ge=0,
+        description=(
+            "How long a cached critique result stays valid. Identical "
+            "(query, draft, tool log, model) inputs within this window reuse "
+            "the stored grade instead of calling the LLM. 0 disables the cache."
+        ),
+    )
+
+    CRITIQUE_CACHE_DIR: Path = Field(
+        default=Path.home() / ".cache" / "cortexre" / "critique",
+        description="Directory holding the on-disk critique cache entries.",
+    )
+
+    OUTPUT_GUARD_FAST_PATH: bool = Field(
+        default=True,
+        description=(
+            "Skip the output guard's LLM call for short drafts that mention no "
+            "known property name (nothing there can be a hallucinated property)."
+        ),
+    )
+
+    LLM_GUARD_BATCHING: bool = Field(
+        default=False,
+        description=(
+            "Coalesce input-guard checks from concurrent requests into one LLM "
+            "call. Saves round-trips under load, at the cost of the guard "
+            "judging several users' queries in one prompt."
+        ),
+    )
+
+    LLM_GUARD_BATCH_SIZE: int = Field(
+        default=16,
+        ge=1,
+        description="Most input-guard checks sent in one batched LLM call.",
+    )
+
+    LLM_GUARD_BATCH_WAIT_MS: int = Field(
+        default=25,
+        ge=0,
+        description="How long the first queued input-guard check waits for others to join its batch.",
+    )
+
+    TOOL_PARALLELISM: int = Field(
+        default=4,
+        ge=1,
+        description=(
+            "Worker threads available for running pandas tools off the event "
+            "loop, shared by all concurrent queries."
+        ),
+    )
+
+    # ------------------------------------------------------------------
+    # Conversation persistence
+    # ------------------------------------------------------------------
+    CHECKPOINTER: Literal["memory", "sqlite", "postgres"] = Field(
+        default="memory",
+        description=(
+            "Where conversation checkpoints live. 'memory' is per-process and "
+            "only safe with a single worker; 'sqlite' / 'postgres' are shared, "
+            "so several workers or replicas can serve the same thread."
+        ),
+    )
+
+    CHECKPOINT_DB: str = Field(
+        default="checkpoints.sqlite",
+        description="SQLite file path, or Postgres connection URL, for the checkpointer.",
+    )
+
+    CHECKPOINT_POOL_SIZE: int = Field(
+        default=10,
+        ge=1,
+        description="Maximum pooled connections for the Postgres checkpointer.",
+    )
+
     # ------------------------------------------------------------------
     # Data
     # ------------------------------------------------------------------
@@ -105,6 +207,44 @@ class Settings(BaseSettings):
         description="Directory containing the .parquet dataset file(s).",
     )
 
+    # ------------------------------------------------------------------
+    # Evaluation
+    # ------------------------------------------------------------------
+    EVAL_MAX_CONCURRENCY: int = Field(
+        default=4,
+        ge=1,
+        description="Maximum number of evaluation queries run against the agent at once.",
+    )
+
+    EVAL_RPM: int = Field(
+        default=60,
+        ge=1,
+        description="Evaluation queries admitted per rolling minute.",
+    )
+
+    EVAL_TPM: int = Field(
+        default=30_000,
+        ge=1,
+        description="Estimated LLM tokens admitted per rolling minute during evaluation.",
+    )
+
+    EVAL_TOKENS_PER_QUERY: int = Field(
+        default=2_000,
+        ge=0,
+        description=(
+            "Estimated tokens one evaluation query costs beyond its own text "
+            "(agent prompts, tool results, and the graded feedback calls)."
+        ),
+    )
+
+    EVAL_FEEDBACK_CACHE_DIR: Path = Field(
+        default=Path.home() / ".cache" / "cortexre" / "feedback",
+        description=(
+            "Directory holding cached LLM-graded feedback scores, so re-running "
+            "the evaluation on unchanged answers skips the grader calls."
+        ),
+    )
+
     # ------------------------------------------------------------------
     # Validators / derived fields
     # ------------------------------------------------------------------
@@ -128,16 +268,20 @@ class Settings(BaseSettings):
         return self
 
     @computed_field  # type: ignore[misc]
-    @property
+    @cached_property
     def DATA_PATH(self) -> Path:
-        """Path to the single .parquet file found inside DATA_DIR."""
-        matches = glob.glob(str(self.DATA_DIR / "*.parquet"))
-        if not matches:
-            raise FileNotFoundError(
-                f"No .parquet file found in '{self.DATA_DIR}'. "
-                "Please place the dataset there before running."
-            )
-        return Path(matches[0])
+        """Path to the single .parquet file found inside DATA_DIR (resolved once)."""
+        try:
+            with os.scandir(self.DATA_DIR) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".parquet") and entry.is_file():
+                        return Path(entry.path)
+        except FileNotFoundError:
+            pass
+        raise FileNotFoundError(
+            f"No .parquet file found in '{self.DATA_DIR}'. "
+            "Please place the dataset there before running."
+        )
 
 
 # ---------------------------------------------------------------------------
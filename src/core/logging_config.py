@@ -2,20 +2,28 @@ import logging
 import sys
 from loguru import logger
 
+# stdlib level name -> Loguru level (name, or the numeric level if Loguru has no match)
+_LEVEL_CACHE: dict[str, str | int] = {}
+
+
 class InterceptHandler(logging.Handler):
     """
     Standard python logging handler that intercepts all logs and dispatches them to Loguru.
     """
     def emit(self, record):
         # Get corresponding Loguru level if it exists
-        try:
-            level = logger.level(record.levelname).name
-        except ValueError:
-            level = record.levelno
-
-        # Find caller from where originated the logged message
-        frame, depth = logging.currentframe(), 2
-        while frame.f_code.co_filename == logging.__file__:
+        level = _LEVEL_CACHE.get(record.levelname)
+        if level is None:
+            try:
+                level = logger.level(record.levelname).name
+            except ValueError:
+                level = record.levelno
+            _LEVEL_CACHE[record.levelname] = level
+
+        # Find caller from where originated the logged message: skip emit()
+        # itself, then every frame inside the logging package
+        frame, depth = sys._getframe(1), 1
+        while frame and frame.f_code.co_filename == logging.__file__:
             frame = frame.f_back
             depth += 1
 
@@ -35,14 +43,18 @@ def setup_logging(level="INFO"):
         logging_logger.handlers = [InterceptHandler()]
         logging_logger.propagate = False
 
-    # Configure Loguru
+    # Configure Loguru. Extended tracebacks with local-variable values are
+    # costly to render (and may leak data), so they are reserved for DEBUG;
+    # enqueue moves the stdout write off the calling thread / event loop.
+    debug_mode = str(level).upper() == "DEBUG"
     logger.remove()
     logger.add(
         sys.stdout,
         level=level,
         format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
-        backtrace=True,
-        diagnose=True,
+        backtrace=debug_mode,
+        diagnose=debug_mode,
+        enqueue=True,
     )
 
     logger.info("Logging initialized with Loguru.")
@@ -0,0 +1,29 @@
+"""
+evaluation/_compat.py
+=====================
+LangChain migration bridge for TruLens.
+
+TruLens 1.3.0's OpenAI provider still imports ``Generation`` and
+``LLMResult`` from the legacy ``langchain.schema`` namespace, which current
+LangChain releases no longer ship.  Importing this module registers a
+stand-in that maps both names to ``langchain_core.outputs``; it must be
+imported before any ``trulens.providers`` module.
+
+The patch is applied once per process, and only when ``langchain.schema``
+is really missing.
+"""
+
+from __future__ import annotations
+
+import sys
+from importlib.util import find_spec
+from types import ModuleType
+
+
+if find_spec("langchain.schema") is None:
+    from langchain_core.outputs import Generation, LLMResult
+
+    schema = ModuleType("langchain.schema")
+    schema.Generation = Generation
+    schema.LLMResult = LLMResult
+    sys.modules["langchain.schema"] = schema
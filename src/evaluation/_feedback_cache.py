@@ -0,0 +1,67 @@
+"""
+evaluation/_feedback_cache.py
+==============================
+Content-addressed disk cache for LLM-graded TruLens feedback scores.
+
+Re-running the evaluation on unchanged ground truth asks the grader the
+same questions about the same answers; each result is keyed by the grading
+model, the feedback method, and every argument it was called with, and
+pickled to ``EVAL_FEEDBACK_CACHE_DIR/<sha256>``.
+
+Writes go through ``tempfile.mkstemp`` + ``os.replace`` so TruLens's
+concurrent feedback workers never observe a half-written entry.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any
+
+import orjson
+from loguru import logger
+
+from src.core.config import settings
+
+
+def make_key(model: str, feedback: str, args: tuple[Any, ...]) -> str:
+    """Return the sha256 cache key for one feedback call."""
+    payload = orjson.dumps(
+        [model, feedback, args],
+        default=str,
+        option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+    )
+    return hashlib.sha256(payload).hexdigest()
+
+
+def fetch(key: str) -> Any | None:
+    """Return the cached score for *key*, or ``None`` on a miss."""
+    path = Path(settings.EVAL_FEEDBACK_CACHE_DIR) / key
+    try:
+        with open(path, "rb") as fh:
+            return pickle.load(fh)
+    except FileNotFoundError:
+        return None
+    except Exception as exc:
+        logger.warning("FeedbackCache: Ignoring unreadable entry {} — {}", key, exc)
+        return None
+
+
+def store(key: str, result: Any) -> None:
+    """Atomically write *result* under *key*.  Failures are logged, never raised."""
+    cache_dir = Path(settings.EVAL_FEEDBACK_CACHE_DIR)
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                pickle.dump(result, fh)
+            os.replace(tmp_path, cache_dir / key)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except Exception as exc:
+        logger.warning("FeedbackCache: Failed to store entry {} — {}", key, exc)
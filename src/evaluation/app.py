@@ -0,0 +1,58 @@
+"""
+evaluation/app.py
+==================
+The agent wrapped as a TruLens app for the evaluation run.
+
+Kept apart from :mod:`src.evaluation.runner` so the agent bootstrap
+(``build_agent``) stays importable without TruLens, e.g. by
+``scripts/smoke_test.py``.
+"""
+
+from __future__ import annotations
+
+import uuid
+from typing import Any
+
+import orjson
+
+# Patches langchain.schema — must precede the TruLens imports
+from src.evaluation import _compat  # noqa: F401
+
+from trulens.apps.custom import instrument
+
+from src.services.agent.service import AgentService
+
+_TOOL_LOG_JSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+class AgentApp:
+    """
+    The agent as a TruLens ``TruCustomApp``.
+
+    :meth:`query` is the recorded entry point (string in, answer out).  It
+    also passes the run's tool results through :meth:`tool_context`, so the
+    data the answer was built from lands on the record and feedbacks can
+    select it as ``Select.RecordCalls.tool_context.rets`` instead of grading
+    the answer against itself.
+    """
+
+    def __init__(self, agent_service: AgentService) -> None:
+        self._agent_service = agent_service
+
+    @instrument
+    def query(self, query: str) -> str:
+        """
+        Answer *query* on its own conversation thread, so test cases are
+        independent of one another and safe to run concurrently.
+        """
+        result = self._agent_service.invoke(query, thread_id=f"trulens_eval-{uuid.uuid4().hex}")
+        self.tool_context(result.get("tool_log", []))
+        return result.get("final_answer") or ""
+
+    @instrument
+    def tool_context(self, tool_log: list[dict[str, Any]]) -> list[str]:
+        """Return one JSON context chunk per tool call in *tool_log*."""
+        return [
+            orjson.dumps(entry, default=str, option=_TOOL_LOG_JSON_OPTIONS).decode()
+            for entry in tool_log
+        ]
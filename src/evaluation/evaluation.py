@@ -6,54 +6,55 @@ TruLens-based evaluation for the CortexRE LangGraph agent.
 Orchestrates the full evaluation loop:
   1. Load test cases from ``tests/evaluation/ground_truth.json``
   2. Bootstrap the agent via :mod:`src.evaluation.runner`
-  3. Open a TruLens session and wrap the agent with ``TruBasicApp``
+  3. Open a TruLens session and wrap the agent with ``TruCustomApp``
   4. Run each query and collect LLM-graded feedback scores
-  5. Print a summary and persist results to JSON + SQLite
+  5. Print a summary and persist results to JSON / JSONL + SQLite
 
 Usage::
 
-    uv run src/evaluation/evaluation.py [--dashboard] [--port 8502]
+    uv run src/evaluation/evaluation.py [--dashboard] [--port 8502] [--no-cache] [--fresh]
 
 Flags::
 
     --dashboard   Launch the TruLens Streamlit dashboard after evaluation.
     --port PORT   Dashboard port (default: 8502).
+    --no-cache    Re-grade every answer instead of reusing cached feedback scores.
+    --fresh       Wipe the TruLens database before running instead of adding
+                  this run to the recorded history.
 """
 
 from __future__ import annotations
 
 import pandas as pd
 import argparse
+import asyncio
 import json
 import math
 import os
+import subprocess
 import sys
+from functools import lru_cache
+from importlib.resources import files
 from pathlib import Path
-from types import ModuleType
-from typing import Any
+from typing import Any, TextIO
 
-# ---- LangChain 0.3 Migration Bridge ------------------------------------------
-# TruLens 1.3.0 still relies on the legacy 'langchain.schema' namespace for
-# some providers. We monkey-patch it here to map to langchain_core.
-try:
-    import langchain.schema  # noqa: F401
-except ImportError:
-    import langchain_core.outputs
-    schema = ModuleType("langchain.schema")
-    sys.modules["langchain.schema"] = schema
-    schema.Generation = langchain_core.outputs.Generation
-# ------------------------------------------------------------------------------
+# Patches langchain.schema — must precede the TruLens imports
+from src.evaluation import _compat  # noqa: F401
 
+import sqlalchemy as sa
 from loguru import logger
 
 from src.core.config import settings
-from src.evaluation.feedbacks import build_feedbacks
+from src.evaluation.feedbacks import CachedOpenAI, build_feedbacks
 from src.evaluation.ground_truth import load_or_generate
-from src.evaluation.runner import build_agent, make_invoke_fn
+from src.evaluation.rate_limit import estimate_tokens
+from src.evaluation.app import AgentApp
+from src.evaluation.runner import build_agent
+from src.services.llm.rate_limit import TokenBucket
 
 try:
     from trulens.core import TruSession
-    from trulens.apps.basic import TruBasicApp
+    from trulens.apps.custom import TruCustomApp
     from trulens.providers.openai import OpenAI as TruOpenAI
 except ImportError as exc:
     logger.error(
@@ -63,20 +64,196 @@ except ImportError as exc:
     raise SystemExit(1) from exc
 
 _ROOT = Path(__file__).resolve().parent.parent.parent
+_SQLITE_BUSY_TIMEOUT = 30.0  # seconds a writer waits for SQLite's write lock
+
+
+@lru_cache(maxsize=2)
+def _provider_and_feedbacks(api_key: str, use_cache: bool = True) -> tuple[TruOpenAI, list[Any]]:
+    """
+    Return the TruLens provider and its feedback functions for *api_key*.
+
+    Cached so repeated ``run_evaluation`` calls in one process reuse the
+    provider's HTTP client instead of re-initialising it each run.  With
+    *use_cache* the provider also reuses on-disk scores for answers it has
+    already graded.
+    """
+    provider_cls = CachedOpenAI if use_cache else TruOpenAI
+    provider = provider_cls(api_key=api_key)
+    return provider, build_feedbacks(provider)
+
+
+def _sqlite_engine(db_path: Path) -> sa.Engine:
+    """
+    Return a SQLAlchemy engine for the TruLens SQLite database in WAL mode.
+
+    WAL lets the dashboard and ``get_records_and_feedback`` read while
+    feedback workers are still writing, and ``synchronous=NORMAL`` drops
+    the per-commit fsync that WAL makes unnecessary.
+
+    SQLite still allows one writer at a time.  TruLens writes each record
+    from inside the instrumented call (on the case's worker thread) and
+    each feedback result from its own executor threads, so the writers are
+    serialised by SQLite's lock: ``_SQLITE_BUSY_TIMEOUT`` makes them queue
+    for it instead of failing with "database is locked".
+    """
+    engine = sa.create_engine(
+        f"sqlite:///{db_path}",
+        connect_args={"timeout": _SQLITE_BUSY_TIMEOUT},
+    )
+
+    @sa.event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_conn: Any, _record: Any) -> None:
+        cursor = dbapi_conn.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
+
+    return engine
+
+
+def _launch_dashboard(db_path: Path, port: int) -> int:
+    """
+    Start the TruLens dashboard in its own session and return its PID.
+
+    ``run_dashboard`` keeps non-daemon listener threads attached to the
+    Streamlit child, so the evaluation process could never exit.  This runs
+    the same Leaderboard page detached: the CLI returns at once and the
+    dashboard outlives it.
+    """
+    leaderboard = files("trulens.dashboard") / "Leaderboard.py"
+    proc = subprocess.Popen(
+        [
+            sys.executable, "-m", "streamlit", "run",
+            "--server.headless=true",
+            f"--server.port={port}",
+            str(leaderboard),
+            "--",
+            "--database-url", f"sqlite:///{db_path}",
+        ],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    return proc.pid
+
+
+def _run_case(tru_app: TruCustomApp, case: dict[str, Any]) -> dict[str, Any]:
+    """Run one test case under a TruLens recording and return its result entry."""
+    query = case["query"]
+    with tru_app as recording:
+        response = tru_app.app.query(query)
+    rec = recording.get()
+    return {
+        "query": query,
+        "response": response,
+        "record_id": rec.record_id,
+        "expected": case.get("expected_values"),
+        "expected_intent": case.get("expected_intent"),
+    }
+
+
+async def _run_cases(
+    tru_app: TruCustomApp,
+    ground_truth: list[dict[str, Any]],
+    max_concurrency: int,
+    bucket: TokenBucket,
+    sink: TextIO,
+) -> tuple[list[str], list[dict[str, Any]]]:
+    """
+    Run every test case, at most *max_concurrency* at a time and within the
+    RPM / TPM budget tracked by *bucket*.
+
+    Each case is I/O-bound on LLM round-trips, so cases overlap in worker
+    threads; TruLens tracks recordings per context, and ``to_thread`` gives
+    every case its own copy.  Each result is appended to *sink* as one JSON
+    line the moment its case completes, so a crash mid-run loses nothing
+    already finished.
+
+    Returns:
+        ``(record_ids, errors)`` — record IDs in ground-truth order.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    total = len(ground_truth)
+
+    async def _run(i: int, case: dict[str, Any]) -> tuple[str | None, dict | None]:
+        query = case["query"]
+        async with semaphore:
+            await bucket.acquire(estimate_tokens(query, settings.EVAL_TOKENS_PER_QUERY))
+            logger.info("[{}/{}] {}", i, total, query)
+            try:
+                result = await asyncio.to_thread(_run_case, tru_app, case)
+            except Exception as exc:
+                logger.exception("Failed on query {!r}: {}", query, exc)
+                return None, {"query": query, "error": str(exc)}
+        # Back on the event loop thread — writes never interleave
+        sink.write(json.dumps(result) + "\n")
+        sink.flush()
+        return result["record_id"], None
+
+    outcomes = await asyncio.gather(
+        *(_run(i, case) for i, case in enumerate(ground_truth, start=1))
+    )
+    record_ids = [rid for rid, _ in outcomes if rid is not None]
+    errors = [error for _, error in outcomes if error is not None]
+    return record_ids, errors
+
+
+def _enrich_results(results_path: Path, records: pd.DataFrame, feedback_col_names: list[str]) -> None:
+    """
+    Attach each record's feedback scores to its line in *results_path*.
+
+    The file is streamed line by line into a sibling temp file that then
+    replaces it, so memory stays flat however many cases were run.
+    """
+    if "record_id" not in records.columns:
+        logger.error("'record_id' column missing from TruLens records dataframe!")
+        return
+
+    logger.debug("Records columns: {}", list(records.columns))
+    # One hash-indexed pass over the records instead of a mask scan per result
+    cols = [col for col in feedback_col_names if col in records.columns]
+    frame = (
+        records.drop_duplicates("record_id")
+        .set_index("record_id")[cols]
+        .apply(pd.to_numeric, errors="coerce")
+    )
+    # NA / None / NaN all become None in one vectorised mask
+    scores = frame.astype(object).where(frame.notna(), None).to_dict("index")
+
+    tmp_path = results_path.with_suffix(".jsonl.tmp")
+    with open(results_path) as src, open(tmp_path, "w") as dst:
+        for line in src:
+            res = json.loads(line)
+            rid = res.get("record_id")
+            if not rid:
+                logger.warning("No record_id found for query: {}", res.get("query"))
+            elif rid in scores:
+                res["feedback"] = scores[rid]
+            dst.write(json.dumps(res) + "\n")
+    os.replace(tmp_path, results_path)
 
 
 # ---------------------------------------------------------------------------
 # Evaluation
 # ---------------------------------------------------------------------------
 
-def run_evaluation(dashboard: bool = False, port: int = 8502) -> None:
+def run_evaluation(
+    dashboard: bool = False,
+    port: int = 8502,
+    use_cache: bool = True,
+    fresh: bool = False,
+) -> None:
     """
     Run the full TruLens evaluation pipeline.
 
     Args:
         dashboard: If ``True``, launch the TruLens Streamlit dashboard on
-                   completion.
+                   completion (detached — this call still returns).
         port: Port for the TruLens dashboard (default: 8502).
+        use_cache: Reuse cached feedback scores for unchanged answers.
+        fresh: Wipe the TruLens database first; otherwise this run's records
+               are added to those of earlier runs.
     """
     # ---- Load ground truth ---------------------------------------------------
     gt_path = _ROOT / "tests" / "evaluation" / "ground_truth.json"
@@ -85,56 +262,40 @@ def run_evaluation(dashboard: bool = False, port: int = 8502) -> None:
 
     # ---- Services ------------------------------------------------------------
     logger.info("Initialising agent services...")
-    agent_service = build_agent()
-    invoke_fn = make_invoke_fn(agent_service)
+    agent_app = AgentApp(build_agent())
 
     # ---- TruLens session -----------------------------------------------------
     db_path = _ROOT / "tests" / "evaluation" / "trulens.sqlite"
     db_path.parent.mkdir(parents=True, exist_ok=True)
     logger.info("Opening TruLens session at {}", db_path)
-    session = TruSession(database_url=f"sqlite:///{db_path}")
-    session.reset_database()  # fresh run; remove this line to accumulate runs
+    session = TruSession(database_engine=_sqlite_engine(db_path))
+    if fresh:
+        session.reset_database()
 
     # ---- Provider + feedbacks ------------------------------------------------
-    provider = TruOpenAI(api_key=settings.OPENAI_API_KEY)
-    feedbacks = build_feedbacks(provider)
+    _, feedbacks = _provider_and_feedbacks(settings.OPENAI_API_KEY, use_cache)
 
     # ---- Wrap the agent ------------------------------------------------------
-    tru_app = TruBasicApp(
-        invoke_fn,
+    tru_app = TruCustomApp(
+        agent_app,
         app_name="CortexRE Agent",
         app_version="1.0",
         feedbacks=feedbacks,
     )
 
     # ---- Evaluation loop -----------------------------------------------------
-    logger.info("Starting evaluation over {} queries...", len(ground_truth))
-    errors: list[dict] = []
-    query_results: list[dict] = []
-    record_ids: list[str] = []
-
-    for i, case in enumerate(ground_truth, start=1):
-        import time
-        if i > 1:
-            time.sleep(4)  # stay under the 30K TPM rate limit
-
-        query = case["query"]
-        logger.info("[{}/{}] {}", i, len(ground_truth), query)
-        try:
-            with tru_app as recording:
-                response = tru_app.app(query)
-            rec = recording.get()
-            record_ids.append(rec.record_id)
-            query_results.append({
-                "query": query,
-                "response": response,
-                "record_id": rec.record_id,
-                "expected": case.get("expected_values"),
-                "expected_intent": case.get("expected_intent"),
-            })
-        except Exception as exc:
-            logger.exception("Failed on query {!r}: {}", query, exc)
-            errors.append({"query": query, "error": str(exc)})
+    logger.info(
+        "Starting evaluation over {} queries (concurrency {})...",
+        len(ground_truth), settings.EVAL_MAX_CONCURRENCY,
+    )
+    bucket = TokenBucket(rpm=settings.EVAL_RPM, tpm=settings.EVAL_TPM)
+    report_path = _ROOT / "tests" / "evaluation" / "trulens_report.json"
+    results_path = report_path.with_suffix(".jsonl")
+    # Per-query results cover this run only, whatever the database holds
+    with open(results_path, "w") as sink:
+        record_ids, errors = asyncio.run(
+            _run_cases(tru_app, ground_truth, settings.EVAL_MAX_CONCURRENCY, bucket, sink)
+        )
 
     # ---- Wait for feedback ---------------------------------------------------
     if record_ids:
@@ -152,8 +313,10 @@ def run_evaluation(dashboard: bool = False, port: int = 8502) -> None:
 
     # ---- Results -------------------------------------------------------------
     records, feedback_col_names = session.get_records_and_feedback(
-        app_ids=["CortexRE Agent"]
+        app_ids=[tru_app.app_id]
     )
+    # Earlier runs stay in the database — score this run's records only
+    records = records[records["record_id"].isin(record_ids)]
 
     print("\n" + "=" * 60)
     print("TRULENS EVALUATION REPORT")
@@ -171,50 +334,30 @@ def run_evaluation(dashboard: bool = False, port: int = 8502) -> None:
     print("=" * 60)
 
     # ---- Enrich query results with feedback scores ---------------------------
-    logger.debug("Enriching {} results with feedback scores...", len(query_results))
-    if query_results:
-        logger.debug("First query result keys: {}", query_results[0].keys())
-    logger.debug("Records columns: {}", list(records.columns))
-
-    for res in query_results:
-        rid = res.get("record_id")
-        if not rid:
-            logger.warning("No record_id found for query: {}", res.get("query"))
-            continue
-
-        if "record_id" not in records.columns:
-            logger.error("'record_id' column missing from TruLens records dataframe!")
-            break
-
-        matching_rows = records[records["record_id"] == rid]
-        if not matching_rows.empty:
-            row = matching_rows.iloc[0]
-            res["feedback"] = {
-                col: float(row[col]) if not isinstance(row[col], (type(pd.NA), type(None))) and not (isinstance(row[col], float) and math.isnan(row[col])) else None
-                for col in feedback_col_names if col in row.index
-            }
+    logger.debug("Enriching {} results with feedback scores...", len(record_ids))
+    _enrich_results(results_path, records, feedback_col_names)
 
     # ---- Save JSON report ----------------------------------------------------
-    report_path = _ROOT / "tests" / "evaluation" / "trulens_report.json"
     with open(report_path, "w") as fh:
         json.dump(
             {
                 "total_cases": len(ground_truth),
                 "errors": len(errors),
                 "overall_feedback_scores": summary,
-                "query_results": query_results,
+                "query_results_path": results_path.name,
                 "error_details": errors,
             },
             fh,
             indent=2,
         )
+    logger.info("Per-query results saved to {}", results_path)
     logger.info("Report saved to {}", report_path)
     logger.info("TruLens traces saved to {}", db_path)
 
     # ---- Optional dashboard --------------------------------------------------
     if dashboard:
-        logger.info("Launching TruLens dashboard on port {}...", port)
-        session.run_dashboard(port=port)
+        pid = _launch_dashboard(db_path, port)
+        logger.info("TruLens dashboard started on http://localhost:{} (pid {})", port, pid)
 
 
 # ---------------------------------------------------------------------------
@@ -236,5 +379,20 @@ if __name__ == "__main__":
         default=int(os.getenv("TRULENS_DASHBOARD_PORT", "8502")),
         help="Dashboard port (default: 8502).",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-grade every answer instead of reusing cached feedback scores.",
+    )
+    parser.add_argument(
+        "--fresh",
+        action="store_true",
+        help="Wipe the TruLens database before running instead of adding to its history.",
+    )
     args = parser.parse_args()
-    run_evaluation(dashboard=args.dashboard, port=args.port)
+    run_evaluation(
+        dashboard=args.dashboard,
+        port=args.port,
+        use_cache=not args.no_cache,
+        fresh=args.fresh,
+    )
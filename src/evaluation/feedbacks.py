@@ -6,28 +6,97 @@ TruLens feedback function definitions for the CortexRE agent.
 Provides three LLM-graded signals:
 
 * **Answer Relevance** — does the answer address the user's question?
-* **Groundedness** — is the answer supported by the retrieved data?
-* **Context Relevance** — is the context passed to the LLM on-topic?
+* **Groundedness** — is the answer supported by the tool results?
+* **Context Relevance** — is each tool result on-topic for the question?
+
+The tool results are read from the record's ``tool_context`` call (see
+:class:`src.evaluation.app.AgentApp`).
+
+``CachedOpenAI`` is a drop-in provider that memoises those scores on disk
+(see :mod:`src.evaluation._feedback_cache`).
 """
 
 from __future__ import annotations
 
-import sys
-from types import ModuleType
+from typing import Any, Callable
 
-# ---- LangChain 0.3 Migration Bridge ------------------------------------------
-try:
-    import langchain.schema  # noqa: F401
-except ImportError:
-    import langchain_core.outputs
-    schema = ModuleType("langchain.schema")
-    sys.modules["langchain.schema"] = schema
-    schema.Generation = langchain_core.outputs.Generation
-# ------------------------------------------------------------------------------
+# Patches langchain.schema — must precede the TruLens imports
+from src.evaluation import _compat  # noqa: F401
 
-from trulens.core import Feedback
+from trulens.core import Feedback, Select
 from trulens.providers.openai import OpenAI as TruOpenAI
 
+from src.evaluation import _feedback_cache
+
+# Return value of AgentApp.tool_context — one JSON chunk per tool call
+_TOOL_CONTEXT = Select.RecordCalls.tool_context.rets
+
+
+class CachedOpenAI(TruOpenAI):
+    """
+    TruLens ``OpenAI`` provider whose graded scores are cached on disk.
+
+    The overrides keep the parent signatures verbatim — TruLens maps
+    feedback selectors onto parameter names by introspection.
+    """
+
+    def _cached(self, feedback: str, args: tuple[Any, ...], compute: Callable[[], Any]) -> Any:
+        key = _feedback_cache.make_key(self.model_engine, feedback, args)
+        result = _feedback_cache.fetch(key)
+        if result is None:
+            result = compute()
+            _feedback_cache.store(key, result)
+        return result
+
+    def relevance(
+        self,
+        prompt: str,
+        response: str,
+        criteria: str | None = None,
+        examples: list[str] | None = None,
+        min_score_val: int = 0,
+        max_score_val: int = 3,
+        temperature: float = 0.0,
+    ) -> float:
+        args = (prompt, response, criteria, examples, min_score_val, max_score_val, temperature)
+        return self._cached("relevance", args, lambda: super(CachedOpenAI, self).relevance(*args))
+
+    def context_relevance(
+        self,
+        question: str,
+        context: str,
+        criteria: str | None = None,
+        examples: list[str] | None = None,
+        min_score_val: int = 0,
+        max_score_val: int = 3,
+        temperature: float = 0.0,
+    ) -> float:
+        args = (question, context, criteria, examples, min_score_val, max_score_val, temperature)
+        return self._cached(
+            "context_relevance", args, lambda: super(CachedOpenAI, self).context_relevance(*args)
+        )
+
+    def groundedness_measure_with_cot_reasons(
+        self,
+        source: str,
+        statement: str,
+        criteria: str | None = None,
+        examples: str | None = None,
+        groundedness_configs: Any | None = None,
+        min_score_val: int = 0,
+        max_score_val: int = 3,
+        temperature: float = 0.0,
+    ) -> tuple[float, dict]:
+        args = (
+            source, statement, criteria, examples, groundedness_configs,
+            min_score_val, max_score_val, temperature,
+        )
+        return self._cached(
+            "groundedness_measure_with_cot_reasons",
+            args,
+            lambda: super(CachedOpenAI, self).groundedness_measure_with_cot_reasons(*args),
+        )
+
 
 def build_feedbacks(provider: TruOpenAI) -> list[Feedback]:
     """
@@ -38,7 +107,7 @@ def build_feedbacks(provider: TruOpenAI) -> list[Feedback]:
 
     Returns:
         A list of three configured ``Feedback`` objects ready to be passed to
-        ``TruBasicApp``.
+        ``TruCustomApp``.
     """
     f_answer_relevance = (
         Feedback(provider.relevance, name="Answer Relevance")
@@ -50,16 +119,16 @@ def build_feedbacks(provider: TruOpenAI) -> list[Feedback]:
             provider.groundedness_measure_with_cot_reasons,
             name="Groundedness",
         )
+        .on(_TOOL_CONTEXT[:].collect())
         .on_output()
-        .on_output()
-        .aggregate(lambda scores: sum(scores) / len(scores) if scores else 0.0)
+        .aggregate(lambda scores: sum(scores) / len(scores) if len(scores) else 0.0)
     )
 
     f_context_relevance = (
         Feedback(provider.context_relevance, name="Context Relevance")
         .on_input()
-        .on_output()
-        .aggregate(lambda scores: sum(scores) / len(scores) if scores else 0.0)
+        .on(_TOOL_CONTEXT[:])
+        .aggregate(lambda scores: sum(scores) / len(scores) if len(scores) else 0.0)
     )
 
     return [f_answer_relevance, f_groundedness, f_context_relevance]
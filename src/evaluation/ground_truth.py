@@ -10,15 +10,20 @@ cases are always consistent with the actual data.
 from __future__ import annotations
 
 import json
+from itertools import product
 from pathlib import Path
 
 import pandas as pd
+import pyarrow.dataset as ds
 from loguru import logger
 
 from src.core.config import settings
 from src.services.portfolio.asset_manager import AssetManagerAssistant
 from src.services.portfolio.normalization import OVERHEAD_PROPERTY, normalize_data
 
+# The only raw columns the expected values are computed from
+_GROUND_TRUTH_COLUMNS = ["property_name", "month", "ledger_type", "profit"]
+
 
 def generate_ground_truth(output_path: Path, max_properties: int | None = None) -> list[dict]:
     """
@@ -36,11 +41,13 @@ def generate_ground_truth(output_path: Path, max_properties: int | None = None)
     """
     logger.info("Generating ground truth from data at {}", settings.DATA_PATH)
 
-    raw_df = pd.read_parquet(settings.DATA_PATH)
-    df = normalize_data(raw_df)
-
-    if "date" in df.columns and "year" not in df.columns:
-        df["year"] = df["date"].dt.year
+    # Project and filter inside the parquet scan.  Rows without a property
+    # are overhead (see normalize_data), which no test case includes.
+    table = ds.dataset(settings.DATA_PATH, format="parquet").to_table(
+        columns=_GROUND_TRUTH_COLUMNS,
+        filter=ds.field("property_name").is_valid(),
+    )
+    df = normalize_data(table.to_pandas())
 
     assistant = AssetManagerAssistant(df)
 
@@ -55,19 +62,34 @@ def generate_ground_truth(output_path: Path, max_properties: int | None = None)
     years = sorted(df["year"].dropna().astype(int).unique().tolist())
     ground_truth = []
 
-    # P&L queries — all property × year combinations
-    for prop in properties:
-        for year in years:
-            pl = assistant.get_property_pl(prop, year)
-            ground_truth.append({
-                "query": f"What was the revenue and NOI for {prop} in {year}?",
-                "expected_intent": "pl_analysis",
-                "expected_entities": {"property_names": [prop], "year": year},
-                "expected_values": {
-                    "revenue": float(pl["revenue"]),
-                    "noi": float(pl["noi"]),
-                },
-            })
+    # P&L queries — all property × year combinations, summed in one grouped
+    # pass (same figures as get_property_pl; combinations with no rows are 0)
+    cells = list(product(properties, years))
+    pl_table = (
+        df[df["property_name"].isin(properties) & df["year"].notna()]
+        .assign(year=lambda d: d["year"].astype(int))
+        .groupby(["property_name", "year", "ledger_type"], observed=True)["profit"]
+        .sum()
+        .unstack("ledger_type", fill_value=0)
+        .reindex(
+            index=pd.MultiIndex.from_tuples(cells, names=["property_name", "year"]),
+            columns=["revenue", "expenses"],
+            fill_value=0,
+        )
+    )
+    revenues = pl_table["revenue"].tolist()
+    expenses = pl_table["expenses"].tolist()
+
+    for (prop, year), revenue, expense in zip(cells, revenues, expenses):
+        ground_truth.append({
+            "query": f"What was the revenue and NOI for {prop} in {year}?",
+            "expected_intent": "pl_analysis",
+            "expected_entities": {"property_names": [prop], "year": year},
+            "expected_values": {
+                "revenue": float(revenue),
+                "noi": float(revenue + expense),
+            },
+        })
 
     # Price comparison
     top_prop = assistant.compare_properties("noi").index[0]
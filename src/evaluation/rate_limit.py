@@ -0,0 +1,20 @@
+"""
+evaluation/rate_limit.py
+=========================
+Token cost estimate for throttling concurrent evaluation runs.
+
+The limiter itself is :class:`~src.services.llm.rate_limit.TokenBucket`,
+shared with the LLM service.
+"""
+
+from __future__ import annotations
+
+
+def estimate_tokens(query: str, per_query_budget: int) -> int:
+    """
+    Rough token cost of evaluating *query*.
+
+    ~4 characters per token for the query itself, plus a fixed budget for
+    the agent's prompts, tool results, and the graded feedback calls.
+    """
+    return len(query) // 4 + per_query_budget
@@ -9,22 +9,27 @@ place so it does not need to be repeated across evaluation entry points.
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 from src.core.config import settings
 from src.services.agent.service import AgentService
 from src.services.llm.service import LLMService
 from src.services.portfolio.service import PortfolioService
 
 
+@lru_cache(maxsize=1)
 def build_agent() -> AgentService:
     """
     Initialise and return a fully-compiled ``AgentService``.
 
     Mirrors the service bootstrap performed in the FastAPI lifespan so the
-    evaluation environment is identical to production.
+    evaluation environment is identical to production.  Cached: repeated
+    evaluation runs in one process reuse the loaded dataset and compiled
+    graph (every test case runs on its own conversation thread, so sharing
+    the ``MemorySaver`` checkpointer is safe).
 
     Returns:
-        A ready-to-use ``AgentService`` with a compiled LangGraph and a
-        fresh ``MemorySaver`` checkpointer.
+        A ready-to-use ``AgentService`` with a compiled LangGraph.
     """
     portfolio_service = PortfolioService(data_path=settings.DATA_PATH)
     portfolio_service.initialize()
@@ -38,23 +43,3 @@ def build_agent() -> AgentService:
     agent_service.initialize()
     return agent_service
 
-
-def make_invoke_fn(agent_service: AgentService):
-    """
-    Return a ``(query: str) -> str`` callable wrapping ``AgentService.invoke``.
-
-    TruLens's ``TruBasicApp`` expects a simple string-in / string-out function,
-    so this adapter extracts ``final_answer`` from the full agent state dict.
-
-    Args:
-        agent_service: A fully-initialised ``AgentService``.
-
-    Returns:
-        A plain callable suitable for wrapping with ``TruBasicApp``.
-    """
-    def invoke(query: str) -> str:
-        result = agent_service.invoke(query, thread_id="trulens_eval")
-        return result.get("final_answer") or ""
-
-    invoke.__name__ = "cortexre_agent"
-    return invoke
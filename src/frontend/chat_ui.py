@@ -11,53 +11,103 @@ from __future__ import annotations
 
 import os
 import uuid
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 
-import time
-
+import orjson
 import requests
 import streamlit as st
 from loguru import logger
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # ---------------------------------------------------------------------------
 # Backend configuration
 # ---------------------------------------------------------------------------
 
 _API_BASE = os.getenv("API_BASE_URL", "http://localhost:8000")
-_QUERY_URL = f"{_API_BASE}/query"
+_QUERY_URL = f"{_API_BASE}/query/stream"
 _TIMEOUT   = int(os.getenv("API_TIMEOUT_SECONDS", "60"))
 
+# Characters Streamlit markdown would otherwise interpret ("$" starts LaTeX)
+_MARKDOWN_ESCAPES = str.maketrans({"$": "\\$"})
+
+
+@st.cache_resource
+def _http_session() -> requests.Session:
+    """
+    Return the process-wide HTTP session for backend calls.
 
-def _post_query(query: str, thread_id: str | None = None) -> dict:
+    Pooled keep-alive connections spare every query a fresh TCP (and TLS)
+    handshake.  Only idempotent requests (the health probe) are retried on
+    a gateway error; ``POST /query`` never is, as the agent is not idempotent.
     """
-    POST ``{"query": query}`` to the FastAPI backend and return the
-    parsed JSON response dict.
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.3,
+            status_forcelist=[502, 503, 504],
+            raise_on_status=False,
+        ),
+    )
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+@st.cache_resource
+def _io_executor() -> ThreadPoolExecutor:
+    """Return the process-wide pool for backend calls overlapped with rendering."""
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="chat-io")
+
+
+@st.cache_data(ttl=10, show_spinner=False)
+def _check_health() -> int | None:
+    """
+    Probe ``/health`` and return its status code, or ``None`` when the
+    backend is unreachable.
+
+    Cached for 10 seconds: every widget interaction reruns the script, and
+    the banner does not need a fresh round-trip each time.
+    """
+    try:
+        return _http_session().get(f"{_API_BASE}/health", timeout=3).status_code
+    except requests.ConnectionError:
+        return None
+
+
+def _stream_query(query: str, thread_id: str | None = None) -> Iterator[dict]:
+    """
+    POST ``{"query": query}`` to the backend's streaming endpoint and yield
+    each server-sent event as a dict, as soon as it arrives.
+
+    The backend sends one ``step`` event per process step as the graph runs,
+    then a ``result`` (or ``error``) event carrying the outcome.
 
     Raises:
         requests.HTTPError  – non-2xx response from the backend.
         requests.ConnectionError – backend is unreachable.
-        requests.Timeout    – backend took longer than ``_TIMEOUT`` seconds.
+        requests.Timeout    – backend went silent for ``_TIMEOUT`` seconds.
     """
     logger.info("Sending query to API | url={} query={!r}", _QUERY_URL, query)
-    resp = requests.post(
+    with _http_session().post(
         _QUERY_URL,
-        json={"query": query, "thread_id": thread_id},
+        # Only step labels are shown, so skip the raw tool results
+        json={"query": query, "thread_id": thread_id, "include_step_data": False},
         timeout=_TIMEOUT,
-    )
-    resp.raise_for_status()
-    data = resp.json()
-    logger.info(
-        "API response received | intent={} entities={}",
-        data.get("intent"),
-        data.get("entities"),
-    )
-    return data
-
-
-def _stream_text(text: str):
-    """Yield words from text with a small delay to simulate streaming."""
-    for word in text.split(" "):
-        yield word + " "
-        time.sleep(0.05)
+        stream=True,
+    ) as resp:
+        if not resp.ok:
+            # Load the error body now: the caller reads its ``detail`` from
+            # the HTTPError after this block has released the connection
+            _ = resp.content
+            resp.raise_for_status()
+        for line in resp.iter_lines():
+            if line.startswith(b"data: "):
+                yield orjson.loads(line[6:])
 
 
 # ---------------------------------------------------------------------------
@@ -76,22 +126,10 @@ def render_chat_tab():
 
     st.subheader("Asset Management Assistant")
 
-    # ---------------------------------------------------------------------------
-    # API connectivity banner
-    # ---------------------------------------------------------------------------
-    try:
-        health = requests.get(f"{_API_BASE}/health", timeout=3)
-        if health.status_code != 200:
-            st.warning(
-                f"Backend returned status {health.status_code}. "
-                "Queries may fail."
-            )
-    except requests.ConnectionError:
-        st.error(
-            f"Cannot reach the backend at **{_API_BASE}**. "
-            "Start the FastAPI server (`make run`) and refresh this page."
-        )
-        return
+    # Probe the backend in the background while the history renders; the
+    # banner placeholder keeps its slot above the chat
+    health_future = _io_executor().submit(_check_health)
+    banner = st.empty()
 
     # ---------------------------------------------------------------------------
     # Chat history and response container
@@ -103,6 +141,22 @@ def render_chat_tab():
             with st.chat_message(msg["role"]):
                 st.markdown(msg["content"])
 
+    # ---------------------------------------------------------------------------
+    # API connectivity banner
+    # ---------------------------------------------------------------------------
+    health_status = health_future.result()
+    if health_status is None:
+        banner.error(
+            f"Cannot reach the backend at **{_API_BASE}**. "
+            "Start the FastAPI server (`make run`) and refresh this page."
+        )
+        return
+    if health_status != 200:
+        banner.warning(
+            f"Backend returned status {health_status}. "
+            "Queries may fail."
+        )
+
     # ---------------------------------------------------------------------------
     # Input
     # ---------------------------------------------------------------------------
@@ -121,19 +175,25 @@ def render_chat_tab():
         # 2. Assistant response
         with chat_container:
             with st.chat_message("assistant"):
-                with st.spinner("Thinking..."):
-                    answer = None
+                answer = None
+                with st.status("Thinking...") as status:
                     try:
-                        data = _post_query(query, thread_id=st.session_state["thread_id"])
-                        answer = data.get("answer") or "I could not generate a response."
+                        for event in _stream_query(query, thread_id=st.session_state["thread_id"]):
+                            if event["event"] == "step":
+                                status.write(event["step"].get("message", ""))
+                            elif event["event"] == "result":
+                                answer = event.get("answer") or "I could not generate a response."
+                            elif event["event"] == "error":
+                                logger.error("Agent error from backend | query={!r} detail={}", query, event.get("detail"))
+                                answer = f"The agent failed to answer: {event.get('detail')}"
                     except requests.HTTPError as exc:
-                        status = exc.response.status_code if exc.response is not None else "?"
+                        status_code = exc.response.status_code if exc.response is not None else "?"
                         try:
                             detail = exc.response.json().get("detail", str(exc))
                         except Exception:
                             detail = str(exc)
-                        logger.error("HTTP {} error from backend | query={!r} detail={}", status, query, detail)
-                        answer = f"The backend returned an error (HTTP {status}): {detail}"
+                        logger.error("HTTP {} error from backend | query={!r} detail={}", status_code, query, detail)
+                        answer = f"The backend returned an error (HTTP {status_code}): {detail}"
 
                     except requests.ConnectionError:
                         logger.error("Connection error – backend unreachable | url={}", _QUERY_URL)
@@ -147,8 +207,10 @@ def render_chat_tab():
                         logger.exception("Unexpected error | query={!r}: {}", query, exc)
                         answer = f"An unexpected error occurred: {exc}"
 
+                    status.update(label="Done", state="complete", expanded=False)
+
                 if answer:
-                    answer = answer.replace("$", "\\$")
-                    st.write_stream(_stream_text(answer))
+                    answer = answer.translate(_MARKDOWN_ESCAPES)
+                    st.markdown(answer)
 
         st.session_state["messages"].append({"role": "assistant", "content": answer})
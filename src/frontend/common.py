@@ -11,11 +11,14 @@ directly for fast, interactive visualisations.
 from __future__ import annotations
 
 import glob
+import os
 import sys
 from pathlib import Path
 
 import pandas as pd
+import pyarrow.parquet as pq
 import streamlit as st
+from loguru import logger
 
 # Make src/ importable when running `streamlit run src/frontend/app.py`
 _SRC  = Path(__file__).resolve().parent.parent
@@ -25,16 +28,118 @@ if str(_ROOT) not in sys.path:
 
 from src.services.portfolio.normalization import normalize_data  # noqa: E402
 
+# Raw columns the EDA tab reads (``month`` becomes ``date`` on normalization)
+_EDA_COLUMNS = [
+    "property_name", "tenant_name", "ledger_type", "ledger_group",
+    "ledger_category", "ledger_description", "profit", "month",
+]
+# Low-cardinality strings the EDA tab needs beyond those normalize_data
+# already stores as categoricals
+_CATEGORICAL_COLUMNS = ["ledger_type", "ledger_group"]
+
+# Normalized frames persisted across restarts, keyed by source name and mtime.
+# Bump the version whenever the columns or normalization change.
+_CACHE_DIR = _ROOT / "data" / ".cache"
+_CACHE_VERSION = 4
+
+
+def _dataset_path() -> str | None:
+    parquet_files = glob.glob(str(_ROOT / "data" / "*.parquet"))
+    return parquet_files[0] if parquet_files else None
+
+
+def dataset_key() -> str:
+    """
+    Identify the dataset by path and modification time.
+
+    Pass it to ``st.cache_data`` helpers that take the frame as an unhashed
+    ``_df`` argument, so their results are dropped when the file changes.
+    """
+    path = _dataset_path()
+    return f"{path}:{os.stat(path).st_mtime_ns}" if path else ""
+
 
 @st.cache_resource(show_spinner="Loading dataset …")
 def load_dataframe() -> pd.DataFrame:
     """
     Load and normalise the parquet dataset once per Streamlit session.
     Used only by the EDA tab — the chat tab talks to the FastAPI backend.
+
+    ``cache_resource`` (not ``cache_data``) hands every rerun the same
+    frame instead of unpickling a fresh copy; the EDA tab never mutates it.
+    Only the columns the tab uses are loaded, with repeated strings as
+    categoricals — group by them with ``observed=True``.
     """
-    parquet_files = glob.glob(str(_ROOT / "data" / "*.parquet"))
-    if not parquet_files:
+    path = _dataset_path()
+    if path is None:
         st.error("No parquet file found in `data/`. Please add the dataset and restart.")
         st.stop()
 
-    return normalize_data(pd.read_parquet(parquet_files[0]))
+    stem = Path(path).stem
+    cache_path = _CACHE_DIR / f"{stem}.{os.stat(path).st_mtime_ns}.v{_CACHE_VERSION}.parquet"
+    if cache_path.exists():
+        try:
+            return _read_parquet(cache_path)
+        except Exception as exc:
+            logger.warning("Ignoring unreadable dataset cache {}: {}", cache_path, exc)
+
+    # Read only the EDA columns, then normalize
+    present = set(pq.read_schema(path).names)
+    df = normalize_data(_read_parquet(path, columns=[c for c in _EDA_COLUMNS if c in present]))
+    # After normalization, which strips whitespace from these columns first
+    df = df.astype({c: "category" for c in _CATEGORICAL_COLUMNS if c in df.columns})
+
+    _write_cache(df, cache_path, stem)
+    return df
+
+
+@st.cache_data(show_spinner=False)
+def dataset_missing_pct(data_key: str) -> float:
+    """
+    Percentage of null cells across every column of the source parquet file.
+
+    Taken from the row-group null counts in the file footer, so columns the
+    EDA tab never loads still count.  A column written without statistics
+    is read on its own and its nulls counted by Arrow.  ``data_key`` (see
+    :func:`dataset_key`) ties the cached value to the file version.
+    """
+    path = _dataset_path()
+    if path is None:
+        return 0.0
+    parquet_file = pq.ParquetFile(path)
+    meta = parquet_file.metadata
+    cells = meta.num_rows * meta.num_columns
+    if cells == 0:
+        return 0.0
+
+    nulls = 0
+    for i in range(meta.num_columns):
+        stats = [meta.row_group(rg).column(i).statistics for rg in range(meta.num_row_groups)]
+        if all(s is not None and s.has_null_count for s in stats):
+            nulls += sum(s.null_count for s in stats)
+        else:
+            column = meta.schema.column(i).path
+            nulls += parquet_file.read(columns=[column]).column(0).null_count
+    return nulls / cells * 100
+
+
+def _read_parquet(path: str | Path, columns: list[str] | None = None) -> pd.DataFrame:
+    # Memory-map the file and release Arrow buffers as columns are converted,
+    # so the data is never held twice
+    table = pq.read_table(path, columns=columns, memory_map=True)
+    return table.to_pandas(split_blocks=True, self_destruct=True)
+
+
+def _write_cache(df: pd.DataFrame, cache_path: Path, stem: str) -> None:
+    """Persist *df* at *cache_path* and drop older caches of source *stem*."""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # Write then rename, so a concurrent session never reads a partial file
+        tmp_path = cache_path.with_suffix(".tmp")
+        df.to_parquet(tmp_path, compression="zstd")
+        os.replace(tmp_path, cache_path)
+        for stale in cache_path.parent.glob(f"{stem}.*.parquet"):
+            if stale != cache_path:
+                stale.unlink(missing_ok=True)
+    except OSError as exc:
+        logger.warning("Could not write dataset cache {}: {}", cache_path, exc)
@@ -2,162 +2,275 @@
 frontend/eda_ui.py
 ==================
 EDA interface components for the Streamlit frontend.
+
+Every aggregate is computed by a ``st.cache_data`` helper keyed on the
+dataset key and the current selection, so widget-triggered reruns reuse
+the results instead of regrouping the whole frame.
 """
 
 from __future__ import annotations
 
+from typing import Any
+
+import pandas as pd
 import streamlit as st
 
+from src.frontend.common import dataset_key, dataset_missing_pct
+
+_ALL_PROPERTIES = "All Properties (Portfolio View)"
+_TABLE_PAGE_ROWS = 500  # rows sent to the browser per "load more" step
+
+
+def _select(df: pd.DataFrame, selected_property: str) -> pd.DataFrame:
+    if selected_property == _ALL_PROPERTIES:
+        return df
+    return df[df['property_name'] == selected_property]
+
+
+def _split_ledger(df: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Split *df* into its revenue and expense rows, masked once for every aggregate."""
+    ledger_type = df['ledger_type']
+    return df[ledger_type == 'revenue'], df[ledger_type == 'expenses']
+
+
+def _ledger_group_expenses(exp_df: pd.DataFrame) -> pd.Series | None:
+    if 'ledger_group' not in exp_df.columns:
+        return None
+    return (
+        exp_df
+        .groupby('ledger_group', observed=True)['profit']
+        .sum()
+        .abs()
+        .sort_values(ascending=False)
+    )
+
+
+# The frame is passed as ``_df`` so Streamlit does not hash it on every
+# rerun; ``data_key`` stands in for it in the cache key.
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _portfolio_aggregates(_df: pd.DataFrame, data_key: str) -> dict[str, Any]:
+    """Selection-independent metrics and portfolio-wide comparisons."""
+    df = _df
+    rev_df, exp_df = _split_ledger(df)
+    rev_per_prop = rev_df.groupby('property_name', observed=True)['profit'].sum()
+    exp_per_prop = exp_df.groupby('property_name', observed=True)['profit'].sum().abs()
+
+    prop_perf = df.groupby('property_name', observed=True)['profit'].sum().sort_values(ascending=False).reset_index()
+    prop_perf.columns = ['Property', 'NOI']
+
+    return {
+        "property_count": df['property_name'].nunique(),
+        "properties": sorted([p for p in df['property_name'].dropna().unique() if p and p != 'None']),
+        "year_range": (df['date'].min().year, df['date'].max().year),
+        "prop_perf": prop_perf.set_index('Property').head(10).round(2),
+        "oer_per_prop": (exp_per_prop / rev_per_prop * 100).dropna().sort_values(ascending=False),
+    }
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _property_aggregates(_df: pd.DataFrame, data_key: str, selected_property: str) -> dict[str, Any]:
+    """Totals, charts, and breakdowns for the selected property (or all)."""
+    display_df = _select(_df, selected_property)
+    rev_df, exp_df = _split_ledger(display_df)
+
+    # One reshape, indexed by date as the area chart wants it
+    monthly = display_df.pivot_table(
+        index='date', columns='ledger_type', values='profit',
+        aggfunc='sum', fill_value=0, observed=True,
+    )
+    monthly['NOI'] = monthly.get('revenue', 0) + monthly.get('expenses', 0)
+    chart_data = monthly.rename(columns={'revenue': 'Revenue', 'expenses': 'Expenses'})
+
+    tenant_df = rev_df.groupby('tenant_name', observed=True)['profit'].sum().sort_values(ascending=False).reset_index()
+    tenant_df.columns = ['Tenant', 'Total Revenue']
+    tenant_df = tenant_df[tenant_df['Tenant'].notna() & (tenant_df['Tenant'] != 'None')]
+
+    aggregates: dict[str, Any] = {
+        "total_revenue": rev_df['profit'].sum(),
+        "total_expenses": exp_df['profit'].sum(),
+        "chart_data": chart_data,
+        "top_tenants": tenant_df.set_index('Tenant').head(10).round(2),
+        "lg_expenses": _ledger_group_expenses(exp_df),
+    }
+    if selected_property == _ALL_PROPERTIES:
+        return aggregates
+
+    if 'tenant_name' in display_df.columns:
+        aggregates["tenant_rev"] = (
+            rev_df[rev_df['tenant_name'].notna() & (rev_df['tenant_name'] != 'N/A')]
+            .groupby('tenant_name', observed=True)['profit']
+            .sum()
+            .sort_values(ascending=False)
+            .reset_index()
+            .rename(columns={'tenant_name': 'Tenant', 'profit': 'Revenue'})
+        )
+
+    cat_col = 'ledger_category' if 'ledger_category' in display_df.columns else None
+    if cat_col:
+        aggregates["top_exp"] = (
+            exp_df
+            .groupby(cat_col, observed=True)['profit']
+            .sum()
+            .sort_values()  # most negative first
+            .head(5)
+            .abs()
+            .reset_index()
+            .rename(columns={cat_col: 'Category', 'profit': 'Total Expense'})
+        )
+    return aggregates
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _expense_drilldown(_df: pd.DataFrame, data_key: str, selected_property: str, drill_level: str) -> pd.Series:
+    """Top-10 expense totals for the selection at the chosen ledger level."""
+    display_df = _select(_df, selected_property)
+    exp_df = display_df[display_df['ledger_type'] == 'expenses']
+    return exp_df.groupby(drill_level, observed=True)['profit'].sum().abs().sort_values(ascending=False).head(10)
+
+
+# Widgets that only restyle one chart live in fragments: changing them
+# reruns that fragment alone, not the whole app.
+
+@st.fragment
+def _performance_chart(chart_data: pd.DataFrame) -> None:
+    chart_cols = ['Revenue', 'Expenses', 'NOI']
+    available_cols = [c for c in chart_cols if c in chart_data.columns]
+
+    selected_cols = st.multiselect(
+        "Select metrics to display",
+        options=available_cols,
+        default=available_cols,
+        key="metric_selector"
+    )
+
+    if not chart_data.empty:
+        if selected_cols:
+            st.area_chart(chart_data[selected_cols].round(2))
+        else:
+            st.info("Please select at least one metric to display the chart.")
+    else:
+        st.warning("No time-series data available for selection.")
+
+
+@st.fragment
+def _drilldown_chart(df: pd.DataFrame, data_key: str, selected_property: str) -> None:
+    drill_level = st.selectbox("Detail level", ["ledger_group", "ledger_category", "ledger_description"])
+    exp_breakdown = _expense_drilldown(df, data_key, selected_property, drill_level)
+    if not exp_breakdown.empty:
+        st.bar_chart(exp_breakdown.round(2))
+    else:
+        st.info("No expense records found.")
+
+
+@st.fragment
+def _data_table(df: pd.DataFrame, selected_property: str) -> None:
+    # Streamlit serializes a frame even inside a collapsed expander, so rows
+    # are only sent once asked for, one page at a time
+    if not st.toggle("Show rows", key="show_data_table"):
+        return
+    display_df = _select(df, selected_property)
+    if st.session_state.get("data_table_for") != selected_property:
+        st.session_state["data_table_for"] = selected_property
+        st.session_state["data_table_rows"] = _TABLE_PAGE_ROWS
+    rows = st.session_state["data_table_rows"]
+
+    st.dataframe(display_df.head(rows).round(2), width="stretch")
+    if rows < len(display_df):
+        st.caption(f"Showing the first {rows:,} of {len(display_df):,} rows.")
+        if st.button("Load more", key="data_table_more"):
+            st.session_state["data_table_rows"] = rows + _TABLE_PAGE_ROWS
+            st.rerun(scope="fragment")
+
+
 def render_eda_tab(df):
     st.subheader("Exploratory Data Analysis")
-    
+
+    data_key = dataset_key()
+    portfolio = _portfolio_aggregates(df, data_key)
+
     c1, c2, c3 = st.columns(3)
     c1.metric("Total Records", len(df))
-    missing_pct = (df.isnull().sum().sum() / (len(df) * len(df.columns))) * 100
-    c2.metric("Missing Values", f"{missing_pct:.2f}%")
-    unique_props = df['property_name'].nunique()
-    c3.metric("Properties Count", unique_props)
+    c2.metric(
+        "Missing Values", f"{dataset_missing_pct(data_key):.2f}%",
+        help="Share of empty cells across all columns of the source file, before normalization.",
+    )
+    c3.metric("Properties Count", portfolio['property_count'])
 
     st.divider()
 
-    properties = sorted([p for p in df['property_name'].unique() if p and p != 'None'])
-    selected_property = st.selectbox("Focus on specific property", ["All Properties (Portfolio View)"] + properties)
-    
-    if selected_property == "All Properties (Portfolio View)":
-        display_df = df
-        is_all = True
-    else:
-        display_df = df[df['property_name'] == selected_property]
-        is_all = False
+    selected_property = st.selectbox("Focus on specific property", [_ALL_PROPERTIES] + portfolio['properties'])
+    is_all = selected_property == _ALL_PROPERTIES
+    view = _property_aggregates(df, data_key, selected_property)
 
-    total_revenue = display_df.loc[display_df['ledger_type'] == 'revenue', 'profit'].sum()
-    total_expenses = display_df.loc[display_df['ledger_type'] == 'expenses', 'profit'].sum()
+    total_revenue = view['total_revenue']
+    total_expenses = view['total_expenses']
     total_noi = total_revenue + total_expenses
-    
+
     k1, k2, k3 = st.columns(3)
     if is_all:
-        k1.metric("Total Properties", df['property_name'].nunique())
+        k1.metric("Total Properties", portfolio['property_count'])
     else:
         k1.metric("Property Name", selected_property)
-        
+
     k2.metric("Total Net Operating Income (NOI)", f"{total_noi:,.2f}")
-    
+
     if is_all:
-        k3.metric("Data Range", f"{df['date'].min().year} - {df['date'].max().year}")
+        first_year, last_year = portfolio['year_range']
+        k3.metric("Data Range", f"{first_year} - {last_year}")
     else:
         oer = (abs(total_expenses) / total_revenue * 100) if total_revenue != 0 else 0
         k3.metric("Operating Expense Ratio (OER)", f"{oer:.2f}%")
 
     with st.expander(f"### {'Portfolio' if is_all else selected_property} Performance Over Time"):
-        monthly = display_df.groupby(['date', 'ledger_type'])['profit'].sum().unstack(fill_value=0).reset_index()
-        monthly['NOI'] = monthly.get('revenue', 0) + monthly.get('expenses', 0)
-        
-        chart_data = monthly.rename(columns={'revenue': 'Revenue', 'expenses': 'Expenses'})
-        chart_cols = ['Revenue', 'Expenses', 'NOI']
-        available_cols = [c for c in chart_cols if c in chart_data.columns]
-        
-        selected_cols = st.multiselect(
-            "Select metrics to display",
-            options=available_cols,
-            default=available_cols,
-            key="metric_selector"
-        )
-        
-        if not monthly.empty:
-            if selected_cols:
-                st.area_chart(chart_data.set_index('date')[selected_cols].round(2))
-            else:
-                st.info("Please select at least one metric to display the chart.")
-        else:
-            st.warning("No time-series data available for selection.")
+        _performance_chart(view['chart_data'])
+
 
-    
     with st.expander("### Top Tenants by Revenue"):
-        tenant_df = display_df[display_df['ledger_type'] == 'revenue'].groupby('tenant_name')['profit'].sum().sort_values(ascending=False).reset_index()
-        tenant_df.columns = ['Tenant', 'Total Revenue']
-        tenant_df = tenant_df[tenant_df['Tenant'].notna() & (tenant_df['Tenant'] != 'None')]
-        if not tenant_df.empty:
-            st.bar_chart(tenant_df.set_index('Tenant').head(10).round(2))
+        top_tenants = view['top_tenants']
+        if not top_tenants.empty:
+            st.bar_chart(top_tenants)
         else:
             st.info("No tenant-specific revenue records found.")
-        
+
 
     with st.expander("### Ledger Drill-down (Expenses)"):
-        drill_level = st.selectbox("Detail level", ["ledger_group", "ledger_category", "ledger_description"])
-        exp_breakdown = display_df[display_df['ledger_type'] == 'expenses'].groupby(drill_level)['profit'].sum().abs().sort_values(ascending=False).head(10)
-        if not exp_breakdown.empty:
-            st.bar_chart(exp_breakdown.round(2))
-        else:
-            st.info("No expense records found.")
+        _drilldown_chart(df, data_key, selected_property)
 
+    lg_title = "### Expense Breakdown by Ledger Group"
     if is_all:
         with st.expander("### Portfolio-wide Comparisons"):
             c1, c2 = st.columns(2)
 
             with c1:
                 st.write("**Net Operating Income by Property**")
-                prop_perf = df.groupby('property_name')['profit'].sum().sort_values(ascending=False).reset_index()
-                prop_perf.columns = ['Property', 'NOI']
-                st.bar_chart(prop_perf.set_index('Property').head(10).round(2))
+                st.bar_chart(portfolio['prop_perf'])
 
             with c2:
                 st.write("**Efficiency (Operating Expense Ratio) by Property**")
-                rev_per_prop = df[df['ledger_type'] == 'revenue'].groupby('property_name')['profit'].sum()
-                exp_per_prop = df[df['ledger_type'] == 'expenses'].groupby('property_name')['profit'].sum().abs()
-                oer_per_prop = (exp_per_prop / rev_per_prop * 100).dropna().sort_values(ascending=False)
+                oer_per_prop = portfolio['oer_per_prop']
                 if not oer_per_prop.empty:
                     st.bar_chart(oer_per_prop.head(10).round(2))
                 else:
                     st.info("Insufficient data for Operating Expense Ratio comparison.")
-
-        with st.expander("### Expense Breakdown by Ledger Group"):
-            if 'ledger_group' not in display_df.columns:
-                st.info("Ledger group data not available.")
-            else:
-                lg_expenses = (
-                    display_df[display_df['ledger_type'] == 'expenses']
-                    .groupby('ledger_group')['profit']
-                    .sum()
-                    .abs()
-                    .sort_values(ascending=False)
-                )
-                if not lg_expenses.empty:
-                    st.bar_chart(lg_expenses.round(2))
-                else:
-                    st.info("No expense records found for ledger group breakdown.")
-
     else:
-        with st.expander(f"### Expense Breakdown by Ledger Group — {selected_property}"):
-            if 'ledger_group' not in display_df.columns:
-                st.info("Ledger group data not available.")
-            else:
-                lg_expenses = (
-                    display_df[display_df['ledger_type'] == 'expenses']
-                    .groupby('ledger_group')['profit']
-                    .sum()
-                    .abs()
-                    .sort_values(ascending=False)
-                )
-                if not lg_expenses.empty:
-                    st.bar_chart(lg_expenses.round(2))
-                else:
-                    st.info("No expense records found for ledger group breakdown.")
+        lg_title = f"{lg_title} — {selected_property}"
+
+    with st.expander(lg_title):
+        lg_expenses = view['lg_expenses']
+        if lg_expenses is None:
+            st.info("Ledger group data not available.")
+        elif not lg_expenses.empty:
+            st.bar_chart(lg_expenses.round(2))
+        else:
+            st.info("No expense records found for ledger group breakdown.")
 
+    if not is_all:
         with st.expander(f"### Tenant Revenue — {selected_property}"):
-            if 'tenant_name' in display_df.columns:
-                tenant_rev = (
-                    display_df[
-                        (display_df['ledger_type'] == 'revenue') &
-                        display_df['tenant_name'].notna() &
-                        (display_df['tenant_name'] != 'N/A')
-                    ]
-                    .groupby('tenant_name')['profit']
-                    .sum()
-                    .sort_values(ascending=False)
-                    .reset_index()
-                    .rename(columns={'tenant_name': 'Tenant', 'profit': 'Revenue'})
-                )
+            if 'tenant_rev' in view:
+                tenant_rev = view['tenant_rev']
                 if not tenant_rev.empty:
+                    # Small per-tenant table — a Styler keeps the "1,234.56" grouping
                     st.dataframe(tenant_rev.style.format({'Revenue': '{:,.2f}'}), use_container_width=True)
                 else:
                     st.info("No tenant revenue data for this property.")
@@ -165,18 +278,8 @@ def render_eda_tab(df):
                 st.info("Tenant data not available in this dataset.")
 
         with st.expander(f"### Top Expense Drivers — {selected_property}"):
-            cat_col = 'ledger_category' if 'ledger_category' in display_df.columns else None
-            if cat_col:
-                top_exp = (
-                    display_df[display_df['ledger_type'] == 'expenses']
-                    .groupby(cat_col)['profit']
-                    .sum()
-                    .sort_values()  # most negative first
-                    .head(5)
-                    .abs()
-                    .reset_index()
-                    .rename(columns={cat_col: 'Category', 'profit': 'Total Expense'})
-                )
+            if 'top_exp' in view:
+                top_exp = view['top_exp']
                 if not top_exp.empty:
                     st.dataframe(top_exp.style.format({'Total Expense': '{:,.2f}'}), use_container_width=True)
                 else:
@@ -185,4 +288,4 @@ def render_eda_tab(df):
                 st.info("Ledger category data not available.")
 
     with st.expander(f"View {'Normalized' if is_all else 'Property'} Data Table"):
-        st.dataframe(display_df.round(2), width="stretch")
+        _data_table(df, selected_property)
@@ -8,14 +8,18 @@ and global exception handlers.
 
 from __future__ import annotations
 
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import AsyncExitStack, asynccontextmanager
 
+import httpx
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from loguru import logger
 
 from src.services.portfolio.service import PortfolioService
 from src.services.agent.service import AgentService
+from src.services.agent.checkpoint import open_checkpointer
 from src.services.llm.service import LLMService
 from src.api.endpoints import router as api_router
 from src.api.exceptions import register_exception_handlers
@@ -33,33 +37,68 @@ async def lifespan(app: FastAPI):
     exactly once on startup and attaches them to the app state.
     """
     logger.info("Starting up CortexRE Asset Management Agent...")
-    
-    try:
-        # Initialize Portfolio Service (Data Layer)
-        portfolio_service = PortfolioService(data_path=settings.DATA_PATH)
-        portfolio_service.initialize()
-        
-        # Initialize LLM Service (all OpenAI interactions)
-        llm_service = LLMService()
-
-        # Initialize Agent Service (Logic/Persistence Layer)
-        agent_service = AgentService(portfolio_service=portfolio_service, llm_service=llm_service)
-        agent_service.initialize()
-        
-        # Attach to app state for Dependency Injection
-        app.state.portfolio_service = portfolio_service
-        app.state.llm_service = llm_service
-        app.state.agent_service = agent_service
-        
-        logger.info("All services initialized and ready.")
-    except Exception as exc:
-        logger.exception(f"Startup failed: {exc}")
-        # In a production environment, we might want to halt startup here.
-        # For this prototype, we rely on the Exception Handlers to report errors down the line.
-
-    yield
-
-    logger.info("Shutting down service.")
+
+    async with AsyncExitStack() as stack:
+        # One keep-alive pool for every outbound LLM call
+        http_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(60.0, connect=5.0),
+            limits=httpx.Limits(max_keepalive_connections=50, max_connections=100),
+        )
+        stack.push_async_callback(http_client.aclose)
+        app.state.http_client = http_client
+        try:
+            import litellm
+        except ImportError:
+            pass  # every LLM call raises LLMUnavailableError anyway
+        else:
+            # LiteLLM hands this client to the provider SDKs it wraps. The
+            # previous session is restored before the client is closed, so
+            # later calls in this process never reach a closed client
+            stack.callback(setattr, litellm, "aclient_session", litellm.aclient_session)
+            litellm.aclient_session = http_client
+
+        try:
+            # Initialize Portfolio Service (Data Layer)
+            portfolio_service = PortfolioService(data_path=settings.DATA_PATH)
+
+            # Initialize LLM Service (all OpenAI interactions)
+            llm_service = LLMService()
+
+            # Load the dataset in a worker thread while the checkpointer
+            # connects; conversation checkpoints close with the stack on shutdown
+            checkpointer, _ = await asyncio.gather(
+                stack.enter_async_context(
+                    open_checkpointer(
+                        settings.CHECKPOINTER,
+                        settings.CHECKPOINT_DB,
+                        pool_size=settings.CHECKPOINT_POOL_SIZE,
+                    )
+                ),
+                asyncio.to_thread(portfolio_service.initialize),
+            )
+
+            # Initialize Agent Service (Logic/Persistence Layer)
+            agent_service = AgentService(
+                portfolio_service=portfolio_service,
+                llm_service=llm_service,
+                checkpointer=checkpointer,
+            )
+            agent_service.initialize()
+
+            # Attach to app state for Dependency Injection
+            app.state.portfolio_service = portfolio_service
+            app.state.llm_service = llm_service
+            app.state.agent_service = agent_service
+
+            logger.info("All services initialized and ready.")
+        except Exception as exc:
+            logger.exception(f"Startup failed: {exc}")
+            # In a production environment, we might want to halt startup here.
+            # For this prototype, we rely on the Exception Handlers to report errors down the line.
+
+        yield
+
+        logger.info("Shutting down service.")
 
 
 def create_app() -> FastAPI:
@@ -81,6 +120,9 @@ def create_app() -> FastAPI:
         allow_methods=["*"],
         allow_headers=["*"],
     )
+    # Starlette leaves text/event-stream uncompressed, so /query/stream
+    # events are never held back in the compressor's buffer
+    app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
     # Exception Handlers
     register_exception_handlers(app)
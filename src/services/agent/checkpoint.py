@@ -0,0 +1,80 @@
+"""
+services/agent/checkpoint.py
+=============================
+Builds the conversational checkpointer selected by ``settings.CHECKPOINTER``.
+
+``memory`` keeps checkpoints in-process (single worker only); ``sqlite`` and
+``postgres`` persist them so several workers or replicas can serve the same
+``thread_id``.  The durable savers are async — the graph is only driven
+through ``ainvoke`` / ``astream`` — and their drivers are optional installs.
+"""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.checkpoint.memory import MemorySaver
+from loguru import logger
+
+from src.services.agent.exceptions import CheckpointerUnavailableError
+
+
+@asynccontextmanager
+async def open_checkpointer(
+    kind: str,
+    conn_string: str,
+    pool_size: int = 10,
+) -> AsyncIterator[BaseCheckpointSaver]:
+    """
+    Open the checkpointer of *kind* and close its connections on exit.
+
+    Args:
+        kind: ``"memory"``, ``"sqlite"``, or ``"postgres"``.
+        conn_string: SQLite file path, or Postgres connection URL.
+        pool_size: Maximum pooled Postgres connections.
+
+    Raises:
+        CheckpointerUnavailableError: If the saver's package is not installed.
+    """
+    if kind == "memory":
+        yield MemorySaver()
+        return
+
+    if kind == "sqlite":
+        try:
+            from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+        except ImportError as exc:
+            raise CheckpointerUnavailableError(
+                "langgraph-checkpoint-sqlite is not installed. Run: uv add langgraph-checkpoint-sqlite"
+            ) from exc
+        logger.info("Opening SQLite checkpointer at {}", conn_string)
+        async with AsyncSqliteSaver.from_conn_string(conn_string) as saver:
+            yield saver
+        return
+
+    if kind == "postgres":
+        try:
+            from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
+            from psycopg.rows import dict_row
+            from psycopg_pool import AsyncConnectionPool
+        except ImportError as exc:
+            raise CheckpointerUnavailableError(
+                "langgraph-checkpoint-postgres is not installed. "
+                "Run: uv add langgraph-checkpoint-postgres 'psycopg[pool]'"
+            ) from exc
+        logger.info("Opening Postgres checkpointer (pool of up to {} connections)", pool_size)
+        # Connection settings the saver requires of every pooled connection
+        async with AsyncConnectionPool(
+            conn_string,
+            max_size=pool_size,
+            open=False,
+            kwargs={"autocommit": True, "prepare_threshold": 0, "row_factory": dict_row},
+        ) as pool:
+            saver = AsyncPostgresSaver(pool)
+            await saver.setup()
+            yield saver
+        return
+
+    raise ValueError(f"Unknown checkpointer kind: {kind!r}")
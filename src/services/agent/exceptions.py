@@ -24,3 +24,8 @@ class AgentInvocationError(AgentError):
             f"Agent execution failed: {detail}",
             status_code=status.HTTP_502_BAD_GATEWAY
         )
+
+class CheckpointerUnavailableError(AgentError):
+    """Raised when the configured checkpointer's package is not installed."""
+    def __init__(self, detail: str):
+        super().__init__(detail, status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
@@ -6,12 +6,16 @@ Manages the compiled LangGraph agent and conversational checkpointing.
 
 from __future__ import annotations
 
+import asyncio
 import json
+from collections.abc import AsyncIterator
 from typing import Any
 
 from loguru import logger
 from langgraph.graph.state import CompiledStateGraph
+from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.checkpoint.memory import MemorySaver
+from langgraph.types import Overwrite
 
 from src.services.portfolio.service import PortfolioService
 from src.services.llm.service import LLMService
@@ -22,19 +26,24 @@ class AgentService:
     """
     Manages the LangGraph agent instance and its conversational state.
 
-    Uses a ``MemorySaver`` checkpointer for multi-turn session persistence.
-    This can be swapped for ``PostgresSaver`` in a fully scaled environment.
+    Uses a ``MemorySaver`` checkpointer for multi-turn session persistence
+    unless another one is passed in.  The graph is only ever driven through
+    ``ainvoke`` / ``astream``, so a database-backed replacement should be an
+    async saver (e.g. ``AsyncPostgresSaver`` over a connection pool) — a sync
+    saver would block the event loop on every checkpoint write.  The app
+    builds it with :func:`~src.services.agent.checkpoint.open_checkpointer`.
     """
 
     def __init__(
         self,
         portfolio_service: PortfolioService,
         llm_service: LLMService,
+        checkpointer: BaseCheckpointSaver | None = None,
     ) -> None:
         self.portfolio_service = portfolio_service
         self.llm_service = llm_service
         self._graph: CompiledStateGraph | None = None
-        self._checkpointer = MemorySaver()
+        self._checkpointer = checkpointer if checkpointer is not None else MemorySaver()
 
     def initialize(self) -> None:
         """Compile the agent workflow graph with the checkpointer."""
@@ -47,18 +56,38 @@ class AgentService:
                 llm_service=self.llm_service,
                 checkpointer=self._checkpointer,
             )
-            logger.info("AgentService initialized successfully with MemorySaver persistence.")
+            logger.info(
+                "AgentService initialized successfully with {} persistence.",
+                type(self._checkpointer).__name__,
+            )
         except Exception as exc:
             logger.exception("Failed to compile agent workflow graph")
             raise GraphNotInitializedError() from exc
 
+    @property
+    def is_initialized(self) -> bool:
+        """``True`` once :meth:`initialize` has compiled the workflow graph."""
+        return self._graph is not None
+
     @property
     def graph(self) -> CompiledStateGraph:
         if self._graph is None:
             raise GraphNotInitializedError()
         return self._graph
 
-    def invoke(self, query: str, thread_id: str) -> dict[str, Any]:
+    @staticmethod
+    def _turn_input(query: str) -> dict[str, Any]:
+        """Graph input for a new turn on an existing (or fresh) thread."""
+        # steps / draft_history have append reducers — Overwrite resets them per turn
+        return {
+            "query": query,
+            "revision_count": 0,
+            "critique": None,
+            "steps": Overwrite([]),
+            "draft_history": Overwrite([]),
+        }
+
+    async def ainvoke(self, query: str, thread_id: str) -> dict[str, Any]:
         """Run the agent graph for a specific session thread.
 
         Args:
@@ -72,23 +101,109 @@ class AgentService:
             AgentInvocationError: If the graph raises any exception during execution.
         """
         config = {"configurable": {"thread_id": thread_id}}
-        logger.info(f"AgentService: Running graph for thread {thread_id!r} | query={query!r}")
+        logger.info("AgentService: Running graph for thread {!r} | query={!r}", thread_id, query)
         try:
-            result = self.graph.invoke(
-                {"query": query, "revision_count": 0, "critique": None, "steps": [], "draft_history": []},
-                config=config,
-            )
+            result = await self.graph.ainvoke(self._turn_input(query), config=config)
             
             # # Log high-level outcome without dumping massive state dicts
             # blocked = result.get("blocked", False)
             # revisions = result.get("revision_count", 0)
             # answer_len = len(result.get("final_answer", ""))
             
-            # Log internal steps for observability
+            # Log internal steps for observability — dumped only if DEBUG is enabled
             if result.get("steps"):
-                logger.debug(f"AgentService: Intermediate steps for thread {thread_id!r}:\n{json.dumps(result['steps'], indent=2, default=str)}")
+                logger.opt(lazy=True).debug(
+                    "AgentService: Intermediate steps for thread {!r}:\n{}",
+                    lambda: thread_id,
+                    lambda: json.dumps(result["steps"], indent=2, default=str),
+                )
 
             return result
         except Exception as exc:
             logger.exception("AgentService: Error during agent invocation for thread {}", thread_id)
             raise AgentInvocationError(str(exc)) from exc
+
+    async def ainvoke_batch(
+        self,
+        requests: list[tuple[str, str]],
+    ) -> list[dict[str, Any] | AgentInvocationError]:
+        """Run several ``(query, thread_id)`` turns through the graph at once.
+
+        The turns go through one ``graph.abatch`` call, so their LLM
+        round-trips overlap on the shared connection pool instead of queueing.
+
+        Returns:
+            One entry per request, in order: the final ``AgentState`` dict, or
+            an ``AgentInvocationError`` if that turn failed.  A failing turn
+            does not abort the others.
+
+        Raises:
+            ValueError: If a thread appears twice — its turns would race on
+                the same checkpoint.
+        """
+        thread_ids = [thread_id for _, thread_id in requests]
+        if len(set(thread_ids)) != len(thread_ids):
+            raise ValueError("ainvoke_batch needs a distinct thread_id per request")
+
+        logger.info("AgentService: Running graph for a batch of {} threads", len(requests))
+        outcomes = await self.graph.abatch(
+            [self._turn_input(query) for query, _ in requests],
+            config=[{"configurable": {"thread_id": thread_id}} for thread_id in thread_ids],
+            return_exceptions=True,
+        )
+
+        results: list[dict[str, Any] | AgentInvocationError] = []
+        for thread_id, outcome in zip(thread_ids, outcomes):
+            if isinstance(outcome, Exception):
+                logger.opt(exception=outcome).error(
+                    "AgentService: Error during agent invocation for thread {}", thread_id
+                )
+                error = AgentInvocationError(str(outcome))
+                error.__cause__ = outcome
+                outcome = error
+            results.append(outcome)
+        return results
+
+    async def astream(self, query: str, thread_id: str) -> AsyncIterator[dict[str, Any]]:
+        """Run the agent graph, yielding progress as each node finishes.
+
+        Yields one ``{"event": "step", "step": {...}}`` per process step as
+        soon as its node completes, then a closing ``{"event": "result", ...}``
+        carrying ``answer``, ``blocked`` and ``block_reason``.
+
+        Raises:
+            AgentInvocationError: If the graph raises any exception during execution.
+        """
+        config = {"configurable": {"thread_id": thread_id}}
+        logger.info("AgentService: Streaming graph for thread {!r} | query={!r}", thread_id, query)
+        outcome: dict[str, Any] = {}
+        try:
+            async for chunk in self.graph.astream(
+                self._turn_input(query), config=config, stream_mode="updates"
+            ):
+                for update in chunk.values():
+                    if not update:
+                        continue
+                    for key in ("final_answer", "blocked", "block_reason"):
+                        if key in update:
+                            outcome[key] = update[key]
+                    for step in update.get("steps", ()):
+                        yield {"event": "step", "step": step}
+        except Exception as exc:
+            logger.exception("AgentService: Error during agent streaming for thread {}", thread_id)
+            raise AgentInvocationError(str(exc)) from exc
+
+        yield {
+            "event": "result",
+            "answer": outcome.get("final_answer") or "No answer could be generated.",
+            "blocked": outcome.get("blocked", False),
+            "block_reason": outcome.get("block_reason"),
+        }
+
+    def invoke(self, query: str, thread_id: str) -> dict[str, Any]:
+        """Blocking wrapper around :meth:`ainvoke` for synchronous callers.
+
+        The graph nodes are coroutines, so this spins up a private event loop.
+        Must not be called from inside a running loop — use :meth:`ainvoke`.
+        """
+        return asyncio.run(self.ainvoke(query, thread_id))
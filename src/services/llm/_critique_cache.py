@@ -0,0 +1,85 @@
+"""
+services/llm/_critique_cache.py
+================================
+Content-addressed disk cache for critique results.
+
+Grading the same draft for the same question against the same tool log is
+deterministic enough (``LLM_TEMPERATURE`` defaults to 0) that a repeat LLM
+call is pure waste.  Results are pickled to
+``CRITIQUE_CACHE_DIR/<sha256>`` and expire after
+``CRITIQUE_CACHE_TTL_SECONDS`` (judged by file mtime).
+
+Writes go through ``tempfile.mkstemp`` + ``os.replace`` so a concurrent
+reader never observes a half-written entry.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+import orjson
+from loguru import logger
+
+from src.core.config import settings
+
+
+def make_key(query: str, draft_answer: str, tool_log: list[dict[str, Any]], prompt: str) -> str:
+    """
+    Return the sha256 cache key for one critique request.
+
+    *prompt* is the critique system prompt; its hash is part of the key, so
+    editing the prompt retires every grade made under the old wording.
+    """
+    prompt_hash = hashlib.sha256(prompt.encode()).hexdigest()
+    payload = orjson.dumps(
+        {"q": query, "d": draft_answer, "t": tool_log, "model": settings.LLM_MODEL, "p": prompt_hash},
+        default=str,
+        option=orjson.OPT_SORT_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+    )
+    return hashlib.sha256(payload).hexdigest()
+
+
+def _enabled() -> bool:
+    return settings.CRITIQUE_CACHE_TTL_SECONDS > 0
+
+
+def fetch(key: str) -> Any | None:
+    """Return the cached result for *key*, or ``None`` on a miss or expiry."""
+    if not _enabled():
+        return None
+    path = Path(settings.CRITIQUE_CACHE_DIR) / key
+    try:
+        if time.time() - path.stat().st_mtime > settings.CRITIQUE_CACHE_TTL_SECONDS:
+            return None
+        with open(path, "rb") as fh:
+            return pickle.load(fh)
+    except FileNotFoundError:
+        return None
+    except Exception as exc:
+        logger.warning("CritiqueCache: Ignoring unreadable entry {} — {}", key, exc)
+        return None
+
+
+def store(key: str, result: Any) -> None:
+    """Atomically write *result* under *key*.  Failures are logged, never raised."""
+    if not _enabled():
+        return
+    cache_dir = Path(settings.CRITIQUE_CACHE_DIR)
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                pickle.dump(result, fh)
+            os.replace(tmp_path, cache_dir / key)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except Exception as exc:
+        logger.warning("CritiqueCache: Failed to store entry {} — {}", key, exc)
@@ -0,0 +1,100 @@
+"""
+services/llm/_guard_batcher.py
+===============================
+In-process micro-batcher for input-guard checks.
+
+Guard calls are short prompts that spend most of their time on the round-
+trip, so under load several of them can share one LLM call.  The first
+check to arrive opens a window of ``max_wait`` seconds; every check
+queued before it closes (or until ``max_batch`` are waiting) is handed to
+the batch function in one list, and each caller gets back the entry at
+its own index.
+
+Each event loop gets its own window (pending items, flush timer, in-flight
+batches), so a batcher shared by several loops — e.g. one ``LLMService``
+used from the evaluation's worker threads, each running ``asyncio.run`` —
+only ever batches, and resolves, futures of the loop they belong to.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import weakref
+from collections.abc import Awaitable, Callable
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class _Window(Generic[T, R]):
+    """The pending items, flush timer, and in-flight batches of one event loop."""
+
+    def __init__(self) -> None:
+        self.pending: list[tuple[T, asyncio.Future[R]]] = []
+        self.timer: asyncio.TimerHandle | None = None
+        # Keeps in-flight batches referenced until they finish
+        self.tasks: set[asyncio.Task] = set()
+
+
+class MicroBatcher(Generic[T, R]):
+    """
+    Coalesce concurrent :meth:`submit` calls into calls to *batch_fn*.
+
+    *batch_fn* returns one entry per item, in order: the result, or the
+    exception that item's caller should see.
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[list[T]], Awaitable[list[R | Exception]]],
+        *,
+        max_batch: int,
+        max_wait: float,
+    ) -> None:
+        self._batch_fn = batch_fn
+        self._max_batch = max_batch
+        self._max_wait = max_wait
+        # Dropped with their loop; the lock guards lookups from several threads
+        self._windows: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _Window[T, R]] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._windows_lock = threading.Lock()
+
+    async def submit(self, item: T) -> R:
+        """Queue *item* for the next batch of the running loop and wait for its result."""
+        loop = asyncio.get_running_loop()
+        with self._windows_lock:
+            window = self._windows.setdefault(loop, _Window())
+        future: asyncio.Future[R] = loop.create_future()
+        window.pending.append((item, future))
+        if len(window.pending) >= self._max_batch:
+            self._flush(window)
+        elif window.timer is None:
+            window.timer = loop.call_later(self._max_wait, self._flush, window)
+        return await future
+
+    def _flush(self, window: _Window[T, R]) -> None:
+        if window.timer is not None:
+            window.timer.cancel()
+            window.timer = None
+        batch, window.pending = window.pending, []
+        if batch:
+            task = asyncio.get_running_loop().create_task(self._run(batch))
+            window.tasks.add(task)
+            task.add_done_callback(window.tasks.discard)
+
+    async def _run(self, batch: list[tuple[T, asyncio.Future[R]]]) -> None:
+        try:
+            outcomes = await self._batch_fn([item for item, _ in batch])
+        except Exception as exc:
+            outcomes = [exc] * len(batch)
+
+        for (_, future), outcome in zip(batch, outcomes):
+            if future.done():  # the caller was cancelled
+                continue
+            if isinstance(outcome, Exception):
+                future.set_exception(outcome)
+            else:
+                future.set_result(outcome)
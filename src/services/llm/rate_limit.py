@@ -0,0 +1,67 @@
+"""
+services/llm/rate_limit.py
+===========================
+Proactive request/token throttle in front of the LLM provider.
+
+``TokenBucket`` keeps a rolling one-minute log of admitted requests and
+their estimated token cost, and only makes a caller wait when admitting it
+would push the window past the configured RPM or TPM budget.  Small
+prompts therefore run back-to-back instead of idling behind a fixed sleep,
+and a saturated budget queues in-process rather than as provider 429s.
+
+Used by :class:`~src.services.llm.service.LLMService` (``LLM_RPM`` /
+``LLM_TPM``) and by evaluation runs (``EVAL_RPM`` / ``EVAL_TPM``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import deque
+
+
+class TokenBucket:
+    """
+    Rolling-window RPM / TPM limiter shared by concurrent coroutines.
+
+    Admission runs under a ``threading.Lock`` and the wait is an
+    ``asyncio.sleep`` outside it, so one bucket can be shared by several
+    event loops — e.g. the evaluation's worker threads, each driving
+    ``AgentService.invoke`` through its own ``asyncio.run``.
+
+    Args:
+        rpm: Maximum requests admitted per window.
+        tpm: Maximum estimated tokens admitted per window.
+        window: Window length in seconds (default: one minute).
+    """
+
+    def __init__(self, rpm: int, tpm: int, window: float = 60.0) -> None:
+        self._rpm = rpm
+        self._tpm = tpm
+        self._window = window
+        self._entries: deque[tuple[float, int]] = deque()  # (admitted_at, tokens)
+        self._tokens_in_window = 0
+        self._lock = threading.Lock()
+
+    async def acquire(self, tokens: int) -> None:
+        """Wait until a request costing *tokens* fits in the window, then admit it."""
+        # A single request larger than the whole budget still runs — alone
+        tokens = min(tokens, self._tpm)
+        while (delay := self._try_admit(tokens)) is not None:
+            await asyncio.sleep(delay)
+
+    def _try_admit(self, tokens: int) -> float | None:
+        """Admit the request now and return ``None``, or return how long to wait before retrying."""
+        with self._lock:
+            now = time.monotonic()
+            while self._entries and now - self._entries[0][0] >= self._window:
+                self._tokens_in_window -= self._entries.popleft()[1]
+
+            if len(self._entries) < self._rpm and self._tokens_in_window + tokens <= self._tpm:
+                self._entries.append((now, tokens))
+                self._tokens_in_window += tokens
+                return None
+
+            # Saturated — retry once the oldest admission leaves the window
+            return max(self._entries[0][0] + self._window - now, 0.0)
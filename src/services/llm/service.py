@@ -25,22 +25,39 @@ Usage::
     critique      = llm_service.critique_response(query, tool_log, draft)
     # Output validation
     output_result = llm_service.check_output(query, known_properties, answer)
+    # Each method has an awaitable twin (acheck_input, acritique_response,
+    # acheck_output) used by the async graph nodes.
     # The research agent uses llm_service.chat_model directly via create_react_agent
 """
 
 from __future__ import annotations
 
-import json
+import asyncio
+import random
+import re
+import time
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
+import orjson
 from loguru import logger
 
 from src.agents.prompts.loader import load_prompt
 from src.core.config import settings
+from src.services.llm import _critique_cache
+from src.services.llm._guard_batcher import MicroBatcher
+from src.services.llm.rate_limit import TokenBucket
 from src.services.llm.exceptions import LLMInvocationError, LLMUnavailableError
 
 
+# Tool results may carry numpy values or non-string keys — orjson handles
+# both natively instead of falling back to ``default=str``.  Compact, not
+# indented: the model reads it fine and indentation only costs tokens.
+_TOOL_LOG_JSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
 # ---------------------------------------------------------------------------
 # Score weights for the critique agent (accuracy×4, completeness×3, clarity×2, format×1)
 # ---------------------------------------------------------------------------
@@ -52,54 +69,217 @@ _SCORE_WEIGHTS: dict[str, int] = {
     "format": 1,
 }
 
+# The critique prompt emits ``scores`` first; once that object has streamed
+# in, approval is already decided (see ``LLMService._astream_critique``).
+_SCORES_RE = re.compile(r'"scores"\s*:\s*(\{[^{}]*\})')
+
+# An opening fence line (with any language tag) or a closing fence
+_FENCE_RE = re.compile(r"\A```[^\n]*\n|\n?```\s*\Z")
+
+# Deletes every currency symbol in one pass (output-guard pre-pass)
+_CURRENCY_STRIP = str.maketrans("", "", "$€£")
+
+# Keeps fire-and-forget tasks referenced until they finish
+_background_tasks: set[asyncio.Task] = set()
+
+# Retries for rate limits and transient provider errors: exponential backoff
+# with full jitter, so concurrent callers hitting a 429 together do not all
+# come back at the same instant.  ``Retry-After`` wins when the provider sends it.
+_MAX_ATTEMPTS = 5
+_BACKOFF_BASE_SECONDS = 0.5
+_BACKOFF_CAP_SECONDS = 30.0
+_RETRYABLE_STATUS = frozenset({408, 429, 500, 502, 503, 504})
+
+# One client-side RPM/TPM budget per model (see ``LLM_RPM`` / ``LLM_TPM``)
+_buckets: dict[str, TokenBucket] = {}
+
 # ---------------------------------------------------------------------------
 # Internal helpers
 # ---------------------------------------------------------------------------
 
+def _completion_kwargs(
+    messages: list[dict[str, str]],
+    model: str | None,
+    response_format: dict | None,
+) -> dict[str, Any]:
+    """Build the keyword arguments shared by the sync and async LiteLLM calls."""
+    kwargs: dict[str, Any] = {
+        "model": model or settings.LLM_MODEL,
+        "messages": messages,
+        "temperature": settings.LLM_TEMPERATURE,
+        # Retried here instead (see ``_retry_delay``) — not twice
+        "num_retries": 0,
+    }
+    if response_format:
+        kwargs["response_format"] = response_format
+    return kwargs
+
+
+@lru_cache(maxsize=8)
+def _system_message(prompt: str) -> dict[str, str]:
+    """One shared system message per prompt text, so every call sends the same leading dict."""
+    # Keyed on the rendered text, so ``load_prompt.cache_clear()`` still takes effect
+    return {"role": "system", "content": prompt}
+
+
+def _import_litellm() -> Any:
+    """Import ``litellm`` lazily, raising ``LLMUnavailableError`` if missing."""
+    try:
+        import litellm
+    except ImportError as exc:
+        raise LLMUnavailableError(
+            "litellm is not installed. Run: uv add litellm"
+        ) from exc
+    return litellm
+
+
+def _retry_after(exc: Exception) -> float | None:
+    """Seconds from the provider's ``Retry-After`` header on *exc*, if any."""
+    headers = getattr(getattr(exc, "response", None), "headers", None) or getattr(
+        exc, "litellm_response_headers", None
+    )
+    if not headers:
+        return None
+    try:
+        return max(0.0, float(headers.get("retry-after")))
+    except (TypeError, ValueError):
+        return None
+
+
+def _retry_delay(exc: Exception, attempt: int) -> float | None:
+    """Seconds to wait before retrying after *exc*, or ``None`` if it is not retryable."""
+    if getattr(exc, "status_code", None) not in _RETRYABLE_STATUS:
+        return None
+    retry_after = _retry_after(exc)
+    if retry_after is not None:
+        return min(retry_after, _BACKOFF_CAP_SECONDS)
+    return random.uniform(0, min(_BACKOFF_CAP_SECONDS, _BACKOFF_BASE_SECONDS * 2 ** attempt))
+
+
+def _log_retry(exc: Exception, attempt: int, delay: float) -> None:
+    logger.warning(
+        "LLMService: Provider returned {} — retry {}/{} in {:.2f}s",
+        getattr(exc, "status_code", "?"), attempt + 1, _MAX_ATTEMPTS - 1, delay,
+    )
+
+
+def _completion_with_retry(litellm: Any, **kwargs: Any) -> Any:
+    for attempt in range(_MAX_ATTEMPTS):
+        try:
+            return litellm.completion(**kwargs)
+        except Exception as exc:
+            delay = _retry_delay(exc, attempt)
+            if delay is None or attempt == _MAX_ATTEMPTS - 1:
+                raise
+            _log_retry(exc, attempt, delay)
+            time.sleep(delay)
+
+
+def _bucket_for(model: str) -> TokenBucket | None:
+    """The shared rate budget for *model*, or ``None`` when no limit is configured."""
+    if not (settings.LLM_RPM or settings.LLM_TPM):
+        return None
+    if model not in _buckets:
+        # An unset limit is unbounded in practice
+        _buckets[model] = TokenBucket(
+            rpm=settings.LLM_RPM or 1_000_000_000,
+            tpm=settings.LLM_TPM or 1_000_000_000,
+        )
+    return _buckets[model]
+
+
+def _estimate_tokens(messages: list[dict[str, str]]) -> int:
+    """~4 characters per token of prompt text."""
+    return sum(len(m.get("content") or "") for m in messages) // 4
+
+
+async def _acompletion_with_retry(litellm: Any, **kwargs: Any) -> Any:
+    bucket = _bucket_for(kwargs["model"])
+    for attempt in range(_MAX_ATTEMPTS):
+        if bucket is not None:
+            # Every attempt is a provider request, so each one is admitted
+            await bucket.acquire(_estimate_tokens(kwargs["messages"]))
+        try:
+            return await litellm.acompletion(**kwargs)
+        except Exception as exc:
+            delay = _retry_delay(exc, attempt)
+            if delay is None or attempt == _MAX_ATTEMPTS - 1:
+                raise
+            _log_retry(exc, attempt, delay)
+            await asyncio.sleep(delay)
+
+
 def _litellm_completion(messages: list[dict[str, str]], *, model: str | None = None, response_format: dict | None = None) -> str:
     """
     Call LiteLLM with *messages* and return the response content string.
 
-    Retries up to 3 times on rate-limit or transient errors, respecting the
-    ``Retry-After`` header returned by the provider.
+    Retries up to ``_MAX_ATTEMPTS - 1`` times on rate-limit or transient
+    errors, with jittered exponential backoff or the provider's
+    ``Retry-After`` header.
 
     Raises:
         LLMUnavailableError: If ``litellm`` is not installed.
         LLMInvocationError: For any error raised by LiteLLM at runtime.
     """
+    litellm = _import_litellm()
     try:
-        import litellm
-    except ImportError as exc:
-        raise LLMUnavailableError(
-            "litellm is not installed. Run: uv add litellm"
-        ) from exc
+        response = _completion_with_retry(litellm, **_completion_kwargs(messages, model, response_format))
+        return response.choices[0].message.content.strip()
+    except Exception as exc:
+        raise LLMInvocationError(str(exc)) from exc
+
 
+async def _alitellm_completion(messages: list[dict[str, str]], *, model: str | None = None, response_format: dict | None = None) -> str:
+    """
+    Async counterpart of :func:`_litellm_completion` using ``litellm.acompletion``.
+
+    Raises:
+        LLMUnavailableError: If ``litellm`` is not installed.
+        LLMInvocationError: For any error raised by LiteLLM at runtime.
+    """
+    litellm = _import_litellm()
     try:
-        kwargs = {
-            "model": model or settings.LLM_MODEL,
-            "messages": messages,
-            "temperature": settings.LLM_TEMPERATURE,
-            "num_retries": 3,
-        }
-        if response_format:
-            kwargs["response_format"] = response_format
-
-        response = litellm.completion(**kwargs)
+        response = await _acompletion_with_retry(litellm, **_completion_kwargs(messages, model, response_format))
         return response.choices[0].message.content.strip()
     except Exception as exc:
         raise LLMInvocationError(str(exc)) from exc
 
 
+async def _alitellm_stream(messages: list[dict[str, str]], *, model: str | None = None, response_format: dict | None = None) -> AsyncIterator[str]:
+    """
+    Stream the response content of a LiteLLM call as text deltas.
+
+    Raises:
+        LLMUnavailableError: If ``litellm`` is not installed.
+        LLMInvocationError: For any error raised by LiteLLM at runtime.
+    """
+    litellm = _import_litellm()
+    try:
+        # Only opening the stream is retried — never a partly consumed one
+        response = await _acompletion_with_retry(
+            litellm, **_completion_kwargs(messages, model, response_format), stream=True
+        )
+        async for chunk in response:
+            delta = chunk.choices[0].delta.content
+            if delta:
+                yield delta
+    except Exception as exc:
+        raise LLMInvocationError(str(exc)) from exc
+
+
+def _weighted_scores(raw_scores: dict[str, Any]) -> tuple[dict[str, int], int]:
+    """Normalise raw critique scores and return ``(scores, weighted_total)``."""
+    scores = {k: int(raw_scores.get(k, 0)) for k in _SCORE_WEIGHTS}
+    return scores, sum(scores[k] * w for k, w in _SCORE_WEIGHTS.items())
+
+
 def _parse_json(raw: str, context: str) -> dict[str, Any]:
     """Parse JSON from an LLM response, stripping markdown fences if present."""
-    text = raw.strip()
     # Strip ```json ... ``` fences that some models add despite instructions
-    if text.startswith("```"):
-        lines = text.splitlines()
-        text = "\n".join(lines[1:-1] if lines[-1].strip() == "```" else lines[1:])
+    text = _FENCE_RE.sub("", raw.strip())
     try:
-        return json.loads(text)
-    except json.JSONDecodeError as exc:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError as exc:
         logger.warning("{} — could not parse JSON response: {} | raw={!r}", context, exc, raw)
         return {}
 
@@ -121,6 +301,9 @@ class CritiqueResult:
     issues: list[str]
     revised_answer: str | None
     formatting_only: bool = False
+    # False when the response carried no ``scores`` (malformed / unparseable
+    # JSON) — such results still reject the draft but are never cached
+    graded: bool = True
 
     @property
     def approved(self) -> bool:
@@ -148,10 +331,20 @@ class LLMService:
 
     The ``chat_model`` property returns a LangChain ``ChatLiteLLM`` instance
     suitable for use with ``create_react_agent`` and ``bind_tools``.
+
+    With ``LLM_GUARD_BATCHING`` on, concurrent :meth:`acheck_input` calls
+    are coalesced into one LLM call per batch window.
     """
 
     def __init__(self) -> None:
         self._chat_model: Any = None
+        self._guard_batcher: MicroBatcher[str, InputGuardResult] | None = None
+        if settings.LLM_GUARD_BATCHING:
+            self._guard_batcher = MicroBatcher(
+                self._acheck_input_batch,
+                max_batch=settings.LLM_GUARD_BATCH_SIZE,
+                max_wait=settings.LLM_GUARD_BATCH_WAIT_MS / 1000,
+            )
 
     # ------------------------------------------------------------------
     # LangChain chat model (used by the ReAct research agent)
@@ -185,6 +378,24 @@ class LLMService:
     # Input Guard
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def _input_guard_messages(query: str) -> list[dict[str, str]]:
+        return [
+            _system_message(load_prompt("input_guard")),
+            {"role": "user",   "content": query},
+        ]
+
+    @staticmethod
+    def _parse_input_guard(raw: str) -> InputGuardResult:
+        data = _parse_json(raw, "InputGuard")
+        allowed = bool(data.get("allowed", True))
+        reason = data.get("reason", "")
+        logger.info(f"LLMService: InputGuard check complete | allowed={allowed} reason={reason!r}")
+        return InputGuardResult(
+            allowed=allowed,
+            reason=reason,
+        )
+
     def check_input(self, query: str) -> InputGuardResult:
         """
         Decide whether *query* should be allowed through to the research agent.
@@ -195,30 +406,176 @@ class LLMService:
         Returns:
             :class:`InputGuardResult` with ``allowed`` and optional ``reason``.
         """
-        system_prompt = load_prompt("input_guard")
         try:
-            raw = _litellm_completion([
-                {"role": "system", "content": system_prompt},
-                {"role": "user",   "content": query},
-            ], response_format={"type": "json_object"})
-            data = _parse_json(raw, "InputGuard")
-            allowed = bool(data.get("allowed", True))
-            reason = data.get("reason", "")
-            logger.info(f"LLMService: InputGuard check complete | allowed={allowed} reason={reason!r}")
-            return InputGuardResult(
-                allowed=allowed,
-                reason=reason,
+            raw = _litellm_completion(
+                self._input_guard_messages(query),
+                response_format={"type": "json_object"},
             )
+            return self._parse_input_guard(raw)
         except LLMUnavailableError:
             raise
         except Exception as exc:
             logger.warning("Input guard failed — defaulting to allow: {}", exc)
             return InputGuardResult(allowed=True)
 
+    async def acheck_input(self, query: str) -> InputGuardResult:
+        """Async variant of :meth:`check_input`."""
+        try:
+            if self._guard_batcher is not None:
+                return await self._guard_batcher.submit(query)
+            return await self._acheck_input_once(query)
+        except LLMUnavailableError:
+            raise
+        except Exception as exc:
+            logger.warning("Input guard failed — defaulting to allow: {}", exc)
+            return InputGuardResult(allowed=True)
+
+    async def _acheck_input_once(self, query: str) -> InputGuardResult:
+        raw = await _alitellm_completion(
+            self._input_guard_messages(query),
+            response_format={"type": "json_object"},
+        )
+        return self._parse_input_guard(raw)
+
+    @staticmethod
+    def _input_guard_batch_messages(queries: list[str]) -> list[dict[str, str]]:
+        system = f"{load_prompt('input_guard')}\n\n{load_prompt('input_guard_batch')}"
+        items = [{"id": i, "query": query} for i, query in enumerate(queries)]
+        return [
+            _system_message(system),
+            {"role": "user",   "content": orjson.dumps(items).decode()},
+        ]
+
+    async def _acheck_input_batch(self, queries: list[str]) -> list[InputGuardResult | Exception]:
+        """Check *queries* in one LLM call; entries it leaves out are checked alone."""
+        if len(queries) == 1:
+            return await asyncio.gather(self._acheck_input_once(queries[0]), return_exceptions=True)
+
+        raw = await _alitellm_completion(
+            self._input_guard_batch_messages(queries),
+            response_format={"type": "json_object"},
+        )
+        verdicts: dict[int, InputGuardResult | Exception] = {}
+        for entry in _parse_json(raw, "InputGuard").get("results", []):
+            if isinstance(entry, dict) and entry.get("id") in range(len(queries)):
+                verdicts[entry["id"]] = InputGuardResult(
+                    allowed=bool(entry.get("allowed", True)),
+                    reason=entry.get("reason", ""),
+                )
+        logger.info(
+            "LLMService: InputGuard batch complete | size={} blocked={}",
+            len(queries), sum(not v.allowed for v in verdicts.values()),
+        )
+
+        missing = [i for i in range(len(queries)) if i not in verdicts]
+        if missing:
+            logger.warning("InputGuard batch skipped {} of {} queries — checking them alone", len(missing), len(queries))
+            retried = await asyncio.gather(
+                *(self._acheck_input_once(queries[i]) for i in missing), return_exceptions=True
+            )
+            verdicts.update(zip(missing, retried))
+        return [verdicts[i] for i in range(len(queries))]
+
     # ------------------------------------------------------------------
     # Critique Agent
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def _critique_messages(
+        query: str,
+        tool_log: list[dict[str, Any]],
+        draft_answer: str,
+    ) -> list[dict[str, str]]:
+        user_content = (
+            f"User question: {query}\n\n"
+            f"Tool call log:\n{orjson.dumps(tool_log, default=str, option=_TOOL_LOG_JSON_OPTIONS).decode()}\n\n"
+            f"Draft answer: {draft_answer}"
+        )
+        return [
+            _system_message(load_prompt("critique_agent")),
+            {"role": "user",   "content": user_content},
+        ]
+
+    @staticmethod
+    def _parse_critique(raw: str) -> CritiqueResult:
+        data = _parse_json(raw, "CritiqueAgent")
+        scores, weighted_total = _weighted_scores(data.get("scores", {}))
+        issues = data.get("issues", [])
+        logger.info(
+            f"LLMService: Critique complete | weighted_total={weighted_total} "
+            f"approved={weighted_total >= settings.CRITIQUE_SCORE_THRESHOLD} "
+            f"issues_count={len(issues)}"
+        )
+        return CritiqueResult(
+            scores=scores,
+            weighted_total=weighted_total,
+            issues=issues,
+            revised_answer=data.get("revised_answer"),
+            formatting_only=bool(data.get("formatting_only", False)),
+            graded=isinstance(data.get("scores"), dict),
+        )
+
+    @staticmethod
+    def _critique_fallback(exc: Exception) -> CritiqueResult:
+        logger.warning("Critique agent failed — defaulting to approve: {}", exc)
+        return CritiqueResult(
+            scores={k: 10 for k in _SCORE_WEIGHTS},
+            weighted_total=100,
+            issues=[],
+            revised_answer=None,
+            formatting_only=False,
+        )
+
+    async def _astream_critique(self, messages: list[dict[str, str]]) -> CritiqueResult:
+        """
+        Stream the critique and return as soon as an approval is certain.
+
+        Approval depends only on ``scores``, which the prompt emits first.  If
+        the streamed scores already clear ``CRITIQUE_SCORE_THRESHOLD`` the
+        approved result is returned immediately (issues and revision are not
+        needed on that path) and the rest of the stream is drained and logged
+        in the background.  Rejections are read to the end and parsed in full.
+        """
+        stream = _alitellm_stream(messages, response_format={"type": "json_object"})
+        text = ""
+        scores_checked = False
+        async for delta in stream:
+            text += delta
+            if scores_checked:
+                continue
+            match = _SCORES_RE.search(text)
+            if match is None:
+                continue
+            scores_checked = True
+            try:
+                scores, weighted_total = _weighted_scores(orjson.loads(match.group(1)))
+            except (TypeError, ValueError):
+                continue
+            if weighted_total >= settings.CRITIQUE_SCORE_THRESHOLD:
+                logger.info(
+                    "LLMService: Critique approved from streamed scores | weighted_total={}",
+                    weighted_total,
+                )
+                task = asyncio.create_task(self._finish_critique_logging(stream, text))
+                _background_tasks.add(task)
+                task.add_done_callback(_background_tasks.discard)
+                return CritiqueResult(
+                    scores=scores,
+                    weighted_total=weighted_total,
+                    issues=[],
+                    revised_answer=None,
+                )
+        return self._parse_critique(text)
+
+    async def _finish_critique_logging(self, stream: AsyncIterator[str], text: str) -> None:
+        """Drain the rest of an early-approved critique stream for the logs."""
+        try:
+            async for delta in stream:
+                text += delta
+            self._parse_critique(text)
+        except Exception as exc:
+            logger.debug("LLMService: Background critique drain failed — {}", exc)
+
     def critique_response(
         self,
         query: str,
@@ -235,52 +592,96 @@ class LLMService:
 
         Returns:
             :class:`CritiqueResult` with ``approved``, ``issues``,
-            ``revised_answer``, and ``formatting_only``.
+            ``revised_answer``, and ``formatting_only``.  Successful grades
+            are served from / written to the on-disk critique cache.
         """
-        system_prompt = load_prompt("critique_agent")
-        user_content = (
-            f"User question: {query}\n\n"
-            f"Tool call log:\n{json.dumps(tool_log, indent=2, default=str)}\n\n"
-            f"Draft answer: {draft_answer}"
-        )
+        cache_key = _critique_cache.make_key(query, draft_answer, tool_log, load_prompt("critique_agent"))
+        cached = _critique_cache.fetch(cache_key)
+        if cached is not None:
+            logger.info("LLMService: Critique cache hit | weighted_total={}", cached.weighted_total)
+            return cached
         try:
-            raw = _litellm_completion([
-                {"role": "system", "content": system_prompt},
-                {"role": "user",   "content": user_content},
-            ], response_format={"type": "json_object"})
-            data = _parse_json(raw, "CritiqueAgent")
-            raw_scores: dict[str, Any] = data.get("scores", {})
-            scores = {k: int(raw_scores.get(k, 0)) for k in _SCORE_WEIGHTS}
-            weighted_total = sum(scores[k] * w for k, w in _SCORE_WEIGHTS.items())
-            issues = data.get("issues", [])
-            logger.info(
-                f"LLMService: Critique complete | weighted_total={weighted_total} "
-                f"approved={weighted_total >= settings.CRITIQUE_SCORE_THRESHOLD} "
-                f"issues_count={len(issues)}"
-            )
-            return CritiqueResult(
-                scores=scores,
-                weighted_total=weighted_total,
-                issues=issues,
-                revised_answer=data.get("revised_answer"),
-                formatting_only=bool(data.get("formatting_only", False)),
+            raw = _litellm_completion(
+                self._critique_messages(query, tool_log, draft_answer),
+                response_format={"type": "json_object"},
             )
+            result = self._parse_critique(raw)
         except LLMUnavailableError:
             raise
         except Exception as exc:
-            logger.warning("Critique agent failed — defaulting to approve: {}", exc)
-            return CritiqueResult(
-                scores={k: 10 for k in _SCORE_WEIGHTS},
-                weighted_total=100,
-                issues=[],
-                revised_answer=None,
-                formatting_only=False,
-            )
+            return self._critique_fallback(exc)
+        if result.graded:
+            _critique_cache.store(cache_key, result)
+        return result
+
+    async def acritique_response(
+        self,
+        query: str,
+        tool_log: list[dict[str, Any]],
+        draft_answer: str,
+    ) -> CritiqueResult:
+        """
+        Async variant of :meth:`critique_response`.
+
+        With ``CRITIQUE_STREAM_EARLY_EXIT`` on, the response is streamed and an
+        approval returns as soon as the scores arrive (see
+        :meth:`_astream_critique`).
+        """
+        cache_key = _critique_cache.make_key(query, draft_answer, tool_log, load_prompt("critique_agent"))
+        cached = _critique_cache.fetch(cache_key)
+        if cached is not None:
+            logger.info("LLMService: Critique cache hit | weighted_total={}", cached.weighted_total)
+            return cached
+        messages = self._critique_messages(query, tool_log, draft_answer)
+        try:
+            if settings.CRITIQUE_STREAM_EARLY_EXIT:
+                result = await self._astream_critique(messages)
+            else:
+                raw = await _alitellm_completion(messages, response_format={"type": "json_object"})
+                result = self._parse_critique(raw)
+        except LLMUnavailableError:
+            raise
+        except Exception as exc:
+            return self._critique_fallback(exc)
+        if result.graded:
+            _critique_cache.store(cache_key, result)
+        return result
 
     # ------------------------------------------------------------------
     # Output Guard
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def _output_guard_messages(
+        query: str,
+        known_properties: list[str],
+        answer: str,
+    ) -> list[dict[str, str]]:
+        # Cheap pre-pass: strip stray currency symbols before LLM call
+        answer = answer.translate(_CURRENCY_STRIP)
+
+        prop_list = ", ".join(known_properties)
+        user_content = (
+            f"User question: {query}\n\n"
+            f"Known property names: {prop_list}\n\n"
+            f"Candidate answer: {answer}"
+        )
+        return [
+            _system_message(load_prompt("output_guard")),
+            {"role": "user",   "content": user_content},
+        ]
+
+    @staticmethod
+    def _parse_output_guard(raw: str) -> OutputGuardResult:
+        data = _parse_json(raw, "OutputGuard")
+        valid = bool(data.get("valid", True))
+        logger.info(f"LLMService: OutputGuard check complete | valid={valid} "
+                    f"has_correction={'corrected_answer' in data and data['corrected_answer']}")
+        return OutputGuardResult(
+            valid=valid,
+            corrected_answer=data.get("corrected_answer"),
+        )
+
     def check_output(
         self,
         query: str,
@@ -298,30 +699,31 @@ class LLMService:
         Returns:
             :class:`OutputGuardResult` with ``valid`` and ``corrected_answer``.
         """
-        # Cheap pre-pass: strip stray currency symbols before LLM call
-        for sym in ("$", "€", "£"):
-            answer = answer.replace(sym, "")
+        try:
+            raw = _litellm_completion(
+                self._output_guard_messages(query, known_properties, answer),
+                response_format={"type": "json_object"},
+            )
+            return self._parse_output_guard(raw)
+        except LLMUnavailableError:
+            raise
+        except Exception as exc:
+            logger.warning("Output guard failed — returning answer as-is: {}", exc)
+            return OutputGuardResult(valid=True, corrected_answer=None)
 
-        system_prompt = load_prompt("output_guard")
-        prop_list = ", ".join(known_properties)
-        user_content = (
-            f"User question: {query}\n\n"
-            f"Known property names: {prop_list}\n\n"
-            f"Candidate answer: {answer}"
-        )
+    async def acheck_output(
+        self,
+        query: str,
+        known_properties: list[str],
+        answer: str,
+    ) -> OutputGuardResult:
+        """Async variant of :meth:`check_output`."""
         try:
-            raw = _litellm_completion([
-                {"role": "system", "content": system_prompt},
-                {"role": "user",   "content": user_content},
-            ], response_format={"type": "json_object"})
-            data = _parse_json(raw, "OutputGuard")
-            valid = bool(data.get("valid", True))
-            logger.info(f"LLMService: OutputGuard check complete | valid={valid} "
-                        f"has_correction={'corrected_answer' in data and data['corrected_answer']}")
-            return OutputGuardResult(
-                valid=valid,
-                corrected_answer=data.get("corrected_answer"),
+            raw = await _alitellm_completion(
+                self._output_guard_messages(query, known_properties, answer),
+                response_format={"type": "json_object"},
             )
+            return self._parse_output_guard(raw)
         except LLMUnavailableError:
             raise
         except Exception as exc:
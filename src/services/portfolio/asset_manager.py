@@ -4,23 +4,83 @@ services/portfolio/asset_manager.py
 Core financial calculation layer for the CortexRE portfolio dataset.
 
 All methods perform pure pandas operations against the normalised DataFrame
-stored in ``self.df``.  No data is mutated in-place.
+stored in ``self.df``.  No data is mutated in-place.  String dimensions may
+be ``category`` dtype (see ``create_tools``), so every ``groupby`` passes
+``observed=True`` to group only by values that actually occur.  ``year``
+is already an integer column (see ``normalize_data``), so year filters
+compare it directly.
 """
 
 from __future__ import annotations
 
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 from src.services.portfolio.normalization import OVERHEAD_PROPERTY
 
 
 class AssetManagerAssistant:
-    """Wraps a normalised portfolio DataFrame and exposes financial calculations."""
+    """Wraps a normalised portfolio DataFrame and exposes financial calculations.
+
+    Aggregates are cached on first use, so ``df`` must not change afterwards —
+    build a new assistant for a new frame.
+    """
 
     def __init__(self, df: pd.DataFrame) -> None:
         self.df = df
+        self._totals: pd.Series | None = None
+        self._pl_lookup: dict[tuple[Any, Any], dict[str, float]] | None = None
+
+    def _ledger_totals(self) -> pd.Series:
+        """``profit`` summed per (property, year, ledger_type), built on first use.
+
+        The P&L-style methods aggregate this few-hundred-row index instead of
+        rescanning ``self.df`` on every call.  Missing years are kept as their
+        own group so all-years totals still include undated rows.
+        """
+        if self._totals is None:
+            keys = [c for c in ("property_name", "year", "ledger_type") if c in self.df.columns]
+            self._totals = self.df.groupby(keys, observed=True, dropna=False)["profit"].sum()
+        return self._totals
+
+    def _property_pl_lookup(self) -> dict[tuple[Any, Any], dict[str, float]]:
+        """Ledger-type totals keyed by ``(property, year)``, built on first use.
+
+        ``(property, None)`` holds the all-years totals, so ``get_property_pl``
+        — the most called method — is a dict hit instead of an index filter
+        and groupby per call.
+        """
+        if self._pl_lookup is None:
+            totals = self._ledger_totals()
+            lookup: dict[tuple[Any, Any], dict[str, float]] = {}
+            all_years = totals.groupby(level=["property_name", "ledger_type"], observed=True).sum()
+            for (name, ledger_type), value in zip(all_years.index, all_years.tolist()):
+                lookup.setdefault((name, None), {})[ledger_type] = value
+            if "year" in totals.index.names:
+                for (name, year, ledger_type), value in zip(totals.index, totals.tolist()):
+                    if not (pd.isna(year) or pd.isna(ledger_type)):
+                        lookup.setdefault((name, year), {})[ledger_type] = value
+            self._pl_lookup = lookup
+        return self._pl_lookup
+
+    def _totals_where(
+        self,
+        property_name: str | None = None,
+        year: int | None = None,
+        exclude_overhead: bool = False,
+    ) -> pd.Series:
+        totals = self._ledger_totals()
+        names = totals.index.get_level_values("property_name")
+        keep = np.ones(len(totals), dtype=bool)
+        if property_name is not None:
+            keep &= np.asarray(names.isin([property_name]), dtype=bool)
+        if exclude_overhead:
+            keep &= ~np.asarray(names.isin([OVERHEAD_PROPERTY]), dtype=bool)
+        if year is not None:
+            keep &= np.asarray(totals.index.get_level_values("year").isin([year]), dtype=bool)
+        return totals[keep]
 
     def get_property_pl(
         self, property_name: str, year: int | None = None
@@ -34,12 +94,7 @@ class AssetManagerAssistant:
         Returns:
             Dict with keys ``revenue``, ``expenses``, and ``noi`` (all floats).
         """
-        mask = self.df["property_name"] == property_name
-        if year is not None:
-            mask &= self.df["year"].astype(int) == year
-
-        subset = self.df[mask]
-        summary: dict[str, Any] = subset.groupby("ledger_type")["profit"].sum().to_dict()
+        summary: dict[str, Any] = dict(self._property_pl_lookup().get((property_name, year), {}))
 
         rev = summary.get("revenue", 0)
         exp = summary.get("expenses", 0)
@@ -59,12 +114,8 @@ class AssetManagerAssistant:
         Returns:
             Dict with keys ``revenue``, ``expenses``, and ``noi`` (all floats).
         """
-        mask = self.df["property_name"] != OVERHEAD_PROPERTY
-        if year is not None:
-            mask &= self.df["year"].astype(int) == year
-
-        subset = self.df[mask]
-        summary: dict[str, Any] = subset.groupby("ledger_type")["profit"].sum().to_dict()
+        subset = self._totals_where(year=year, exclude_overhead=True)
+        summary: dict[str, Any] = subset.groupby(level="ledger_type").sum().to_dict()
         summary["noi"] = summary.get("revenue", 0) + summary.get("expenses", 0)
         return summary
 
@@ -100,26 +151,42 @@ class AssetManagerAssistant:
             covering every consecutive year pair in the dataset.
             Returns an empty dict when fewer than two years of data are available.
         """
-        available_years = sorted(self.df["year"].dropna().astype(int).unique())
+        available_years = sorted(self.df["year"].dropna().unique().tolist())
         if len(available_years) < 2:  # noqa: PLR2004
             return {}
 
-        year_pairs = list(zip(available_years, available_years[1:]))
         properties = [
             p for p in self.df["property_name"].unique() if p != OVERHEAD_PROPERTY
         ]
 
-        results: dict[str, dict[str, float]] = {}
-        for prop in properties:
-            prop_growth: dict[str, float] = {}
-            for yr_prev, yr_curr in year_pairs:
-                val_prev = self.get_property_pl(prop, yr_prev).get(metric, 0)
-                val_curr = self.get_property_pl(prop, yr_curr).get(metric, 0)
-                label = f"{yr_prev}\u2192{yr_curr}"
-                prop_growth[label] = (val_curr - val_prev) / abs(val_prev) if val_prev else 0.0
-            results[prop] = prop_growth
+        # One reshape of the shared totals instead of a get_property_pl call per (property, year)
+        totals = (
+            self._ledger_totals()
+            .groupby(level=["property_name", "year", "ledger_type"], observed=True)
+            .sum()
+            .unstack("ledger_type", fill_value=0)
+        )
+        totals = totals.reindex(columns=totals.columns.union(["revenue", "expenses"]), fill_value=0)
+        totals["noi"] = totals["revenue"] + totals["expenses"]
+        if metric not in totals.columns:
+            totals[metric] = 0.0
+
+        # property × year grid; a year with no rows counts as 0, as in get_property_pl
+        grid = (
+            totals[metric]
+            .unstack("year", fill_value=0)
+            .reindex(index=properties, columns=available_years, fill_value=0)
+            .to_numpy(dtype=float)
+        )
+        prev, curr = grid[:, :-1], grid[:, 1:]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            growth = np.where(prev != 0, (curr - prev) / np.abs(prev), 0.0)
 
-        return results
+        labels = [f"{yr_prev}\u2192{yr_curr}" for yr_prev, yr_curr in zip(available_years, available_years[1:])]
+        return {
+            prop: dict(zip(labels, row))
+            for prop, row in zip(properties, growth.tolist())
+        }
 
     def compare_properties(self, field: str = "noi", year: int | None = None) -> pd.Series:
         """Rank all properties from highest to lowest by a financial metric.
@@ -140,13 +207,9 @@ class AssetManagerAssistant:
         Raises:
             KeyError: If *field* is not a recognised metric.
         """
-        mask = self.df["property_name"] != OVERHEAD_PROPERTY
-        if year is not None:
-            mask &= self.df["year"].astype(int) == year
-
         pivot = (
-            self.df[mask]
-            .groupby(["property_name", "ledger_type"])["profit"]
+            self._totals_where(year=year, exclude_overhead=True)
+            .groupby(level=["property_name", "ledger_type"], observed=True)
             .sum()
             .unstack(fill_value=0)
         )
@@ -181,8 +244,8 @@ class AssetManagerAssistant:
         if property_name is not None:
             mask &= self.df["property_name"] == property_name
         if year is not None:
-            mask &= self.df["year"].astype(int) == year
-        return self.df[mask].groupby("ledger_category")["profit"].sum().sort_values()
+            mask &= self.df["year"] == year
+        return self.df[mask].groupby("ledger_category", observed=True)["profit"].sum().sort_values()
 
     def get_tenant_summary(
         self,
@@ -199,7 +262,7 @@ class AssetManagerAssistant:
         if tenant_name is not None:
             mask &= self.df["tenant_name"] == tenant_name
         if year is not None:
-            mask &= self.df["year"].astype(int) == year
+            mask &= self.df["year"] == year
 
         subset = self.df[
             mask
@@ -207,7 +270,7 @@ class AssetManagerAssistant:
             & (self.df["tenant_name"] != "N/A")
         ]
         grouped = (
-            subset.groupby(["property_name", "tenant_name"])["profit"]
+            subset.groupby(["property_name", "tenant_name"], observed=True)["profit"]
             .sum()
             .reset_index()
             .sort_values("profit", ascending=False)
@@ -238,7 +301,7 @@ class AssetManagerAssistant:
             "ledger_types": sorted(self.df["ledger_type"].dropna().unique().tolist()),
             "ledger_groups": sorted(self.df["ledger_group"].dropna().unique().tolist()) if "ledger_group" in self.df.columns else [],
             "ledger_categories": sorted(self.df["ledger_category"].dropna().unique().tolist()) if "ledger_category" in self.df.columns else [],
-            "years": sorted(self.df["year"].dropna().astype(int).unique().tolist()),
+            "years": sorted(self.df["year"].dropna().unique().tolist()),
             "quarters": sorted(self.df["quarter"].dropna().unique().tolist()) if "quarter" in self.df.columns else [],
             "months": sorted(self.df["month"].dropna().unique().tolist()) if "month" in self.df.columns else [],
         }
@@ -248,6 +311,7 @@ class AssetManagerAssistant:
         dimensions: list[str],
         metrics: list[str] = ["profit"],
         filters: list[dict[str, Any]] | None = None,
+        limit: int | None = None,
     ) -> list[dict[str, Any]]:
         """Flexible query engine for custom portfolio analysis.
 
@@ -259,20 +323,30 @@ class AssetManagerAssistant:
             dimensions: Columns to group by (e.g., ``["year"]``, ``["property_name", "ledger_type"]``).
             metrics: Numerical columns to sum (default is ``["profit"]``).
             filters: List of dictionaries to filter the data. Each dict should have
-                     ``column``, ``operator`` (currently only "==" is supported), and ``value``.
+                     ``column``, ``value``, and optionally ``operator``: "==" (default)
+                     or "in", which matches any of a list of values.
+            limit: Optional maximum number of rows to return.  Applied before
+                   the rows are converted to dicts.
 
         Returns:
             A list of dictionaries representing the aggregated rows.
         """
         df_view = self.df
 
-        # Apply filters
+        # Apply filters as one combined mask — a single slice instead of one per filter
         if filters:
+            mask = np.ones(len(df_view), dtype=bool)
             for f in filters:
                 col = f.get("column")
+                if col not in df_view.columns:
+                    continue
                 val = f.get("value")
-                if col in df_view.columns:
-                    df_view = df_view[df_view[col] == val]
+                if f.get("operator") == "in":
+                    hits = df_view[col].isin(val if isinstance(val, (list, tuple, set)) else [val])
+                else:
+                    hits = df_view[col] == val
+                mask &= hits.to_numpy(dtype=bool, na_value=False)
+            df_view = df_view[mask]
 
         # Ensure dimensions exist
         valid_dims = [d for d in dimensions if d in df_view.columns]
@@ -289,7 +363,9 @@ class AssetManagerAssistant:
             return []
 
         # Group and aggregate
-        grouped = df_view.groupby(valid_dims)[valid_metrics].sum().reset_index()
+        grouped = df_view.groupby(valid_dims, observed=True)[valid_metrics].sum().reset_index()
+        if limit is not None:
+            grouped = grouped.head(limit)
 
         # Convert to list of dicts for JSON serialization
         return grouped.to_dict(orient="records")
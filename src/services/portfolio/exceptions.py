@@ -18,3 +18,8 @@ class DataNormalizationError(PortfolioError):
     """Raised when normalization fails."""
     def __init__(self, detail: str):
         super().__init__(f"Data normalization failed: {detail}", status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+class PropertyNotFoundError(PortfolioError):
+    """Raised when a property name does not occur in the dataset."""
+    def __init__(self, property_name: str):
+        super().__init__(f"Property {property_name!r} not found.", status_code=status.HTTP_404_NOT_FOUND)
@@ -7,13 +7,18 @@ Normalizes the raw CortexRE parquet dataset into a clean DataFrame.
 from __future__ import annotations
 
 import pandas as pd
-import numpy as np
 
 #: Property name used for overhead / corporate entries that don't belong to a
 #: specific asset. Centralised here so every module imports it rather than
 #: repeating the raw string.
 OVERHEAD_PROPERTY: str = "Corporate/General"
 
+#: Low-cardinality string dimensions stored as ``category`` dtype: equality
+#: masks compare integer codes and ``groupby`` skips hashing strings.
+#: ``ledger_type`` stays object dtype — it ends up as pivot columns that
+#: ``compare_properties`` extends with derived labels such as "noi".
+CATEGORICAL_COLUMNS: tuple[str, ...] = ("property_name", "tenant_name", "ledger_category", "description_en")
+
 
 def normalize_data(df: pd.DataFrame) -> pd.DataFrame:
     """
@@ -25,7 +30,8 @@ def normalize_data(df: pd.DataFrame) -> pd.DataFrame:
     3. Strip leading/trailing whitespace from string columns.
     4. Fill missing ``property_name`` / ``tenant_name``.
     5. Extract the English half of bilingual ``ledger_description`` values.
-    6. Derive ``year`` and ``month_val`` from ``date``.
+    6. Derive ``year`` (``Int32``) and ``month_val`` (``Int8``) from ``date``.
+    7. Store the :data:`CATEGORICAL_COLUMNS` as ``category`` dtype.
     """
     df = df.copy()
 
@@ -39,19 +45,15 @@ def normalize_data(df: pd.DataFrame) -> pd.DataFrame:
 
     # 2. Quarter standardization: "2025-Q1" → 2025-01-01 (start of quarter)
     if "quarter" in df.columns:
-        _quarter_map = {"Q1": "01-01", "Q2": "04-01", "Q3": "07-01", "Q4": "10-01"}
-
-        def _parse_quarter(q_str: str) -> pd.Timestamp | float:
-            try:
-                year, q = q_str.split("-")
-                return pd.to_datetime(f"{year}-{_quarter_map[q]}")
-            except (ValueError, KeyError):
-                return np.nan
-
-        df["quarter_start"] = df["quarter"].apply(_parse_quarter)
+        parts = df["quarter"].str.extract(r"^\s*(?P<year>\d{4})-Q(?P<q>[1-4])\s*$").astype("float64")
+        df["quarter_start"] = pd.to_datetime(
+            pd.DataFrame({"year": parts["year"], "month": parts["q"] * 3 - 2, "day": 1}),
+            errors="coerce",
+        )
 
     # 3. Categorical consistency — strip whitespace from string columns
-    string_cols = df.select_dtypes(include=["object"]).columns
+    # (object or Arrow-backed strings — the latter strip in Arrow's C++ kernels)
+    string_cols = [c for c in df.columns if pd.api.types.is_string_dtype(df[c].dtype)]
     for col in string_cols:
         if col != "ledger_description":  # keep description as-is
             df[col] = df[col].str.strip()
@@ -62,22 +64,20 @@ def normalize_data(df: pd.DataFrame) -> pd.DataFrame:
     if "tenant_name" in df.columns:
         df["tenant_name"] = df["tenant_name"].fillna("N/A")
 
-    # 5. Bilingual description parsing — extract the English part after "|"
+    # 5. Bilingual description parsing — extract the English part after the last "|"
     if "ledger_description" in df.columns:
+        desc = df["ledger_description"]
+        bilingual = desc.str.contains("|", regex=False, na=False)
+        df["description_en"] = desc.where(~bilingual, desc.str.rpartition("|")[2].str.strip())
 
-        def _clean_desc(desc: str | float) -> str | float:
-            if pd.isna(desc):
-                return desc
-            if "|" in desc:
-                return desc.split("|")[-1].strip()
-            return desc
-
-        df["description_en"] = df["ledger_description"].apply(_clean_desc)
-
-    # 6. Time hierarchy
+    # 6. Time hierarchy — nullable ints (unparseable dates stay <NA>), so year
+    # filters compare integers directly instead of casting the column per call
     if "date" in df.columns:
-        df["year"] = df["date"].dt.year
-        df["month_val"] = df["date"].dt.month
+        df["year"] = df["date"].dt.year.astype("Int32")
+        df["month_val"] = df["date"].dt.month.astype("Int8")
+
+    # 7. Categoricals — last, since the string cleanup above only sees object columns
+    df = df.astype({col: "category" for col in CATEGORICAL_COLUMNS if col in df.columns})
 
     return df
 
@@ -90,7 +90,7 @@ def _enrich_asset_metrics(df: pd.DataFrame) -> pd.DataFrame:
     offline EDA / notebook use.
     """
     metrics = (
-        df.groupby(["property_name", "date", "ledger_type"])["profit"]
+        df.groupby(["property_name", "date", "ledger_type"], observed=True)["profit"]
         .sum()
         .unstack(fill_value=0)
         .reset_index()
@@ -8,12 +8,14 @@ from __future__ import annotations
 
 from typing import Any
 
+import numpy as np
+import orjson
 import pandas as pd
 from loguru import logger
 
 from .asset_manager import AssetManagerAssistant
 from .normalization import normalize_data
-from .exceptions import DatasetNotFoundError, DataNormalizationError
+from .exceptions import DatasetNotFoundError, DataNormalizationError, PropertyNotFoundError
 
 
 class PortfolioService:
@@ -28,13 +30,20 @@ class PortfolioService:
         self._data_path = data_path
         self._df: pd.DataFrame | None = None
         self._assistant: AssetManagerAssistant | None = None
+        # Derived views of the immutable dataset, computed on first use
+        self._property_list: list[str] | None = None
+        self._eda_stats: dict[str, Any] | None = None
+        self._eda_stats_json: bytes | None = None
+        self._monthly_by_property: dict[str, pd.DataFrame] | None = None
 
     def initialize(self) -> None:
         """Load and normalize the portfolio dataset from *data_path*."""
         logger.info("Initializing PortfolioService with data from: {}", self._data_path)
 
         try:
-            raw_df = pd.read_parquet(self._data_path)
+            # Arrow-backed columns: the string cleanup in normalize_data runs in
+            # Arrow kernels instead of per-cell Python str methods
+            raw_df = pd.read_parquet(self._data_path, engine="pyarrow", dtype_backend="pyarrow")
             logger.debug(f"PortfolioService: Loaded {len(raw_df)} raw rows from parquet")
         except FileNotFoundError:
             logger.error(f"PortfolioService: Dataset not found at {self._data_path}")
@@ -45,7 +54,10 @@ class PortfolioService:
 
         try:
             self._df = normalize_data(raw_df)
+            self.invalidate()
             self._assistant = AssetManagerAssistant(self._df)
+            # Pay the per-property groupby once, at startup
+            self._monthly_by_property = self._compute_monthly_by_property()
             logger.info("PortfolioService initialized with {} rows.", len(self._df))
         except Exception as exc:
             logger.exception("Normalization failed during service initialization")
@@ -57,12 +69,22 @@ class PortfolioService:
             raise RuntimeError("PortfolioService accessed before initialization.")
         return self._df
 
+    def invalidate(self) -> None:
+        """Drop the cached property list and aggregates (call after the dataset changes)."""
+        self._property_list = None
+        self._eda_stats = None
+        self._eda_stats_json = None
+        self._monthly_by_property = None
+
     @property
     def property_list(self) -> list[str]:
         """Return a sorted list of all unique property names."""
-        if "property_name" not in self.df.columns:
-            return []
-        return sorted(self.df["property_name"].unique().tolist())
+        if self._property_list is None:
+            if "property_name" not in self.df.columns:
+                self._property_list = []
+            else:
+                self._property_list = sorted(self.df["property_name"].unique().tolist())
+        return self._property_list
 
     def get_assistant(self) -> AssetManagerAssistant:
         """Return the ``AssetManagerAssistant`` instance for financial calculations."""
@@ -71,7 +93,46 @@ class PortfolioService:
         return self._assistant
 
     def get_eda_stats(self) -> dict[str, Any]:
-        """Return aggregated statistics for EDA visualization."""
+        """Return aggregated statistics for EDA visualization (computed once)."""
+        if self._eda_stats is None:
+            self._eda_stats = self._compute_eda_stats()
+        return self._eda_stats
+
+    def get_eda_stats_json(self) -> bytes:
+        """Return :meth:`get_eda_stats` as JSON bytes (serialized once, like the stats)."""
+        if self._eda_stats_json is None:
+            self._eda_stats_json = orjson.dumps(
+                self.get_eda_stats(), option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            )
+        return self._eda_stats_json
+
+    def get_monthly(self, property_name: str) -> pd.DataFrame:
+        """
+        Return the monthly revenue, expenses, and NOI of one property.
+
+        The frame is indexed by ``date`` and served from a per-property index
+        built once; raises ``PropertyNotFoundError`` for unknown names.
+        """
+        if self._monthly_by_property is None:
+            self._monthly_by_property = self._compute_monthly_by_property()
+        try:
+            return self._monthly_by_property[property_name]
+        except KeyError:
+            raise PropertyNotFoundError(property_name) from None
+
+    def _compute_monthly_by_property(self) -> dict[str, pd.DataFrame]:
+        monthly = (
+            self.df.groupby(["property_name", "date", "ledger_type"], observed=True)["profit"]
+            .sum()
+            .unstack(fill_value=0)
+        )
+        monthly["noi"] = monthly.get("revenue", 0) + monthly.get("expenses", 0)
+        return {
+            name: frame.droplevel("property_name")
+            for name, frame in monthly.groupby(level="property_name", observed=True, sort=False)
+        }
+
+    def _compute_eda_stats(self) -> dict[str, Any]:
         df = self.df
 
         # 1. Monthly trends
@@ -82,15 +143,16 @@ class PortfolioService:
             .reset_index()
         )
         monthly_trends["noi"] = monthly_trends.get("revenue", 0) + monthly_trends.get("expenses", 0)
-        monthly_trends["date"] = monthly_trends["date"].dt.strftime("%Y-%m-%d")
+        monthly_trends["date"] = np.datetime_as_string(monthly_trends["date"].to_numpy(dtype="datetime64[D]"))
 
-        # 2. Property distribution
+        # 2. Property distribution — one (property, ledger_type) pivot
         prop_dist = (
-            df.groupby("property_name")["profit"]
-            .agg(
-                total_revenue=lambda x: x[df.loc[x.index, "ledger_type"] == "revenue"].sum(),
-                total_expenses=lambda x: x[df.loc[x.index, "ledger_type"] == "expenses"].sum(),
-            )
+            df.groupby(["property_name", "ledger_type"], observed=True)["profit"]
+            .sum()
+            .unstack(fill_value=0)
+            .reindex(columns=["revenue", "expenses"], fill_value=0)
+            .rename(columns={"revenue": "total_revenue", "expenses": "total_expenses"})
+            .rename_axis(columns=None)
             .reset_index()
         )
         prop_dist["noi"] = prop_dist["total_revenue"] + prop_dist["total_expenses"]
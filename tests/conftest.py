@@ -2,32 +2,31 @@ import pytest
 import pandas as pd
 from src.services.portfolio.asset_manager import AssetManagerAssistant
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_df() -> pd.DataFrame:
-    """Mock DataFrame for testing portfolio queries."""
-    data = [
-        {"property_name": "Building A", "year": 2024, "ledger_type": "revenue",
-         "profit": 100.0, "tenant_name": "Tenant 1", "ledger_category": "revenue_rent_taxed",
-         "ledger_group": "rental_income"},
-        {"property_name": "Building A", "year": 2024, "ledger_type": "expenses",
-         "profit": -40.0, "tenant_name": None, "ledger_category": "bank_charges",
-         "ledger_group": "general_expenses"},
-        {"property_name": "Building A", "year": 2025, "ledger_type": "revenue",
-         "profit": 120.0, "tenant_name": "Tenant 1", "ledger_category": "revenue_rent_taxed",
-         "ledger_group": "rental_income"},
-        {"property_name": "Building A", "year": 2025, "ledger_type": "expenses",
-         "profit": -50.0, "tenant_name": None, "ledger_category": "insurance_in_general",
-         "ledger_group": "taxes_and_insurances"},
-        {"property_name": "Building B", "year": 2024, "ledger_type": "revenue",
-         "profit": 200.0, "tenant_name": "Tenant 2", "ledger_category": "revenue_rent_taxed",
-         "ledger_group": "rental_income"},
-        {"property_name": "Building B", "year": 2024, "ledger_type": "expenses",
-         "profit": -90.0, "tenant_name": None, "ledger_category": "real_estate_taxes",
-         "ledger_group": "taxes_and_insurances"},
-    ]
-    return pd.DataFrame(data)
+    """Mock DataFrame for testing portfolio queries.
 
+    Shared by the whole session — tests that need a modified frame build a
+    new one (``copy()`` / ``pd.concat``) instead of changing this one.
+    """
+    # Column-oriented; ``year`` is the Int32 column normalize_data produces
+    return pd.DataFrame({
+        "property_name": ["Building A"] * 4 + ["Building B"] * 2,
+        "year": pd.array([2024, 2024, 2025, 2025, 2024, 2024], dtype="Int32"),
+        "ledger_type": ["revenue", "expenses"] * 3,
+        "profit": [100.0, -40.0, 120.0, -50.0, 200.0, -90.0],
+        "tenant_name": ["Tenant 1", None, "Tenant 1", None, "Tenant 2", None],
+        "ledger_category": [
+            "revenue_rent_taxed", "bank_charges", "revenue_rent_taxed",
+            "insurance_in_general", "revenue_rent_taxed", "real_estate_taxes",
+        ],
+        "ledger_group": [
+            "rental_income", "general_expenses", "rental_income",
+            "taxes_and_insurances", "rental_income", "taxes_and_insurances",
+        ],
+    })
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def am(sample_df) -> AssetManagerAssistant:
     return AssetManagerAssistant(sample_df)
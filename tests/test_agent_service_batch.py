@@ -0,0 +1,38 @@
+"""Verify AgentService.ainvoke_batch runs turns together and isolates failures."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.services.agent.exceptions import AgentInvocationError
+from src.services.agent.service import AgentService
+
+
+def _service(graph):
+    svc = AgentService.__new__(AgentService)
+    svc._graph = graph
+    return svc
+
+
+def test_batch_returns_results_in_order_and_wraps_failures():
+    boom = RuntimeError("llm down")
+    mock_graph = MagicMock()
+    mock_graph.abatch = AsyncMock(return_value=[{"final_answer": "A"}, boom])
+
+    results = asyncio.run(_service(mock_graph).ainvoke_batch([("q1", "t1"), ("q2", "t2")]))
+
+    assert results[0] == {"final_answer": "A"}
+    assert isinstance(results[1], AgentInvocationError)
+    assert results[1].__cause__ is boom
+
+    inputs = mock_graph.abatch.call_args[0][0]
+    kwargs = mock_graph.abatch.call_args[1]
+    assert [i["query"] for i in inputs] == ["q1", "q2"]
+    assert [c["configurable"]["thread_id"] for c in kwargs["config"]] == ["t1", "t2"]
+    assert kwargs["return_exceptions"] is True
+
+
+def test_batch_rejects_duplicate_threads():
+    with pytest.raises(ValueError):
+        asyncio.run(_service(MagicMock()).ainvoke_batch([("q1", "t1"), ("q2", "t1")]))
@@ -1,16 +1,18 @@
 """Verify that AgentService always resets steps to [] on each invoke."""
 
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
+
+from langgraph.types import Overwrite
 
 
 def test_invoke_resets_steps_each_turn():
-    """graph.invoke() must receive steps=[] so previous turns don't bleed through."""
+    """graph.ainvoke() must receive steps=[] so previous turns don't bleed through."""
     mock_graph = MagicMock()
-    mock_graph.invoke.return_value = {
+    mock_graph.ainvoke = AsyncMock(return_value={
         "final_answer": "ok",
         "blocked": False,
         "steps": [],
-    }
+    })
 
     from src.services.agent.service import AgentService
 
@@ -19,7 +21,9 @@ def test_invoke_resets_steps_each_turn():
 
     svc.invoke("what is the revenue?", thread_id="t1")
 
-    call_args = mock_graph.invoke.call_args
+    call_args = mock_graph.ainvoke.call_args
     input_dict = call_args[0][0]
     assert "steps" in input_dict, "steps must be explicitly reset each turn"
-    assert input_dict["steps"] == [], "steps must be reset to empty list"
+    # steps has an append reducer, so the reset must bypass it
+    assert isinstance(input_dict["steps"], Overwrite), "steps reset must bypass the reducer"
+    assert input_dict["steps"].value == [], "steps must be reset to empty list"
@@ -0,0 +1,34 @@
+"""Verify AgentService.astream yields steps as nodes finish, then the result."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+from src.services.agent.service import AgentService
+
+
+async def _collect(svc):
+    return [event async for event in svc.astream("what is the revenue?", thread_id="t1")]
+
+
+def test_astream_yields_steps_then_result():
+    async def fake_astream(*_args, **_kwargs):
+        yield {"input_guard": {"blocked": False, "steps": [{"node": "InputGuard", "message": "ok"}]}}
+        yield {"research_agent": {"draft_answer": "Draft.", "steps": [{"node": "ResearchAgent", "message": "done"}]}}
+        yield {"output_guard": {"final_answer": "Revenue is 100.00.", "steps": []}}
+
+    mock_graph = MagicMock()
+    mock_graph.astream = fake_astream
+
+    svc = AgentService.__new__(AgentService)
+    svc._graph = mock_graph
+
+    events = asyncio.run(_collect(svc))
+
+    assert [e["event"] for e in events] == ["step", "step", "result"]
+    assert events[0]["step"]["node"] == "InputGuard"
+    assert events[-1] == {
+        "event": "result",
+        "answer": "Revenue is 100.00.",
+        "blocked": False,
+        "block_reason": None,
+    }
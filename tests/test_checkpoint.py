@@ -0,0 +1,22 @@
+"""Verify open_checkpointer builds the configured saver."""
+
+import asyncio
+
+import pytest
+from langgraph.checkpoint.memory import MemorySaver
+
+from src.services.agent.checkpoint import open_checkpointer
+
+
+async def _open(kind):
+    async with open_checkpointer(kind, "unused") as saver:
+        return saver
+
+
+def test_memory_checkpointer():
+    assert isinstance(asyncio.run(_open("memory")), MemorySaver)
+
+
+def test_unknown_checkpointer_kind():
+    with pytest.raises(ValueError):
+        asyncio.run(_open("redis"))
@@ -0,0 +1,86 @@
+"""Verify the on-disk critique cache round-trips results and honours its TTL."""
+
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.core.config import settings
+from src.services.llm import _critique_cache
+from src.services.llm.service import CritiqueResult, LLMService
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "CRITIQUE_CACHE_DIR", tmp_path)
+    monkeypatch.setattr(settings, "CRITIQUE_CACHE_TTL_SECONDS", 60)
+    return tmp_path
+
+
+def _result():
+    return CritiqueResult(
+        scores={"accuracy": 9, "completeness": 9, "clarity": 9, "format": 9},
+        weighted_total=90,
+        issues=[],
+        revised_answer=None,
+    )
+
+
+def test_key_depends_on_every_input():
+    base = _critique_cache.make_key("q", "draft", [{"tool_name": "t"}], "prompt")
+    assert base == _critique_cache.make_key("q", "draft", [{"tool_name": "t"}], "prompt")
+    assert base != _critique_cache.make_key("q2", "draft", [{"tool_name": "t"}], "prompt")
+    assert base != _critique_cache.make_key("q", "draft2", [{"tool_name": "t"}], "prompt")
+    assert base != _critique_cache.make_key("q", "draft", [], "prompt")
+    assert base != _critique_cache.make_key("q", "draft", [{"tool_name": "t"}], "prompt v2")
+
+
+def test_store_then_fetch_round_trips(cache_dir):
+    _critique_cache.store("abc", _result())
+    assert _critique_cache.fetch("abc") == _result()
+    assert not [p for p in cache_dir.iterdir() if p.name.startswith(".tmp-")]
+
+
+def test_fetch_misses_on_unknown_key(cache_dir):
+    assert _critique_cache.fetch("missing") is None
+
+
+def test_expired_entry_is_ignored(cache_dir):
+    _critique_cache.store("old", _result())
+    stale = time.time() - 120
+    os.utime(cache_dir / "old", (stale, stale))
+    assert _critique_cache.fetch("old") is None
+
+
+def test_zero_ttl_disables_cache(cache_dir, monkeypatch):
+    monkeypatch.setattr(settings, "CRITIQUE_CACHE_TTL_SECONDS", 0)
+    _critique_cache.store("abc", _result())
+    assert _critique_cache.fetch("abc") is None
+    assert not list(cache_dir.iterdir())
+
+
+def _critique_with_response(monkeypatch, text):
+    """Run critique_response against a stand-in litellm; return the LLM call count."""
+    calls = []
+
+    def completion(**kwargs):
+        calls.append(kwargs)
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=text))])
+
+    monkeypatch.setitem(sys.modules, "litellm", SimpleNamespace(completion=completion))
+    llm = LLMService()
+    first = llm.critique_response("q", [], "draft")
+    assert llm.critique_response("q", [], "draft") == first
+    return len(calls)
+
+
+def test_graded_response_is_cached(cache_dir, monkeypatch):
+    text = '{"scores": {"accuracy": 9, "completeness": 9, "clarity": 9, "format": 9}, "issues": []}'
+    assert _critique_with_response(monkeypatch, text) == 1
+
+
+def test_malformed_response_is_not_cached(cache_dir, monkeypatch):
+    assert _critique_with_response(monkeypatch, "not json") == 2
+    assert not list(cache_dir.iterdir())
@@ -0,0 +1,82 @@
+"""Verify critique_plus_output_check_node overlaps the critique with the output check."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from src.agents.context import GraphContext
+from src.agents.nodes.critique_prefetch import critique_plus_output_check_node
+from src.agents.nodes.output_guard import output_guard_node
+from src.services.llm.service import CritiqueResult, OutputGuardResult
+
+_DRAFT = "Building A earned 100,000.00 in revenue."
+
+
+def _make_state(weighted_total=90):
+    mock_llm = MagicMock()
+    mock_llm.acritique_response = AsyncMock(return_value=CritiqueResult(
+        scores={"accuracy": 9, "completeness": 9, "clarity": 9, "format": 9},
+        weighted_total=weighted_total,
+        issues=[] if weighted_total >= 80 else ["Missing expenses."],
+        revised_answer=None,
+    ))
+    mock_llm.acheck_output = AsyncMock(return_value=OutputGuardResult(valid=True, corrected_answer=None))
+
+    state = {
+        "query": "What is the revenue for Building A?",
+        "draft_answer": _DRAFT,
+        "tool_log": [],
+        "revision_count": 0,
+        "draft_history": [],
+        "steps": [],
+    }
+    return state, GraphContext(llm=mock_llm, known_properties=["Building A"])
+
+
+def test_approved_draft_stashes_output_check():
+    """An approved draft keeps the output check made alongside the critique."""
+    state, ctx = _make_state(weighted_total=90)
+
+    result = asyncio.run(critique_plus_output_check_node(state, ctx=ctx))
+
+    assert result["critique"] is None
+    assert result["_prefetched_output_check"] == {
+        "draft": _DRAFT, "valid": True, "corrected_answer": None,
+    }
+    ctx.llm.acheck_output.assert_awaited_once()
+
+
+def test_rejected_draft_discards_output_check():
+    """A rejected draft goes back to research, so the speculative check is dropped."""
+    state, ctx = _make_state(weighted_total=50)
+
+    result = asyncio.run(critique_plus_output_check_node(state, ctx=ctx))
+
+    assert result["critique"]
+    assert result["_prefetched_output_check"] is None
+
+
+def test_output_guard_consumes_prefetched_check():
+    """The output guard must reuse a check made on the same draft instead of calling the LLM."""
+    state, ctx = _make_state()
+    state["_prefetched_output_check"] = {
+        "draft": _DRAFT, "valid": False, "corrected_answer": "Corrected.",
+    }
+
+    result = asyncio.run(output_guard_node(state, ctx=ctx))
+
+    assert result["final_answer"] == "Corrected."
+    assert result["_prefetched_output_check"] is None
+    ctx.llm.acheck_output.assert_not_called()
+
+
+def test_output_guard_ignores_check_for_other_draft():
+    """A check made on a different draft is stale and must not be reused."""
+    state, ctx = _make_state()
+    state["_prefetched_output_check"] = {
+        "draft": "An older draft.", "valid": False, "corrected_answer": "Stale.",
+    }
+
+    result = asyncio.run(output_guard_node(state, ctx=ctx))
+
+    assert result["final_answer"] == _DRAFT
+    ctx.llm.acheck_output.assert_awaited_once()
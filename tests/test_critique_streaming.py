@@ -0,0 +1,77 @@
+"""Verify the streamed critique approves early and parses rejections in full."""
+
+import asyncio
+import json
+import sys
+import types
+from types import SimpleNamespace
+
+import pytest
+
+from src.core.config import settings
+from src.services.llm.service import LLMService
+
+
+def _chunk(text):
+    return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=text))])
+
+
+def _fake_litellm(payload, consumed):
+    """A stand-in ``litellm`` module whose acompletion streams *payload* in small chunks."""
+    text = json.dumps(payload)
+
+    async def _stream():
+        for i in range(0, len(text), 8):
+            consumed.append(i)
+            yield _chunk(text[i:i + 8])
+
+    async def acompletion(**kwargs):
+        assert kwargs["stream"] is True
+        return _stream()
+
+    return types.SimpleNamespace(acompletion=acompletion)
+
+
+@pytest.fixture(autouse=True)
+def _no_cache(monkeypatch):
+    monkeypatch.setattr(settings, "CRITIQUE_CACHE_TTL_SECONDS", 0)
+    monkeypatch.setattr(settings, "CRITIQUE_STREAM_EARLY_EXIT", True)
+
+
+def test_approval_returns_before_stream_ends(monkeypatch):
+    payload = {
+        "scores": {"accuracy": 10, "completeness": 10, "clarity": 10, "format": 10},
+        "issues": [],
+        "revised_answer": None,
+        "formatting_only": False,
+    }
+    consumed: list[int] = []
+    monkeypatch.setitem(sys.modules, "litellm", _fake_litellm(payload, consumed))
+
+    async def run():
+        result = await LLMService().acritique_response("q", [], "draft")
+        chunks_at_return = len(consumed)
+        await asyncio.sleep(0)  # let the background drain finish
+        return result, chunks_at_return
+
+    result, chunks_at_return = asyncio.run(run())
+
+    assert result.approved is True
+    assert result.weighted_total == 100
+    assert chunks_at_return < len(json.dumps(payload)) // 8
+
+
+def test_rejection_is_parsed_in_full(monkeypatch):
+    payload = {
+        "scores": {"accuracy": 2, "completeness": 5, "clarity": 5, "format": 5},
+        "issues": ["Revenue figure is wrong."],
+        "revised_answer": "The revenue is 400,000.00.",
+        "formatting_only": False,
+    }
+    monkeypatch.setitem(sys.modules, "litellm", _fake_litellm(payload, []))
+
+    result = asyncio.run(LLMService().acritique_response("q", [], "draft"))
+
+    assert result.approved is False
+    assert result.issues == ["Revenue figure is wrong."]
+    assert result.revised_answer == "The revenue is 400,000.00."
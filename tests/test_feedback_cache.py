@@ -0,0 +1,30 @@
+"""Verify the on-disk feedback score cache keys and round-trips results."""
+
+import pytest
+
+from src.core.config import settings
+from src.evaluation import _feedback_cache
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "EVAL_FEEDBACK_CACHE_DIR", tmp_path)
+    return tmp_path
+
+
+def test_key_depends_on_every_input():
+    base = _feedback_cache.make_key("gpt-4o-mini", "relevance", ("q", "a", 0, 3))
+    assert base == _feedback_cache.make_key("gpt-4o-mini", "relevance", ("q", "a", 0, 3))
+    assert base != _feedback_cache.make_key("gpt-4o", "relevance", ("q", "a", 0, 3))
+    assert base != _feedback_cache.make_key("gpt-4o-mini", "context_relevance", ("q", "a", 0, 3))
+    assert base != _feedback_cache.make_key("gpt-4o-mini", "relevance", ("q", "b", 0, 3))
+
+
+def test_store_then_fetch_round_trips(cache_dir):
+    _feedback_cache.store("abc", (0.75, {"reasons": "grounded"}))
+    assert _feedback_cache.fetch("abc") == (0.75, {"reasons": "grounded"})
+    assert not [p for p in cache_dir.iterdir() if p.name.startswith(".tmp-")]
+
+
+def test_fetch_misses_on_unknown_key(cache_dir):
+    assert _feedback_cache.fetch("missing") is None
@@ -0,0 +1,115 @@
+"""Verify concurrent input-guard checks share one LLM call and split back by id."""
+
+import asyncio
+import json
+import sys
+import threading
+import types
+from types import SimpleNamespace
+
+import pytest
+
+from src.core.config import settings
+from src.services.llm.service import LLMService
+
+
+def _response(payload):
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=json.dumps(payload)))])
+
+
+def _fake_litellm(calls, drop_ids=()):
+    """A stand-in ``litellm`` that blocks queries mentioning "recipe"."""
+
+    async def acompletion(**kwargs):
+        user = kwargs["messages"][-1]["content"]
+        calls.append(user)
+        try:
+            items = json.loads(user)
+        except ValueError:
+            return _response({"allowed": "recipe" not in user})
+        return _response({"results": [
+            {"id": item["id"], "allowed": "recipe" not in item["query"]}
+            for item in items if item["id"] not in drop_ids
+        ]})
+
+    return types.SimpleNamespace(acompletion=acompletion)
+
+
+@pytest.fixture(autouse=True)
+def _batching(monkeypatch):
+    monkeypatch.setattr(settings, "LLM_GUARD_BATCHING", True)
+    monkeypatch.setattr(settings, "LLM_GUARD_BATCH_SIZE", 3)
+    monkeypatch.setattr(settings, "LLM_GUARD_BATCH_WAIT_MS", 10)
+
+
+def _check_all(queries):
+    async def run():
+        llm = LLMService()
+        return await asyncio.gather(*(llm.acheck_input(q) for q in queries))
+    return asyncio.run(run())
+
+
+def test_concurrent_checks_share_one_call(monkeypatch):
+    calls: list[str] = []
+    monkeypatch.setitem(sys.modules, "litellm", _fake_litellm(calls))
+
+    results = _check_all(["NOI for Building 120?", "a cake recipe", "2024 expenses"])
+
+    assert [r.allowed for r in results] == [True, False, True]
+    assert len(calls) == 1
+
+
+def test_full_batch_flushes_and_remainder_waits(monkeypatch):
+    calls: list[str] = []
+    monkeypatch.setitem(sys.modules, "litellm", _fake_litellm(calls))
+
+    results = _check_all(["q1", "q2", "q3", "q4 recipe"])
+
+    assert [r.allowed for r in results] == [True, True, True, False]
+    assert len(calls) == 2
+    # A batch of one is sent as a plain single-query check
+    assert calls[1] == "q4 recipe"
+
+
+def test_entries_missing_from_batch_are_checked_alone(monkeypatch):
+    calls: list[str] = []
+    monkeypatch.setitem(sys.modules, "litellm", _fake_litellm(calls, drop_ids={1}))
+
+    results = _check_all(["q1", "a recipe", "q3"])
+
+    assert [r.allowed for r in results] == [True, False, True]
+    assert calls[1:] == ["a recipe"]
+
+
+def test_failed_batch_defaults_to_allow(monkeypatch):
+    async def acompletion(**kwargs):
+        raise RuntimeError("provider down")
+
+    monkeypatch.setitem(sys.modules, "litellm", types.SimpleNamespace(acompletion=acompletion))
+
+    results = _check_all(["q1", "q2"])
+
+    assert all(r.allowed for r in results)
+
+
+def test_batcher_shared_across_event_loops(monkeypatch):
+    """Threads each running their own loop never get another loop's batch."""
+    calls: list[str] = []
+    monkeypatch.setitem(sys.modules, "litellm", _fake_litellm(calls))
+    llm = LLMService()
+    results: dict[int, list[bool]] = {}
+
+    def worker(n):
+        async def run():
+            checks = await asyncio.gather(llm.acheck_input(f"q{n}"), llm.acheck_input(f"{n} recipe"))
+            results[n] = [r.allowed for r in checks]
+        asyncio.run(run())
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert results == {0: [True, False], 1: [True, False]}
+    assert all(len(json.loads(call)) == 2 for call in calls)
@@ -0,0 +1,74 @@
+"""Verify guard_plus_prefetch_node overlaps the guard with the first research call."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from langchain_core.messages import AIMessage
+
+from src.agents.context import GraphContext
+from src.agents.nodes.guard_prefetch import guard_plus_prefetch_node
+from src.services.llm.service import InputGuardResult
+
+
+def _make_state(allowed=True, model_response=None):
+    mock_model = MagicMock()
+    mock_model.ainvoke = AsyncMock(return_value=model_response or AIMessage(content="42."))
+
+    mock_llm = MagicMock()
+    mock_llm.acheck_input = AsyncMock(return_value=InputGuardResult(allowed=allowed, reason="off_topic"))
+    mock_llm.chat_model.bind_tools.return_value.with_retry.return_value = mock_model
+
+    state = {
+        "query": "What is the revenue for Building A?",
+        "critique": None,
+        "messages": [],
+        "steps": [],
+    }
+    return state, GraphContext(llm=mock_llm), mock_model
+
+
+def test_allowed_query_stashes_prefetched_response():
+    """When the guard allows the query, the first research response is kept in state."""
+    response = AIMessage(content="The revenue is 100,000.00.")
+    state, ctx, mock_model = _make_state(allowed=True, model_response=response)
+
+    result = asyncio.run(guard_plus_prefetch_node(state, ctx=ctx))
+
+    assert result["blocked"] is False
+    assert result["_prefetched_response"] is response
+    mock_model.ainvoke.assert_awaited_once()
+
+
+def test_blocked_query_discards_prefetch():
+    """When the guard blocks the query, no prefetched response is returned."""
+    state, ctx, _ = _make_state(allowed=False)
+
+    result = asyncio.run(guard_plus_prefetch_node(state, ctx=ctx))
+
+    assert result["blocked"] is True
+    assert result["_prefetched_response"] is None
+
+
+def test_empty_query_skips_prefetch():
+    """Empty queries fast-fail in the guard without touching the research model."""
+    state, ctx, mock_model = _make_state()
+    state["query"] = "   "
+
+    result = asyncio.run(guard_plus_prefetch_node(state, ctx=ctx))
+
+    assert result["blocked"] is True
+    mock_model.ainvoke.assert_not_called()
+
+
+def test_research_agent_consumes_prefetched_response():
+    """The research agent must reuse the prefetched response instead of calling the model."""
+    from src.agents.nodes.research_agent import research_agent_node
+
+    state, ctx, mock_model = _make_state()
+    state["_prefetched_response"] = AIMessage(content="Prefetched answer.")
+
+    result = asyncio.run(research_agent_node(state, ctx=ctx))
+
+    assert result["draft_answer"] == "Prefetched answer."
+    assert result["_prefetched_response"] is None
+    mock_model.ainvoke.assert_not_called()
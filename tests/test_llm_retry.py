@@ -0,0 +1,83 @@
+"""Verify provider calls retry transient errors with backoff and honour Retry-After."""
+
+import asyncio
+import sys
+import types
+from types import SimpleNamespace
+
+import pytest
+
+from src.services.llm import service
+from src.services.llm.exceptions import LLMInvocationError
+from src.services.llm.service import _alitellm_completion, _retry_delay
+
+
+class _ProviderError(Exception):
+    def __init__(self, status_code, headers=None):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+        self.response = SimpleNamespace(headers=headers or {})
+
+
+def _response(text):
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=text))])
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record backoff delays instead of sleeping."""
+    recorded: list[float] = []
+
+    async def fake_sleep(delay):
+        recorded.append(delay)
+
+    monkeypatch.setattr(service.asyncio, "sleep", fake_sleep)
+    return recorded
+
+
+def _flaky_litellm(failures):
+    calls = []
+
+    async def acompletion(**kwargs):
+        calls.append(kwargs)
+        if failures:
+            raise failures.pop(0)
+        return _response("ok")
+
+    return types.SimpleNamespace(acompletion=acompletion), calls
+
+
+def test_rate_limit_is_retried_with_retry_after(monkeypatch, sleeps):
+    fake, calls = _flaky_litellm([_ProviderError(429, {"retry-after": "2"}), _ProviderError(503)])
+    monkeypatch.setitem(sys.modules, "litellm", fake)
+
+    assert asyncio.run(_alitellm_completion([])) == "ok"
+    assert len(calls) == 3
+    assert calls[0]["num_retries"] == 0
+    assert sleeps[0] == 2.0
+    assert 0 <= sleeps[1] <= service._BACKOFF_BASE_SECONDS * 2
+
+
+def test_client_errors_are_not_retried(monkeypatch, sleeps):
+    fake, calls = _flaky_litellm([_ProviderError(400)])
+    monkeypatch.setitem(sys.modules, "litellm", fake)
+
+    with pytest.raises(LLMInvocationError):
+        asyncio.run(_alitellm_completion([]))
+    assert len(calls) == 1
+    assert sleeps == []
+
+
+def test_gives_up_after_max_attempts(monkeypatch, sleeps):
+    fake, calls = _flaky_litellm([_ProviderError(429) for _ in range(10)])
+    monkeypatch.setitem(sys.modules, "litellm", fake)
+
+    with pytest.raises(LLMInvocationError):
+        asyncio.run(_alitellm_completion([]))
+    assert len(calls) == service._MAX_ATTEMPTS
+
+
+def test_backoff_is_capped():
+    for _ in range(50):
+        assert 0 <= _retry_delay(_ProviderError(429), attempt=20) <= service._BACKOFF_CAP_SECONDS
+    assert _retry_delay(_ProviderError(429, {"retry-after": "3600"}), 0) == service._BACKOFF_CAP_SECONDS
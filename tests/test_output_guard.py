@@ -0,0 +1,53 @@
+"""Verify output_guard_node's no-entity fast path and its LLM fallback."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from src.agents.context import GraphContext
+from src.agents.nodes.output_guard import compile_property_pattern, output_guard_node
+from src.core.config import settings
+from src.services.llm.service import OutputGuardResult
+
+_PROPERTIES = ["Building A", "Building B"]
+
+
+def _make_state(draft):
+    mock_llm = MagicMock()
+    mock_llm.acheck_output = AsyncMock(
+        return_value=OutputGuardResult(valid=False, corrected_answer="Corrected.")
+    )
+    state = {
+        "query": "What is the revenue?",
+        "draft_answer": draft,
+    }
+    ctx = GraphContext(
+        llm=mock_llm,
+        known_properties=_PROPERTIES,
+        known_properties_re=compile_property_pattern(_PROPERTIES),
+    )
+    return state, ctx, mock_llm
+
+
+def test_draft_without_property_skips_llm():
+    state, ctx, mock_llm = _make_state("The portfolio revenue is 2,143,000.00.")
+    result = asyncio.run(output_guard_node(state, ctx=ctx))
+    assert result["final_answer"] == "The portfolio revenue is 2,143,000.00."
+    mock_llm.acheck_output.assert_not_called()
+
+
+def test_draft_mentioning_property_is_validated():
+    state, ctx, mock_llm = _make_state("building a earned 100.00.")
+    result = asyncio.run(output_guard_node(state, ctx=ctx))
+    assert result["final_answer"] == "Corrected."
+    mock_llm.acheck_output.assert_awaited_once()
+
+
+def test_fast_path_can_be_disabled(monkeypatch):
+    monkeypatch.setattr(settings, "OUTPUT_GUARD_FAST_PATH", False)
+    state, ctx, mock_llm = _make_state("The portfolio revenue is 2,143,000.00.")
+    asyncio.run(output_guard_node(state, ctx=ctx))
+    mock_llm.acheck_output.assert_awaited_once()
+
+
+def test_no_known_properties_disables_pattern():
+    assert compile_property_pattern([]) is None
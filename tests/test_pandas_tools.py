@@ -97,3 +97,51 @@ def test_query_portfolio_invalid_category_raises(sample_df):
             "dimensions": ["property_name"],
             "filters": [{"column": "ledger_category", "value": "fake_category"}],
         })
+
+
+def test_validation_uses_precomputed_sets(sample_df):
+    """Property and year checks use the sets built once in create_tools."""
+    from src.agents.tools.pandas_tools import ToolError
+    tools = {t.name: t for t in create_tools(sample_df)}
+
+    with pytest.raises(ToolError, match="Did you mean: Building A"):
+        tools["get_property_pl"].invoke({"property_name": "building a"})
+    with pytest.raises(ToolError, match=r"Available years: \[2024, 2025\]"):
+        tools["get_portfolio_summary"].invoke({"year": 2019})
+
+
+def test_query_portfolio_groups_only_observed_combinations(sample_df):
+    """Categorical dimensions must not expand into unobserved group combinations."""
+    tools = {t.name: t for t in create_tools(sample_df)}
+    result = tools["query_portfolio"].invoke({"dimensions": ["property_name", "tenant_name"]})
+    pairs = {(r["property_name"], r["tenant_name"]) for r in result["rows"]}
+    assert pairs == {("Building A", "Tenant 1"), ("Building B", "Tenant 2")}
+
+
+def test_unknown_property_hint_is_sorted(sample_df):
+    """The "did you mean" hint lists substring matches in name order."""
+    from src.agents.tools.pandas_tools import ToolError
+    tools = {t.name: t for t in create_tools(sample_df)}
+    with pytest.raises(ToolError, match="Did you mean: Building A, Building B"):
+        tools["get_property_pl"].invoke({"property_name": "building"})
+
+
+def test_growth_metrics_ranked_best_to_worst(sample_df):
+    """get_growth_metrics rows are sorted by descending growth."""
+    tools = {t.name: t for t in create_tools(sample_df)}
+    result = tools["get_growth_metrics"].invoke({"metric": "noi"})
+    growths = [r["growth"] for r in result["rows"]]
+    assert growths == sorted(growths, reverse=True)
+    assert result["best_performer"] == "Building A"
+    assert result["worst_performer"] == "Building B"
+
+
+def test_query_portfolio_invalid_year_raises(sample_df):
+    """query_portfolio raises ToolError for a year filter with no data."""
+    from src.agents.tools.pandas_tools import ToolError
+    tools = {t.name: t for t in create_tools(sample_df)}
+    with pytest.raises(ToolError, match="Available years"):
+        tools["query_portfolio"].invoke({
+            "dimensions": ["property_name"],
+            "filters": [{"column": "year", "value": 2019}],
+        })
@@ -78,3 +78,9 @@ def test_query_portfolio_empty_result_on_filter(am: AssetManagerAssistant):
     )
     
     assert len(result) == 0
+
+
+def test_query_portfolio_limit(am: AssetManagerAssistant):
+    """limit caps the number of aggregated rows returned."""
+    result = am.query_portfolio(dimensions=["property_name", "ledger_type"], limit=2)
+    assert len(result) == 2
@@ -0,0 +1,48 @@
+"""Verify PortfolioService computes its derived views once and can invalidate them."""
+
+import orjson
+import pytest
+
+from src.services.portfolio.exceptions import PropertyNotFoundError
+from src.services.portfolio.normalization import normalize_data
+from src.services.portfolio.service import PortfolioService
+
+
+def _service(sample_df):
+    service = PortfolioService("unused.parquet")
+    df = sample_df.copy()
+    df["month"] = df["year"].astype(str) + "-M01"
+    service._df = normalize_data(df)
+    return service
+
+
+def test_eda_stats_are_cached(sample_df):
+    service = _service(sample_df)
+    stats = service.get_eda_stats()
+    assert service.get_eda_stats() is stats
+    assert stats["portfolio_kpis"]["total_properties"] == 2
+
+
+def test_invalidate_recomputes(sample_df):
+    service = _service(sample_df)
+    props = service.property_list
+    service.invalidate()
+    assert service.property_list is not props
+    assert service.property_list == ["Building A", "Building B"]
+
+
+def test_monthly_by_property(sample_df):
+    service = _service(sample_df)
+    monthly = service.get_monthly("Building A")
+    assert service.get_monthly("Building A") is monthly
+    assert monthly["noi"].tolist() == [60.0, 70.0]
+    assert service.get_monthly("Building B")["noi"].tolist() == [110.0]
+    with pytest.raises(PropertyNotFoundError):
+        service.get_monthly("Building Z")
+
+
+def test_eda_stats_json_is_cached(sample_df):
+    service = _service(sample_df)
+    payload = service.get_eda_stats_json()
+    assert service.get_eda_stats_json() is payload
+    assert orjson.loads(payload) == service.get_eda_stats()
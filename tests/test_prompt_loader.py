@@ -0,0 +1,38 @@
+"""Verify load_prompt memoises rendered prompts and keeps its error contract."""
+
+import pytest
+
+from src.agents.prompts import loader
+from src.agents.prompts.loader import load_prompt
+
+
+def test_repeat_loads_hit_the_cache():
+    load_prompt.cache_clear()
+    first = load_prompt("input_guard")
+    second = load_prompt("input_guard")
+    assert first is second
+    assert loader._cached_load.cache_info().hits == 1
+
+
+def test_cache_clear_forces_reload():
+    load_prompt("input_guard")
+    load_prompt.cache_clear()
+    assert loader._cached_load.cache_info().currsize == 0
+    assert loader._read_prompt.cache_info().currsize == 0
+
+
+def test_missing_prompt_raises():
+    with pytest.raises(FileNotFoundError):
+        load_prompt("does_not_exist")
+
+
+def test_file_is_read_once_across_kwargs(tmp_path, monkeypatch):
+    (tmp_path / "greeting.md").write_text("Hello {who}", encoding="utf-8")
+    monkeypatch.setattr(loader, "_PROMPTS_DIR", tmp_path)
+    load_prompt.cache_clear()
+
+    assert load_prompt("greeting", who="A") == "Hello A"
+    assert load_prompt("greeting", who="B") == "Hello B"
+    info = loader._read_prompt.cache_info()
+    assert (info.misses, info.hits) == (1, 1)
+    load_prompt.cache_clear()
@@ -0,0 +1,74 @@
+"""Verify TokenBucket only blocks when the rolling window is saturated, and LLM calls use it."""
+
+import asyncio
+import sys
+import threading
+import time
+import types
+from types import SimpleNamespace
+
+from src.core.config import settings
+from src.evaluation.rate_limit import estimate_tokens
+from src.services.llm import service
+from src.services.llm.rate_limit import TokenBucket
+
+
+def _timed_acquires(bucket, costs):
+    async def run():
+        start = time.monotonic()
+        for cost in costs:
+            await bucket.acquire(cost)
+        return time.monotonic() - start
+    return asyncio.run(run())
+
+
+def test_requests_within_budget_do_not_wait():
+    assert _timed_acquires(TokenBucket(rpm=5, tpm=1_000, window=0.3), [100] * 5) < 0.1
+
+
+def test_rpm_limit_waits_for_window():
+    assert _timed_acquires(TokenBucket(rpm=2, tpm=1_000, window=0.3), [1, 1, 1]) >= 0.3
+
+
+def test_tpm_limit_waits_for_window():
+    assert _timed_acquires(TokenBucket(rpm=10, tpm=100, window=0.3), [60, 60]) >= 0.3
+
+
+def test_oversize_request_is_admitted():
+    assert _timed_acquires(TokenBucket(rpm=10, tpm=100, window=0.3), [500]) < 0.1
+
+
+def test_bucket_is_shared_across_event_loops():
+    """Threads each running their own loop (as the evaluation workers do) share one budget."""
+    bucket = TokenBucket(rpm=1, tpm=1_000, window=0.2)
+    start = time.monotonic()
+    threads = [threading.Thread(target=_timed_acquires, args=(bucket, [1, 1])) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert not any(thread.is_alive() for thread in threads)
+    # Four admissions at one per window: the last waits three windows
+    assert time.monotonic() - start >= 0.6
+
+
+def test_estimate_tokens_adds_budget():
+    assert estimate_tokens("x" * 40, per_query_budget=2_000) == 2_010
+
+
+def test_llm_calls_wait_on_the_model_bucket(monkeypatch):
+    async def acompletion(**kwargs):
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content="ok"))])
+
+    monkeypatch.setitem(sys.modules, "litellm", types.SimpleNamespace(acompletion=acompletion))
+    monkeypatch.setattr(settings, "LLM_RPM", 1)
+    monkeypatch.setattr(service, "_buckets", {settings.LLM_MODEL: TokenBucket(rpm=1, tpm=1_000, window=0.3)})
+
+    async def run():
+        start = time.monotonic()
+        await service._alitellm_completion([{"role": "user", "content": "hi"}])
+        await service._alitellm_completion([{"role": "user", "content": "hi"}])
+        return time.monotonic() - start
+
+    assert asyncio.run(run()) >= 0.3